@@ -0,0 +1,73 @@
+"""
+BAML client access for the rest of the project.
+
+Views and services should call ``get_sync_client()`` / ``get_async_client()``
+instead of importing ``baml_client`` directly, so the Gemini endpoint can be
+redirected (e.g. to the local load-test stubs) through ``GEMINI_BASE_URL``.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+
+from baml_py import ClientRegistry
+from django.conf import settings
+
+from apps.core.metrics import LLM_DURATION
+from apps.core.timing import record
+from baml_client.async_client import b as async_baml
+from baml_client.sync_client import b as sync_baml
+
+# Must match the client name and model declared in baml_src/main.baml
+GEMINI_CLIENT = "Gemini"
+GEMINI_MODEL = "gemini-2.5-pro"
+
+
+@lru_cache(maxsize=4)
+def _client_registry(base_url: str, api_key: str) -> ClientRegistry:
+    registry = ClientRegistry()
+    registry.add_llm_client(
+        GEMINI_CLIENT,
+        "google-ai",
+        {"model": GEMINI_MODEL, "api_key": api_key, "base_url": base_url},
+    )
+    registry.set_primary(GEMINI_CLIENT)
+    return registry
+
+
+def _registry_override() -> ClientRegistry | None:
+    base_url = settings.GEMINI_BASE_URL
+    if not base_url:
+        return None
+    return _client_registry(base_url, settings.GOOGLE_API_KEY or "stub-key")
+
+
+def get_sync_client():
+    """Synchronous BAML client honoring ``GEMINI_BASE_URL``."""
+    registry = _registry_override()
+    if registry is None:
+        return sync_baml
+    return sync_baml.with_options(client_registry=registry)
+
+
+def get_async_client():
+    """Asynchronous BAML client honoring ``GEMINI_BASE_URL``."""
+    registry = _registry_override()
+    if registry is None:
+        return async_baml
+    return async_baml.with_options(client_registry=registry)
+
+
+@contextmanager
+def llm_timer(function: str) -> Iterator[None]:
+    """Time a BAML function call for Server-Timing and LLM latency metrics."""
+    begin = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        elapsed = time.perf_counter() - begin
+        record("llm", elapsed)
+        LLM_DURATION.observe(elapsed, function=function, outcome=outcome)
@@ -1 +1,26 @@
-# Create your tests here.
+"""Tests for the BAML client wrapper."""
+
+from apps.ai import client
+
+
+class TestBamlClient:
+    """Tests for GEMINI_BASE_URL handling."""
+
+    def test_default_client_without_override(self, settings):
+        """No base URL override returns the generated client unchanged."""
+        settings.GEMINI_BASE_URL = ""
+        assert client.get_sync_client() is client.sync_baml
+        assert client.get_async_client() is client.async_baml
+
+    def test_override_uses_client_registry(self, settings):
+        """A base URL override wraps the client with a registry."""
+        settings.GEMINI_BASE_URL = "http://127.0.0.1:8765/gemini/v1beta"
+        assert client.get_sync_client() is not client.sync_baml
+        assert client.get_async_client() is not client.async_baml
+
+    def test_registry_is_reused(self, settings):
+        """The client registry is built once per base URL."""
+        settings.GEMINI_BASE_URL = "http://127.0.0.1:8765/gemini/v1beta"
+        settings.GOOGLE_API_KEY = "test-key"
+        first = client._registry_override()
+        assert client._registry_override() is first
@@ -1,11 +1,165 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import F
+from django.utils.html import format_html
 
-from .models import Character
+from apps.core.pagination import EstimatedCountPaginator, estimate_count
+
+from . import analytics
+from .jobs import create_job, start_job
+from .models import CatalogJob, Character, SearchHourlyStats, SearchQueryStats
+from .services import distinct_categories, filter_catalog, normalize_query
+
+
+class CategoryFilter(admin.SimpleListFilter):
+    title = "category"
+    parameter_name = "category"
+
+    def lookups(self, request, model_admin):
+        return [(category, category) for category in distinct_categories()]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(category=self.value())
+        return queryset
+
+
+class CharacterChangeList(ChangeList):
+    # Searches estimated to match fewer rows than this are sorted in full
+    sort_matches_below = 5000
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        # A blank search leaves the queryset unfiltered
+        if not normalize_query(self.query) or queryset.query.order_by != ("-pk",):
+            return queryset
+        # With the default newest-first order, Postgres walks the primary key
+        # backwards until a page of matches turns up: quick for broad
+        # searches, a full table scan for narrow ones. Ordering by an
+        # expression the index can't serve makes it fetch the matches through
+        # the search indexes and sort them instead.
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate < self.sort_matches_below:
+            queryset = queryset.order_by((F("pk") + 0).desc())
+        return queryset
 
 
 @admin.register(Character)
 class CharacterAdmin(admin.ModelAdmin):
-    list_display = ["name", "movie", "category", "thumbnail_url", "created_at"]
-    list_filter = ["category", "created_at"]
-    search_fields = ["name", "movie", "search_queries"]
+    list_display = ["thumbnail", "name", "movie", "category", "created_at"]
+    list_display_links = ["thumbnail", "name"]
+    list_filter = [CategoryFilter, "created_at"]
+    # Enables the search box; get_search_results does the actual filtering
+    search_fields = ["name"]
+    search_help_text = "Name prefix, exact search alias, or words in any field"
     readonly_fields = ["created_at", "updated_at"]
+    exclude = ["search_vector"]
+    actions = ["refresh_thumbnails", "regenerate_palettes"]
+    paginator = EstimatedCountPaginator
+    # Skip the unfiltered COUNT(*) shown next to search results
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return CharacterChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        return filter_catalog(queryset, search_term), False
+
+    @admin.display(description="Thumbnail")
+    def thumbnail(self, obj):
+        if not obj.thumbnail_url:
+            return "-"
+        return format_html(
+            '<img src="{}" alt="" loading="lazy" width="40" height="40" '
+            'style="object-fit: cover; border-radius: 4px">',
+            obj.thumbnail_url,
+        )
+
+    @admin.action(description="Refresh thumbnails from TMDB (background)")
+    def refresh_thumbnails(self, request, queryset):
+        self._enqueue(request, queryset, CatalogJob.Kind.THUMBNAILS)
+
+    @admin.action(description="Regenerate palettes with Gemini (background)")
+    def regenerate_palettes(self, request, queryset):
+        self._enqueue(request, queryset, CatalogJob.Kind.PALETTES)
+
+    def _enqueue(self, request, queryset, kind):
+        # Only ids are read here; the job loads characters in chunks
+        job = create_job(kind, queryset.order_by().values_list("pk", flat=True))
+        start_job(job)
+        self.message_user(
+            request,
+            f"{job.get_kind_display()} queued for {job.total:,} characters "
+            f"(job #{job.pk}).",
+        )
+
+
+@admin.register(CatalogJob)
+class CatalogJobAdmin(admin.ModelAdmin):
+    list_display = [
+        "kind",
+        "status",
+        "completed",
+        "failed",
+        "total",
+        "created_at",
+        "finished_at",
+    ]
+    list_filter = ["kind", "status"]
+    exclude = ["character_ids"]
+    readonly_fields = [
+        "kind",
+        "status",
+        "total",
+        "completed",
+        "failed",
+        "created_at",
+        "finished_at",
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+
+class ReadOnlyAdmin(admin.ModelAdmin):
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(SearchHourlyStats)
+class SearchHourlyStatsAdmin(ReadOnlyAdmin):
+    """Search dashboard: hit rates, LLM latency and the top missed queries."""
+
+    change_list_template = "admin/characters/searchhourlystats/change_list.html"
+    list_display = ["hour", "hit_type", "searches", "latency_avg", "latency_max_ms"]
+    list_filter = ["hit_type"]
+    date_hierarchy = "hour"
+
+    @admin.display(description="Avg latency (ms)")
+    def latency_avg(self, obj):
+        return f"{obj.latency_avg_ms:.0f}"
+
+    def changelist_view(self, request, extra_context=None):
+        # Include this process's buffer and unrolled events
+        analytics.flush()
+        analytics.rollup_searches()
+        extra_context = {
+            **(extra_context or {}),
+            "summaries": [
+                ("Last 24 hours", analytics.summarize(hours=24)),
+                ("Last 7 days", analytics.summarize(hours=24 * 7)),
+            ],
+            "top_missed": analytics.top_missed_queries(days=7, limit=20),
+        }
+        return super().changelist_view(request, extra_context)
+
+
+@admin.register(SearchQueryStats)
+class SearchQueryStatsAdmin(ReadOnlyAdmin):
+    list_display = ["day", "query", "searches", "misses", "not_found"]
+    search_fields = ["query"]
+    date_hierarchy = "day"
+    ordering = ["-day", "-misses"]
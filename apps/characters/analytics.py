@@ -0,0 +1,272 @@
+"""
+Search analytics: which queries hit the catalog, which call the LLM, and
+how long each takes.
+
+``record_search`` only appends to an in-process buffer, so capture costs a
+list append on the request thread. The buffer is written with one multi-row
+INSERT on a background thread once it holds ``SEARCH_ANALYTICS_BATCH_SIZE``
+events, or by a timer ``SEARCH_ANALYTICS_FLUSH_INTERVAL`` seconds after its
+oldest event arrived, whichever comes first; whatever is left is written
+when the process exits.
+
+``rollup_searches`` folds raw SearchEvent rows into SearchHourlyStats (per
+hour and hit type) and SearchQueryStats (per day and query) and deletes
+them, in the same statement, so every event is counted exactly once even
+with several processes rolling up at the same time. Each process starts a
+rollup in the background every ``SEARCH_ANALYTICS_ROLLUP_INTERVAL`` seconds.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Max, Sum
+from django.utils import timezone
+
+from apps.core.background import run_in_background
+from apps.core.metrics import REGISTRY
+
+from .models import SearchEvent, SearchHourlyStats, SearchQueryStats
+
+logger = logging.getLogger(__name__)
+
+# Raw events folded per rollup statement
+ROLLUP_BATCH_SIZE = 10_000
+
+SEARCH_EVENTS_DROPPED = REGISTRY.counter(
+    "search_events_dropped_total",
+    "Search analytics events lost because a flush failed.",
+)
+
+_events: list[tuple] = []
+_lock = threading.Lock()
+# Flushes the buffer once its oldest event is due; None while it's empty
+_timer: threading.Timer | None = None
+# Set while a flush of a full buffer is starting
+_flush_pending = False
+_rolled_up_at = time.monotonic()
+
+
+def record_search(
+    query: str, hit_type: str, latency: float, character_id: int | None = None
+) -> None:
+    """
+    Buffer one search.
+
+    Args:
+        query: The normalized query
+        hit_type: A SearchEvent.HitType
+        latency: Seconds spent answering the search
+        character_id: The character returned, if any
+    """
+    global _timer, _flush_pending
+    event = (timezone.now(), query[:255], hit_type, latency * 1000, character_id)
+    with _lock:
+        _events.append(event)
+        full = len(_events) >= settings.SEARCH_ANALYTICS_BATCH_SIZE
+        start_flush = full and not _flush_pending
+        if start_flush:
+            _flush_pending = True
+        elif _timer is None:
+            _timer = threading.Timer(
+                settings.SEARCH_ANALYTICS_FLUSH_INTERVAL, _flush_due
+            )
+            _timer.daemon = True
+            _timer.start()
+    if start_flush:
+        run_in_background("search-flush", _flush_and_roll_up)
+
+
+def _flush_due() -> None:
+    global _timer
+    with _lock:
+        # Events recorded from here on start a new timer
+        _timer = None
+    run_in_background("search-flush", _flush_and_roll_up)
+
+
+def _flush_and_roll_up() -> None:
+    flush()
+    _maybe_start_rollup(time.monotonic())
+
+
+def flush() -> int:
+    """Write buffered events. Returns the number written."""
+    global _flush_pending
+    with _lock:
+        _flush_pending = False
+        if not _events:
+            return 0
+        batch = _events.copy()
+        _events.clear()
+    try:
+        SearchEvent.objects.bulk_create(
+            [
+                SearchEvent(
+                    created_at=created_at,
+                    query=query,
+                    hit_type=hit_type,
+                    latency_ms=latency_ms,
+                    character_id=character_id,
+                )
+                for created_at, query, hit_type, latency_ms, character_id in batch
+            ]
+        )
+    except DatabaseError as e:
+        # Analytics must never break search
+        logger.error(f"Dropped {len(batch)} search events: {e}")
+        SEARCH_EVENTS_DROPPED.inc(len(batch))
+        return 0
+    return len(batch)
+
+
+def discard() -> None:
+    """Forget buffered events and any pending flush (tests)."""
+    global _timer, _flush_pending
+    with _lock:
+        _events.clear()
+        if _timer is not None:
+            _timer.cancel()
+        _timer = None
+        _flush_pending = False
+
+
+def _maybe_start_rollup(now: float) -> None:
+    global _rolled_up_at
+    interval = settings.SEARCH_ANALYTICS_ROLLUP_INTERVAL
+    with _lock:
+        if not interval or now - _rolled_up_at < interval:
+            return
+        _rolled_up_at = now
+    run_in_background("search-rollup", rollup_searches)
+
+
+def _flush_at_exit() -> None:
+    try:
+        flush()
+    except Exception:
+        pass
+
+
+atexit.register(_flush_at_exit)
+
+
+def rollup_searches() -> int:
+    """Fold raw events into the stats tables. Returns the number folded."""
+    events = connection.ops.quote_name(SearchEvent._meta.db_table)
+    hourly = connection.ops.quote_name(SearchHourlyStats._meta.db_table)
+    queries = connection.ops.quote_name(SearchQueryStats._meta.db_table)
+    misses = [str(hit_type) for hit_type in SearchEvent.MISSES]
+    total = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            # SKIP LOCKED lets concurrent rollups take disjoint batches;
+            # the stats are built from exactly the rows deleted
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {events} WHERE id IN (
+                        SELECT id FROM {events}
+                        ORDER BY id LIMIT %(batch)s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING created_at, query, hit_type, latency_ms
+                ),
+                hourly AS (
+                    INSERT INTO {hourly} AS s
+                        (hour, hit_type, searches, latency_total_ms, latency_max_ms)
+                    SELECT date_trunc('hour', created_at), hit_type, count(*),
+                        sum(latency_ms), max(latency_ms)
+                    FROM moved
+                    GROUP BY 1, 2
+                    ON CONFLICT (hour, hit_type) DO UPDATE SET
+                        searches = s.searches + excluded.searches,
+                        latency_total_ms = s.latency_total_ms + excluded.latency_total_ms,
+                        latency_max_ms = greatest(s.latency_max_ms, excluded.latency_max_ms)
+                ),
+                queries AS (
+                    INSERT INTO {queries} AS s (day, query, searches, misses, not_found)
+                    SELECT created_at::date, query, count(*),
+                        count(*) FILTER (WHERE hit_type = ANY(%(misses)s)),
+                        count(*) FILTER (WHERE hit_type = %(negative)s)
+                    FROM moved
+                    GROUP BY 1, 2
+                    ON CONFLICT (day, query) DO UPDATE SET
+                        searches = s.searches + excluded.searches,
+                        misses = s.misses + excluded.misses,
+                        not_found = s.not_found + excluded.not_found
+                )
+                SELECT count(*) FROM moved
+                """,
+                {
+                    "batch": ROLLUP_BATCH_SIZE,
+                    "misses": misses,
+                    "negative": str(SearchEvent.HitType.NEGATIVE),
+                },
+            )
+            folded = cursor.fetchone()[0]
+        total += folded
+        if folded < ROLLUP_BATCH_SIZE:
+            return total
+
+
+@dataclass
+class HitTypeSummary:
+    hit_type: str
+    label: str
+    searches: int
+    share: float
+    latency_avg_ms: float
+    latency_max_ms: float
+
+
+def summarize(hours: int = 24) -> list[HitTypeSummary]:
+    """Searches, share and latency per hit type over the last ``hours``."""
+    since = timezone.now() - timedelta(hours=hours)
+    rows = (
+        SearchHourlyStats.objects.filter(hour__gte=since)
+        .values("hit_type")
+        .annotate(
+            searches=Sum("searches"),
+            latency_total_ms=Sum("latency_total_ms"),
+            latency_max_ms=Max("latency_max_ms"),
+        )
+    )
+    by_type = {row["hit_type"]: row for row in rows}
+    total = sum(row["searches"] for row in by_type.values())
+    summary = []
+    for hit_type in SearchEvent.HitType:
+        row = by_type.get(hit_type.value)
+        searches = row["searches"] if row else 0
+        summary.append(
+            HitTypeSummary(
+                hit_type=hit_type.value,
+                label=hit_type.label,
+                searches=searches,
+                share=searches / total if total else 0.0,
+                latency_avg_ms=row["latency_total_ms"] / searches if row else 0.0,
+                latency_max_ms=row["latency_max_ms"] if row else 0.0,
+            )
+        )
+    return summary
+
+
+def top_missed_queries(days: int = 7, limit: int = 50) -> list[dict]:
+    """
+    Queries that called the LLM most often over the last ``days``: the
+    candidates for pre-warming the catalog or adding search aliases.
+
+    Returns dicts with query, misses and not_found, most misses first.
+    """
+    since = (timezone.now() - timedelta(days=days - 1)).date()
+    return list(
+        SearchQueryStats.objects.filter(day__gte=since, misses__gt=0)
+        .values("query")
+        .annotate(misses=Sum("misses"), not_found=Sum("not_found"))
+        .order_by("-misses", "query")[:limit]
+    )
@@ -0,0 +1,200 @@
+"""
+Read-only JSON API over the character catalog.
+
+Characters are returned oldest change first, ordered by ``(updated_at, id)``,
+and pages are addressed by an opaque keyset cursor rather than an offset, so
+every page costs one index range scan however deep it is. Edited characters
+move to the end of that order, which makes the same cursor an incremental
+sync position: a client that saves the last ``next`` it saw only receives
+what changed since.
+
+The NDJSON stream returns the whole (filtered) catalog in one response,
+reading it in chunks so memory use stays flat. Each line is ``serialize()``
+encoded like ``JsonResponse`` does, so a character is the same JSON on both
+endpoints.
+"""
+
+import base64
+import hashlib
+from collections.abc import Iterator
+from datetime import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Count, Max, QuerySet
+from django.utils.dateparse import parse_datetime
+from django.utils.http import quote_etag
+
+from .models import Character
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+STREAM_CHUNK_SIZE = 2000
+
+# Everything to_result_dict needs, plus the keyset columns. Skips the large
+# search_vector and search_queries columns.
+FIELDS = [
+    "id",
+    "name",
+    "movie",
+    "category",
+    "description",
+    "colors",
+    "thumbnail_url",
+    "image_attribution",
+    "updated_at",
+]
+
+
+class ApiError(Exception):
+    """Raised for invalid query parameters (rendered as a 400)."""
+
+
+def serialize(character: Character) -> dict:
+    return {
+        "id": character.pk,
+        **character.to_result_dict(),
+        "updated_at": character.updated_at,
+    }
+
+
+def catalog_queryset(params) -> QuerySet:
+    """
+    Characters matching the request's filters, in keyset order.
+
+    Filters:
+        category: Exact category name
+        updated_since: ISO 8601 timestamp; only characters changed at or
+            after it
+
+    Raises:
+        ApiError: If ``updated_since`` isn't a timestamp with a time zone
+    """
+    queryset = Character.objects.only(*FIELDS).order_by("updated_at", "id")
+    if category := params.get("category"):
+        queryset = queryset.filter(category=category)
+    if updated_since := params.get("updated_since"):
+        timestamp = _parse_timestamp(updated_since)
+        if timestamp is None:
+            raise ApiError("updated_since must be an ISO 8601 timestamp with offset")
+        queryset = queryset.filter(updated_at__gte=timestamp)
+    return queryset
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    try:
+        timestamp = parse_datetime(value)
+    except ValueError:
+        return None
+    if timestamp is None or timestamp.tzinfo is None:
+        return None
+    return timestamp
+
+
+def encode_cursor(character: Character) -> str:
+    position = f"{character.updated_at.isoformat()}|{character.pk}"
+    return base64.urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Raises:
+        ApiError: If the cursor wasn't produced by encode_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, pk = base64.urlsafe_b64decode(padded).decode().split("|")
+        timestamp = _parse_timestamp(updated_at)
+        if timestamp is None:
+            raise ValueError(updated_at)
+        return timestamp, int(pk)
+    except ValueError as e:
+        raise ApiError("Invalid cursor") from e
+
+
+def parse_limit(value: str | None) -> int:
+    if not value:
+        return DEFAULT_LIMIT
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ApiError("limit must be an integer") from None
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ApiError(f"limit must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+def after(queryset, cursor: str):
+    """Rows after ``cursor`` in (updated_at, id) order."""
+    updated_at, pk = decode_cursor(cursor)
+    # The >= bound is an index range condition; the exclude drops the rows
+    # sharing the cursor's timestamp that were already returned
+    return queryset.filter(updated_at__gte=updated_at).exclude(
+        updated_at=updated_at, id__lte=pk
+    )
+
+
+def catalog_page(
+    queryset, cursor: str | None, limit: int
+) -> tuple[list[Character], str | None]:
+    """One page of ``queryset`` and the cursor for the next (None at the end)."""
+    if cursor:
+        queryset = after(queryset, cursor)
+    rows = list(queryset[: limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1])
+
+
+def page_etag(rows: list[Character], next_cursor: str | None) -> str:
+    """Changes whenever any character on the page is edited or replaced."""
+    digest = hashlib.sha256()
+    for character in rows:
+        digest.update(f"{character.pk}:{character.updated_at.isoformat()};".encode())
+    digest.update((next_cursor or "").encode())
+    return quote_etag(digest.hexdigest()[:32])
+
+
+def stream_validators(queryset) -> tuple[str, datetime | None]:
+    """
+    ETag and Last-Modified for a whole stream, from one aggregate query.
+
+    Edits move ``max(updated_at)``; deletions change the count.
+    """
+    summary = queryset.order_by().aggregate(count=Count("id"), last=Max("updated_at"))
+    last = summary["last"]
+    tag = f"{queryset.query}|{summary['count']}|{last.isoformat() if last else ''}"
+    return quote_etag(hashlib.sha256(tag.encode()).hexdigest()[:32]), last
+
+
+def _chunks(queryset) -> Iterator[list[Character]]:
+    """``queryset``'s characters, in chunks."""
+    connection = connections[queryset.db]
+    if not connection.settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+        # Server-side cursor: Postgres hands over STREAM_CHUNK_SIZE rows at a time
+        chunk = []
+        for character in queryset.iterator(chunk_size=STREAM_CHUNK_SIZE):
+            chunk.append(character)
+            if len(chunk) == STREAM_CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+
+    # Behind PgBouncer (no server-side cursors) a plain iterator would fetch
+    # every row at once; page through with the keyset cursor instead
+    page = queryset
+    while chunk := list(page[:STREAM_CHUNK_SIZE]):
+        yield chunk
+        if len(chunk) < STREAM_CHUNK_SIZE:
+            return
+        page = after(queryset, encode_cursor(chunk[-1]))
+
+
+def iter_ndjson(queryset) -> Iterator[str]:
+    """Yield ``queryset`` as newline-delimited JSON, one chunk at a time."""
+    encode = DjangoJSONEncoder().encode
+    for chunk in _chunks(queryset):
+        yield "".join(f"{encode(serialize(character))}\n" for character in chunk)
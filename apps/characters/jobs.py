@@ -0,0 +1,100 @@
+"""
+Background bulk operations over the character catalog.
+
+Admin actions record a ``CatalogJob`` holding the selected character ids and
+return immediately; the job then runs on a background thread. Characters are
+loaded in chunks, processed concurrently up to ``CATALOG_JOB_CONCURRENCY``,
+and progress is saved after every chunk so the job list shows how far along
+it is.
+"""
+
+import asyncio
+import logging
+
+import httpx
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from apps.ai.client import get_async_client, llm_timer
+from apps.core.background import run_in_background
+
+from .models import CatalogJob, Character
+from .services import afetch_character_thumbnail, colors_from_result
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 200
+
+
+def create_job(kind: str, character_ids) -> CatalogJob:
+    ids = list(character_ids)
+    return CatalogJob.objects.create(kind=kind, character_ids=ids, total=len(ids))
+
+
+def start_job(job: CatalogJob) -> None:
+    """Run a job without blocking the response."""
+    run_in_background(f"catalog-{job.kind}", run_job, job.pk)
+
+
+async def _regenerate_palette(character: Character) -> bool:
+    """Ask SearchCharacter for the character again and keep its colors."""
+    with llm_timer("SearchCharacter"):
+        result = await get_async_client().SearchCharacter(
+            query=f"{character.name} from {character.movie}"
+        )
+    if not result.found or not result.colors:
+        return False
+    character.colors = colors_from_result(result)
+    await character.asave(update_fields=["colors", "updated_at"])
+    return True
+
+
+async def _process(job: CatalogJob, character: Character, semaphore, http) -> bool:
+    """Returns whether the character was updated; failures don't stop the job."""
+    async with semaphore:
+        try:
+            if job.kind == CatalogJob.Kind.THUMBNAILS:
+                return await afetch_character_thumbnail(character, http, force=True)
+            return await _regenerate_palette(character)
+        except Exception as e:
+            logger.error(f"Catalog job {job.pk} failed for {character.name}: {e}")
+            return False
+
+
+async def arun_job(job_id: int) -> None:
+    job = await CatalogJob.objects.aget(pk=job_id)
+    await CatalogJob.objects.filter(pk=job_id).aupdate(status=CatalogJob.Status.RUNNING)
+
+    semaphore = asyncio.Semaphore(settings.CATALOG_JOB_CONCURRENCY)
+    async with httpx.AsyncClient(timeout=10.0) as http:
+        for start in range(0, len(job.character_ids), CHUNK_SIZE):
+            chunk = job.character_ids[start : start + CHUNK_SIZE]
+            characters = [
+                character async for character in Character.objects.filter(pk__in=chunk)
+            ]
+            results = await asyncio.gather(
+                *(_process(job, character, semaphore, http) for character in characters)
+            )
+            completed = sum(results)
+            # Characters deleted since the job was queued count as failed
+            await CatalogJob.objects.filter(pk=job_id).aupdate(
+                completed=F("completed") + completed,
+                failed=F("failed") + len(chunk) - completed,
+            )
+
+    await CatalogJob.objects.filter(pk=job_id).aupdate(
+        status=CatalogJob.Status.DONE, finished_at=timezone.now()
+    )
+
+
+def run_job(job_id: int) -> None:
+    """Synchronous entry point for background threads."""
+    try:
+        async_to_sync(arun_job)(job_id)
+    except Exception:
+        CatalogJob.objects.filter(pk=job_id).update(
+            status=CatalogJob.Status.FAILED, finished_at=timezone.now()
+        )
+        raise
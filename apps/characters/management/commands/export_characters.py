@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.characters.snapshot import SnapshotError, export_characters
+
+
+class Command(BaseCommand):
+    help = "Stream the character catalog to a .jsonl[.gz] or binary .copy[.gz] snapshot"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Output file; the extension picks the format")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            count = export_characters(options["path"])
+        except SnapshotError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(
+            f"Exported {count} characters to {options['path']} "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.characters.snapshot import SnapshotError, import_characters
+
+
+class Command(BaseCommand):
+    help = "Upsert characters from a snapshot written by export_characters"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Snapshot file (.jsonl[.gz] or .copy[.gz])")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            stats = import_characters(options["path"])
+        except SnapshotError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(
+            f"Imported {stats.rows} characters from {options['path']} "
+            f"in {time.perf_counter() - started:.1f}s: "
+            f"{stats.created} created, {stats.updated} updated, "
+            f"{stats.unchanged} unchanged"
+        )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.characters.analytics import rollup_searches, top_missed_queries
+
+
+class Command(BaseCommand):
+    help = "Fold raw search events into the stats tables; optionally list top missed queries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top-missed",
+            type=int,
+            default=0,
+            metavar="N",
+            help="Then print the N queries that called the LLM most (query<TAB>misses)",
+        )
+        parser.add_argument(
+            "--days", type=int, default=7, help="Window for --top-missed (default 7)"
+        )
+
+    def handle(self, *args, **options):
+        folded = rollup_searches()
+        self.stderr.write(f"Rolled up {folded} search events")
+        if options["top_missed"]:
+            for row in top_missed_queries(options["days"], options["top_missed"]):
+                self.stdout.write(f"{row['query']}\t{row['misses']}")
@@ -0,0 +1,104 @@
+# Generated by Django 6.0.1 on 2026-10-19 02:26
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("characters", "0002_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("thumbnails", "Refresh thumbnails"),
+                            ("palettes", "Regenerate palettes"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "character_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(), default=list
+                    ),
+                ),
+                ("total", models.PositiveIntegerField(default=0)),
+                ("completed", models.PositiveIntegerField(default=0)),
+                ("failed", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name="character",
+            name="character_name_lower_idx",
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=models.Index(fields=["category"], name="character_category_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Lower("name"),
+                    name="text_pattern_ops",
+                ),
+                name="character_name_lower_idx",
+            ),
+        ),
+        # Substring name search for the admin, where pg_trgm is available
+        # (Neon, most managed Postgres). Optional, so local databases without
+        # the extension still migrate; see services.trigram_available.
+        migrations.RunSQL(
+            sql="""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'
+                ) THEN
+                    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                    CREATE INDEX IF NOT EXISTS character_name_trgm_idx
+                        ON characters_character
+                        USING gin (upper(name::text) gin_trgm_ops);
+                END IF;
+            END
+            $$;
+            """,
+            reverse_sql="DROP INDEX IF EXISTS character_name_trgm_idx;",
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-19 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("characters", "0003_catalog_admin"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="character",
+            name="character_category_idx",
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=models.Index(
+                fields=["category", "updated_at", "id"], name="character_category_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="character",
+            index=models.Index(
+                fields=["updated_at", "id"], name="character_updated_idx"
+            ),
+        ),
+    ]
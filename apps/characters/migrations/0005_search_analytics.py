@@ -0,0 +1,130 @@
+# Generated by Django 6.0.1 on 2026-10-19 02:39
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("characters", "0004_api_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("query", models.CharField(max_length=255)),
+                (
+                    "hit_type",
+                    models.CharField(
+                        choices=[
+                            ("exact", "Exact name"),
+                            ("alias", "Search alias"),
+                            ("fuzzy", "Full-text"),
+                            ("llm", "LLM"),
+                            ("negative", "LLM, not found"),
+                            ("error", "LLM error"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("latency_ms", models.FloatField()),
+                ("character_id", models.BigIntegerField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [
+                    django.contrib.postgres.indexes.BrinIndex(
+                        fields=["created_at"], name="search_event_created_brin"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchHourlyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hour", models.DateTimeField()),
+                (
+                    "hit_type",
+                    models.CharField(
+                        choices=[
+                            ("exact", "Exact name"),
+                            ("alias", "Search alias"),
+                            ("fuzzy", "Full-text"),
+                            ("llm", "LLM"),
+                            ("negative", "LLM, not found"),
+                            ("error", "LLM error"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("searches", models.PositiveIntegerField(default=0)),
+                ("latency_total_ms", models.FloatField(default=0)),
+                ("latency_max_ms", models.FloatField(default=0)),
+            ],
+            options={
+                "verbose_name": "search statistics",
+                "verbose_name_plural": "search statistics",
+                "ordering": ["-hour", "hit_type"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("hour", "hit_type"), name="search_hourly_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchQueryStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("query", models.CharField(max_length=255)),
+                ("searches", models.PositiveIntegerField(default=0)),
+                ("misses", models.PositiveIntegerField(default=0)),
+                ("not_found", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "query statistics",
+                "verbose_name_plural": "query statistics",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("misses__gt", 0)),
+                        fields=["day", "query"],
+                        include=("misses", "not_found"),
+                        name="search_query_missed_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("day", "query"), name="search_query_unique"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,6 +1,11 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db.models.functions import Lower
+
+# Text search configuration for search_vector and its queries
+SEARCH_CONFIG = "english"
 
 
 class Character(models.Model):
@@ -26,6 +31,18 @@ class Character(models.Model):
     # Color palette (list of dicts with name, hex, usage)
     colors = models.JSONField(default=list)
 
+    # Full-text search over the descriptive fields, maintained by Postgres
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("name", weight="A", config=SEARCH_CONFIG)
+            + SearchVector("movie", weight="B", config=SEARCH_CONFIG)
+            + SearchVector("category", weight="C", config=SEARCH_CONFIG)
+            + SearchVector("description", weight="D", config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -33,6 +50,20 @@ class Character(models.Model):
     class Meta:
         indexes = [
             GinIndex(fields=["search_queries"], name="character_queries_gin"),
+            GinIndex(fields=["search_vector"], name="character_search_gin"),
+            # Category filters, services.distinct_categories and the API's
+            # keyset order within a category
+            models.Index(
+                fields=["category", "updated_at", "id"],
+                name="character_category_idx",
+            ),
+            # API keyset order and incremental sync
+            models.Index(fields=["updated_at", "id"], name="character_updated_idx"),
+            # Case-insensitive exact and prefix name lookups (LIKE 'abc%')
+            models.Index(
+                OpClass(Lower("name"), name="text_pattern_ops"),
+                name="character_name_lower_idx",
+            ),
         ]
 
     def __str__(self):
@@ -50,3 +81,141 @@ class Character(models.Model):
             "thumbnail_url": self.thumbnail_url,
             "image_attribution": self.image_attribution,
         }
+
+
+class CatalogJob(models.Model):
+    """A background bulk operation over selected characters (admin actions)."""
+
+    class Kind(models.TextChoices):
+        THUMBNAILS = "thumbnails", "Refresh thumbnails"
+        PALETTES = "palettes", "Regenerate palettes"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    character_ids = ArrayField(models.BigIntegerField(), default=list)
+
+    # Progress, counted in characters
+    total = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} for {self.total} characters ({self.status})"
+
+    @property
+    def percent(self) -> int:
+        if not self.total:
+            return 100
+        return round(100 * (self.completed + self.failed) / self.total)
+
+
+class SearchEvent(models.Model):
+    """
+    One character search, as captured by apps.characters.analytics.
+
+    Raw events are short-lived: rollups fold them into SearchHourlyStats and
+    SearchQueryStats and delete them.
+    """
+
+    class HitType(models.TextChoices):
+        EXACT = "exact", "Exact name"
+        ALIAS = "alias", "Search alias"
+        FUZZY = "fuzzy", "Full-text"
+        LLM = "llm", "LLM"
+        NEGATIVE = "negative", "LLM, not found"
+        ERROR = "error", "LLM error"
+
+    # Hit types that called the LLM
+    MISSES = [HitType.LLM, HitType.NEGATIVE, HitType.ERROR]
+
+    created_at = models.DateTimeField()
+    # Normalized query
+    query = models.CharField(max_length=255)
+    hit_type = models.CharField(max_length=10, choices=HitType.choices)
+    latency_ms = models.FloatField()
+    # Character returned, if any (not a foreign key: this is an append-only log)
+    character_id = models.BigIntegerField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Rows arrive in time order, so a tiny BRIN index is enough
+            BrinIndex(fields=["created_at"], name="search_event_created_brin"),
+        ]
+
+    def __str__(self):
+        return f"{self.query} ({self.hit_type})"
+
+
+class SearchHourlyStats(models.Model):
+    """Searches per (UTC) hour and hit type."""
+
+    hour = models.DateTimeField()
+    hit_type = models.CharField(max_length=10, choices=SearchEvent.HitType.choices)
+    searches = models.PositiveIntegerField(default=0)
+    latency_total_ms = models.FloatField(default=0)
+    latency_max_ms = models.FloatField(default=0)
+
+    class Meta:
+        verbose_name = "search statistics"
+        verbose_name_plural = "search statistics"
+        ordering = ["-hour", "hit_type"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["hour", "hit_type"], name="search_hourly_unique"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.hour:%Y-%m-%d %H:00} {self.hit_type}: {self.searches}"
+
+    @property
+    def latency_avg_ms(self) -> float:
+        return self.latency_total_ms / self.searches if self.searches else 0.0
+
+
+class SearchQueryStats(models.Model):
+    """Searches per (UTC) day and normalized query."""
+
+    day = models.DateField()
+    query = models.CharField(max_length=255)
+    searches = models.PositiveIntegerField(default=0)
+    # Searches that called the LLM (llm, negative and error hit types)
+    misses = models.PositiveIntegerField(default=0)
+    # Searches the LLM answered with "not found"
+    not_found = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "query statistics"
+        verbose_name_plural = "query statistics"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "query"], name="search_query_unique"
+            ),
+        ]
+        indexes = [
+            # Top missed queries over recent days
+            models.Index(
+                fields=["day", "query"],
+                name="search_query_missed_idx",
+                include=["misses", "not_found"],
+                condition=models.Q(misses__gt=0),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.query}: {self.searches}"
@@ -0,0 +1,161 @@
+"""
+Speculative character searches while the user is still typing.
+
+With ``SEARCH_PREFETCH_ENABLED``, the search box posts its text to
+``characters:prefetch`` once typing pauses. If the catalog can't answer the
+text yet, SearchCharacter runs for it on a background thread and a found
+character is saved with the text as a search alias, so the real search is
+usually a cache hit. A search submitted while the prefetch for the same
+text is still running waits for it instead of calling the LLM again.
+
+Prefetches are capped per session (``SEARCH_PREFETCH_BUDGET``) and per
+process (``SEARCH_PREFETCH_CONCURRENCY``); when no slot is free the
+prefetch is skipped rather than queued. Each search settles the session's
+pending prefetches: one that answered the search is a hit, the rest were
+wasted calls.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+
+from apps.ai.client import get_sync_client, llm_timer
+from apps.core.background import run_in_background
+from apps.core.metrics import REGISTRY
+
+from .services import (
+    lookup_cached_character,
+    normalize_query,
+    save_character_from_result,
+)
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds the search box waits after the last keystroke
+DEBOUNCE_MS = 700
+# Shorter text is rarely specific enough to be worth a call
+MIN_QUERY_LENGTH = 4
+# Longest a search waits for a running prefetch of the same text
+WAIT_SECONDS = 20.0
+
+SESSION_KEY = "search_prefetch"
+
+PREFETCH_CALLS = REGISTRY.counter(
+    "search_prefetch_calls_total",
+    "Speculative SearchCharacter calls by outcome.",
+    ["outcome"],
+)
+PREFETCH_SKIPPED = REGISTRY.counter(
+    "search_prefetch_skipped_total",
+    "Prefetch requests that didn't call the LLM, by reason.",
+    ["reason"],
+)
+PREFETCH_SETTLED = REGISTRY.counter(
+    "search_prefetch_settled_total",
+    "Prefetched queries settled by a search: hit (answered it) or wasted.",
+    ["result"],
+)
+
+_lock = threading.Lock()
+# Normalized query -> set once its prefetch has finished
+_in_flight: dict[str, threading.Event] = {}
+
+
+def start(request, query: str) -> str:
+    """
+    Start a prefetch for ``query`` if it's worth one.
+
+    Returns "started" or the reason it was skipped (short, pending, cached,
+    budget or busy).
+    """
+    normalized = normalize_query(query)
+    reason = _skip_reason(request, normalized)
+    if reason is None:
+        reason = _claim(request, normalized)
+    if reason != "started":
+        PREFETCH_SKIPPED.inc(reason=reason)
+    return reason
+
+
+def _skip_reason(request, normalized: str) -> str | None:
+    if len(normalized) < MIN_QUERY_LENGTH:
+        return "short"
+    state = request.session.get(SESSION_KEY, {})
+    if normalized in state.get("pending", []):
+        return "pending"
+    # Session checks first: the catalog lookup runs on every pause in typing
+    if state.get("calls", 0) >= settings.SEARCH_PREFETCH_BUDGET:
+        return "budget"
+    if lookup_cached_character(normalized)[0] is not None:
+        return "cached"
+    return None
+
+
+def _claim(request, normalized: str) -> str:
+    with _lock:
+        if normalized in _in_flight:
+            return "pending"
+        if len(_in_flight) >= settings.SEARCH_PREFETCH_CONCURRENCY:
+            return "busy"
+        _in_flight[normalized] = threading.Event()
+
+    state = request.session.get(SESSION_KEY, {"calls": 0, "pending": []})
+    state["calls"] += 1
+    state["pending"].append(normalized)
+    request.session[SESSION_KEY] = state
+    run_in_background("search-prefetch", _run, normalized)
+    return "started"
+
+
+def _run(query: str) -> None:
+    outcome = "error"
+    try:
+        with llm_timer("SearchCharacter"):
+            result = get_sync_client().SearchCharacter(query=query)
+        if result.found:
+            save_character_from_result(result, query)
+            outcome = "found"
+        else:
+            outcome = "not_found"
+    except Exception as e:
+        logger.warning(f"Prefetch failed for {query}: {e}")
+    finally:
+        with _lock:
+            done = _in_flight.pop(query, None)
+        if done is not None:
+            done.set()
+        PREFETCH_CALLS.inc(outcome=outcome)
+
+
+def wait_for(normalized: str, timeout: float = WAIT_SECONDS) -> bool:
+    """
+    Wait for a running prefetch of ``normalized`` in this process.
+
+    Returns whether there was one (and it finished in time).
+    """
+    with _lock:
+        done = _in_flight.get(normalized)
+    return done is not None and done.wait(timeout)
+
+
+def settle(request, character) -> None:
+    """
+    Count this session's pending prefetches once a search has been answered.
+
+    A prefetch whose text was saved as an alias of ``character`` (the
+    search's answer, or None) answered it; any others were wasted.
+    """
+    if not settings.SEARCH_PREFETCH_ENABLED:
+        return
+    state = request.session.get(SESSION_KEY)
+    if not state or not state["pending"]:
+        return
+    aliases = set(character.search_queries) if character is not None else set()
+    hit = int(any(query in aliases for query in state["pending"]))
+    if hit:
+        PREFETCH_SETTLED.inc(result="hit")
+    if wasted := len(state["pending"]) - hit:
+        PREFETCH_SETTLED.inc(wasted, result="wasted")
+    state["pending"] = []
+    request.session[SESSION_KEY] = state
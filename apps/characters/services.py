@@ -3,22 +3,46 @@ Character caching and TMDB integration services.
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import Optional
 
 import httpx
+from asgiref.sync import async_to_sync
 from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, Q
 from django.db.models.functions import Lower
 
-from .models import Character
+from apps.core.routers import read_primary
+from apps.core.timing import timer
+
+from .models import SEARCH_CONFIG, Character, SearchEvent
 
 logger = logging.getLogger(__name__)
 
+# Full-text queries matching more characters than this are too vague to
+# answer from the cache
+FTS_MAX_CANDIDATES = 50
+
 
 def normalize_query(query: str) -> str:
     """Normalize search query for consistent matching."""
     return query.lower().strip()
 
 
+def _first_match(queryset) -> Optional[Character]:
+    """
+    Lowest-id row of a queryset expected to match at most a few rows.
+
+    Avoids ``.first()``: its ORDER BY id LIMIT 1 makes Postgres expect an
+    early hit and scan the whole table instead of using the name/alias
+    indexes.
+    """
+    return min(queryset.order_by(), key=lambda row: row.pk, default=None)
+
+
 def find_cached_character(query: str) -> Optional[Character]:
     """
     Check database for a cached character matching the query.
@@ -26,23 +50,144 @@ def find_cached_character(query: str) -> Optional[Character]:
     Matches on:
     - Exact name match (case-insensitive)
     - Query exists in search_queries array
+    - Full-text search over name, movie, category and description, when the
+      best match ranks at least CHARACTER_FTS_MIN_RANK
+    """
+    return lookup_cached_character(query)[0]
+
+
+def lookup_cached_character(query: str) -> tuple[Optional[Character], Optional[str]]:
+    """
+    find_cached_character, plus which step matched: a SearchEvent.HitType
+    (exact, alias or fuzzy), or None on a miss.
     """
     normalized = normalize_query(query)
 
     # Try exact name match first (case-insensitive)
-    character = (
-        Character.objects.annotate(name_lower=Lower("name"))
-        .filter(name_lower=normalized)
-        .first()
+    character = _first_match(
+        Character.objects.annotate(name_lower=Lower("name")).filter(
+            name_lower=normalized
+        )
     )
 
     if character:
-        return character
+        return character, SearchEvent.HitType.EXACT
 
     # Check if query exists in search_queries array
-    character = Character.objects.filter(search_queries__contains=[normalized]).first()  # type: ignore[assignment]
+    character = _first_match(
+        Character.objects.filter(search_queries__contains=[normalized])
+    )
 
-    return character
+    if character:
+        return character, SearchEvent.HitType.ALIAS
+
+    character = search_characters(normalized)
+    return character, SearchEvent.HitType.FUZZY if character else None
+
+
+def search_characters(query: str) -> Optional[Character]:
+    """
+    Best full-text match for a descriptive query, if it's confident enough.
+
+    Every query term must match (websearch syntax, so stop words like "the"
+    and "from" are ignored). The top result is returned only if its rank
+    (normalized to 0-1) reaches CHARACTER_FTS_MIN_RANK and it isn't tied
+    with the runner-up. Queries matching more than FTS_MAX_CANDIDATES
+    characters are too vague to answer and are not ranked at all, so a
+    query like "princess" costs a bounded index scan, not a sort of every
+    match.
+    """
+    search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+    # normalization=32 scales rank to rank / (rank + 1)
+    rank = SearchRank(F("search_vector"), search_query, normalization=32)
+    candidates = list(
+        Character.objects.filter(search_vector=search_query)
+        .annotate(rank=rank)
+        .order_by()[: FTS_MAX_CANDIDATES + 1]
+    )
+    if not candidates or len(candidates) > FTS_MAX_CANDIDATES:
+        return None
+
+    candidates.sort(key=lambda character: (-character.rank, character.pk))
+    best = candidates[0]
+    if best.rank < settings.CHARACTER_FTS_MIN_RANK:
+        return None
+    if len(candidates) > 1 and candidates[1].rank >= best.rank:
+        return None
+    return best
+
+
+@lru_cache(maxsize=1)
+def trigram_available() -> bool:
+    """Whether the pg_trgm extension (and the name trigram index) is installed."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def filter_catalog(queryset, term: str):
+    """
+    Narrow ``queryset`` to characters matching a catalog search ``term``.
+
+    Matches names starting with the term, exact aliases (search_queries),
+    and characters whose name/movie/category/description contain words
+    starting with each of the term's words. Each branch has its own index,
+    so Postgres combines them with a bitmap OR instead of scanning the
+    table. With pg_trgm installed, names containing the term anywhere match
+    too.
+    """
+    normalized = normalize_query(term)
+    if not normalized:
+        return queryset
+
+    condition = Q(name_lower__startswith=normalized) | Q(
+        search_queries__contains=[normalized]
+    )
+    words = re.findall(r"\w+", normalized)
+    if words:
+        prefixes = " & ".join(f"{word}:*" for word in words)
+        condition |= Q(
+            search_vector=SearchQuery(prefixes, search_type="raw", config=SEARCH_CONFIG)
+        )
+    if trigram_available():
+        condition |= Q(name__icontains=normalized)
+    return queryset.alias(name_lower=Lower("name")).filter(condition)
+
+
+def distinct_categories() -> list[str]:
+    """
+    Every category in the catalog, sorted.
+
+    A loose index scan over character_category_idx: one index probe per
+    category, where SELECT DISTINCT would read every row.
+    """
+    table = connection.ops.quote_name(Character._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH RECURSIVE categories AS (
+                (SELECT category FROM {table} ORDER BY category LIMIT 1)
+                UNION ALL
+                SELECT (
+                    SELECT category FROM {table}
+                    WHERE category > categories.category
+                    ORDER BY category LIMIT 1
+                )
+                FROM categories
+                WHERE categories.category IS NOT NULL
+            )
+            SELECT category FROM categories WHERE category IS NOT NULL
+            """
+        )
+        return [category for (category,) in cursor.fetchall()]
+
+
+def colors_from_result(result) -> list[dict]:
+    """A BAML CharacterSearchResult's palette in Character.colors format."""
+    return [
+        {"hex": color.hex, "name": color.name, "usage": color.usage}
+        for color in result.colors
+    ]
 
 
 def save_character_from_result(result, query: str) -> Optional[Character]:
@@ -61,12 +206,14 @@ def save_character_from_result(result, query: str) -> Optional[Character]:
 
     normalized_query = normalize_query(query)
 
-    # Check if character already exists by name
-    existing = (
-        Character.objects.annotate(name_lower=Lower("name"))
-        .filter(name_lower=result.name.lower())
-        .first()
-    )
+    # Check if character already exists by name (on the primary: a replica
+    # may not have a character created moments ago)
+    with read_primary():
+        existing = (
+            Character.objects.annotate(name_lower=Lower("name"))
+            .filter(name_lower=result.name.lower())
+            .first()
+        )
 
     if existing:
         # Add query to search_queries if not already present
@@ -75,24 +222,13 @@ def save_character_from_result(result, query: str) -> Optional[Character]:
             existing.save(update_fields=["search_queries", "updated_at"])
         return existing
 
-    # Convert colors from BAML objects to dicts
-    colors_data = []
-    for color in result.colors:
-        colors_data.append(
-            {
-                "hex": color.hex,
-                "name": color.name,
-                "usage": color.usage,
-            }
-        )
-
     # Create new character
     character = Character.objects.create(
         name=result.name,
         movie=result.movie,
         category=result.category,
         description=result.description,
-        colors=colors_data,
+        colors=colors_from_result(result),
         search_queries=[normalized_query],
     )
 
@@ -103,10 +239,26 @@ def fetch_character_thumbnail(character: Character) -> bool:
     """
     Fetch character thumbnail from TMDB API.
 
+    Synchronous entry point for background threads; see
+    ``afetch_character_thumbnail``.
+    """
+    return async_to_sync(afetch_character_thumbnail)(character)
+
+
+async def afetch_character_thumbnail(
+    character: Character,
+    client: Optional[httpx.AsyncClient] = None,
+    force: bool = False,
+) -> bool:
+    """
+    Fetch character thumbnail from TMDB API.
+
     Searches for the movie first, then looks for the character in credits.
 
     Args:
         character: Character instance to update
+        client: Shared HTTP client (bulk refreshes); a new one if omitted
+        force: Look up a new thumbnail even if the character has one
 
     Returns:
         True if thumbnail was found and saved, False otherwise
@@ -115,69 +267,74 @@ def fetch_character_thumbnail(character: Character) -> bool:
         logger.warning("TMDB_API_KEY not configured, skipping thumbnail fetch")
         return False
 
-    if character.thumbnail_url:
+    if character.thumbnail_url and not force:
         # Already has a thumbnail
         return True
 
+    if client is None:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            return await afetch_character_thumbnail(character, client, force)
+
     headers = {
         "Authorization": f"Bearer {settings.TMDB_API_KEY}",
         "accept": "application/json",
     }
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            # Extract movie name without year for better search results
-            movie_name = character.movie.split("(")[0].strip()
+        # Extract movie name without year for better search results
+        movie_name = character.movie.split("(")[0].strip()
 
-            # Search for the movie
-            search_url = f"{settings.TMDB_BASE_URL}/search/movie"
-            response = client.get(
+        # Search for the movie
+        search_url = f"{settings.TMDB_BASE_URL}/search/movie"
+        with timer("tmdb"):
+            response = await client.get(
                 search_url,
                 params={"query": movie_name},
                 headers=headers,
             )
-            response.raise_for_status()
-            search_results = response.json()
-
-            if not search_results.get("results"):
-                logger.info(f"No TMDB results for movie: {movie_name}")
-                return False
-
-            movie_id = search_results["results"][0]["id"]
-
-            # Get movie credits
-            credits_url = f"{settings.TMDB_BASE_URL}/movie/{movie_id}/credits"
-            response = client.get(credits_url, headers=headers)
-            response.raise_for_status()
-            credits = response.json()
-
-            # Look for character in cast
-            character_name_lower = character.name.lower()
-            for cast_member in credits.get("cast", []):
-                cast_character = cast_member.get("character", "").lower()
-                if (
-                    character_name_lower in cast_character
-                    or cast_character in character_name_lower
-                ):
-                    profile_path = cast_member.get("profile_path")
-                    if profile_path:
-                        character.thumbnail_url = (
-                            f"{settings.TMDB_IMAGE_BASE_URL}{profile_path}"
-                        )
-                        character.image_attribution = "Image from TMDB"
-                        character.save(
-                            update_fields=[
-                                "thumbnail_url",
-                                "image_attribution",
-                                "updated_at",
-                            ]
-                        )
-                        logger.info(f"Found thumbnail for {character.name}")
-                        return True
-
-            logger.info(f"Character {character.name} not found in TMDB credits")
+        response.raise_for_status()
+        search_results = response.json()
+
+        if not search_results.get("results"):
+            logger.info(f"No TMDB results for movie: {movie_name}")
             return False
 
+        movie_id = search_results["results"][0]["id"]
+
+        # Get movie credits
+        credits_url = f"{settings.TMDB_BASE_URL}/movie/{movie_id}/credits"
+        with timer("tmdb"):
+            response = await client.get(credits_url, headers=headers)
+        response.raise_for_status()
+        credits = response.json()
+
+        # Look for character in cast
+        character_name_lower = character.name.lower()
+        for cast_member in credits.get("cast", []):
+            cast_character = cast_member.get("character", "").lower()
+            if (
+                character_name_lower in cast_character
+                or cast_character in character_name_lower
+            ):
+                profile_path = cast_member.get("profile_path")
+                if profile_path:
+                    character.thumbnail_url = (
+                        f"{settings.TMDB_IMAGE_BASE_URL}{profile_path}"
+                    )
+                    character.image_attribution = "Image from TMDB"
+                    await character.asave(
+                        update_fields=[
+                            "thumbnail_url",
+                            "image_attribution",
+                            "updated_at",
+                        ]
+                    )
+                    logger.info(f"Found thumbnail for {character.name}")
+                    return True
+
+        logger.info(f"Character {character.name} not found in TMDB credits")
+        return False
+
     except httpx.HTTPError as e:
         logger.error(f"TMDB API error: {e}")
         return False
@@ -0,0 +1,294 @@
+"""
+Catalog snapshots: stream the Character table to a file and load it back.
+
+Two formats, picked by file name:
+
+- ``.jsonl`` / ``.jsonl.gz``: one JSON object per character. Portable and
+  easy to inspect or edit.
+- ``.copy`` / ``.copy.gz``: Postgres binary COPY. Fastest, but only readable
+  by a database with the same column types.
+
+Both directions stream, so memory use doesn't grow with the catalog. Imports
+COPY into a temporary staging table and then upsert into the catalog in one
+transaction. Characters are matched on case-insensitive name, the same
+identity ``save_character_from_result`` uses, so an import never adds a
+second character with a name search already resolves. On a match, search
+queries are merged and an existing thumbnail or palette is kept if the
+snapshot has none. Rows the snapshot wouldn't change are left untouched, so
+re-importing the same snapshot is cheap.
+"""
+
+import gzip
+from dataclasses import dataclass
+from pathlib import Path
+
+import psycopg
+from django.db import DataError, connection, transaction
+
+from .models import Character
+
+# Exported columns, in file order. id and search_vector are database-specific
+# and regenerated on import.
+COLUMNS = [
+    "name",
+    "movie",
+    "category",
+    "description",
+    "search_queries",
+    "thumbnail_url",
+    "image_attribution",
+    "colors",
+    "created_at",
+]
+
+FORMATS = ("jsonl", "copy")
+
+BLOCK_SIZE = 1 << 20
+
+STAGING_TABLE = "character_snapshot_staging"
+
+
+class SnapshotError(Exception):
+    """Raised for unreadable or unsupported snapshot files."""
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+
+    @property
+    def unchanged(self) -> int:
+        return self.rows - self.created - self.updated
+
+
+def snapshot_format(path: Path | str) -> str:
+    """``jsonl`` or ``copy``, from the file name."""
+    suffixes = Path(path).suffixes
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes = suffixes[:-1]
+    fmt = suffixes[-1].lstrip(".") if suffixes else ""
+    if fmt not in FORMATS:
+        raise SnapshotError(
+            f"Can't tell the snapshot format of {path}; "
+            "use .jsonl, .jsonl.gz, .copy or .copy.gz"
+        )
+    return fmt
+
+
+def _open(path: Path | str, mode: str):
+    if str(path).endswith(".gz"):
+        # Level 1: several times faster than the default, for a modest size cost
+        return gzip.open(path, mode, compresslevel=1)
+    return open(path, mode)
+
+
+def _table() -> str:
+    return connection.ops.quote_name(Character._meta.db_table)
+
+
+def _column_list() -> str:
+    return ", ".join(connection.ops.quote_name(column) for column in COLUMNS)
+
+
+def export_characters(path: Path | str) -> int:
+    """Write every character to ``path``. Returns the number written."""
+    if snapshot_format(path) == "copy":
+        return _export_copy(path)
+    return _export_jsonl(path)
+
+
+def _export_jsonl(path) -> int:
+    # Postgres renders each line, so colors aren't decoded and re-encoded here
+    query = (
+        f"COPY (SELECT row_to_json(r)::text FROM "
+        f"(SELECT {_column_list()} FROM {_table()} ORDER BY id) r) "
+        "TO STDOUT (FORMAT binary)"
+    )
+    count = 0
+    with _open(path, "wt") as out, connection.cursor() as cursor:
+        with cursor.copy(query) as copy:
+            copy.set_types(["text"])
+            for (line,) in copy.rows():
+                out.write(line)
+                out.write("\n")
+                count += 1
+    return count
+
+
+def _export_copy(path) -> int:
+    query = (
+        f"COPY (SELECT {_column_list()} FROM {_table()} ORDER BY id) "
+        "TO STDOUT (FORMAT binary)"
+    )
+    with _open(path, "wb") as out, connection.cursor() as cursor:
+        with cursor.copy(query) as copy:
+            for block in copy:
+                out.write(block)
+        return cursor.rowcount
+
+
+def import_characters(path: Path | str) -> ImportStats:
+    """
+    Upsert the characters in snapshot ``path`` into the catalog.
+
+    Raises:
+        SnapshotError: If the file name or contents aren't a snapshot
+    """
+    fmt = snapshot_format(path)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT {_column_list()} FROM {_table()} WITH NO DATA"
+        )
+        # Load order, so the last of any repeated character wins
+        cursor.execute(
+            f"ALTER TABLE {STAGING_TABLE} "
+            "ADD COLUMN position bigint GENERATED ALWAYS AS IDENTITY"
+        )
+        # Let GIN index inserts batch up instead of flushing every 4MB
+        cursor.execute("SET LOCAL gin_pending_list_limit = '64MB'")
+        try:
+            if fmt == "copy":
+                _load_copy(cursor, path)
+            else:
+                _load_jsonl(cursor, path)
+            _validate(cursor)
+        except (OSError, ValueError, psycopg.DataError, DataError) as e:
+            raise SnapshotError(f"Couldn't read {path}: {e}") from e
+
+        cursor.execute(f"SELECT count(*) FROM {STAGING_TABLE}")
+        stats = ImportStats(rows=cursor.fetchone()[0])
+        stats.updated, stats.created = _upsert(cursor)
+        # ON COMMIT DROP doesn't fire if we're nested in an outer transaction
+        cursor.execute(f"DROP TABLE {STAGING_TABLE}")
+
+    if stats.created or stats.updated:
+        # Fresh planner statistics after a bulk load
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {_table()}")
+    return stats
+
+
+def _load_copy(cursor, path) -> None:
+    with _open(path, "rb") as source:
+        with cursor.copy(
+            f"COPY {STAGING_TABLE} ({_column_list()}) FROM STDIN (FORMAT binary)"
+        ) as copy:
+            while block := source.read(BLOCK_SIZE):
+                copy.write(block)
+
+
+def _load_jsonl(cursor, path) -> None:
+    # Lines are parsed by Postgres rather than row by row in Python. CSV with
+    # quote and delimiter bytes that never appear in JSON passes each line
+    # through as a single field.
+    lines = f"{STAGING_TABLE}_lines"
+    cursor.execute(
+        f"CREATE TEMPORARY TABLE {lines} "
+        "(position bigint GENERATED ALWAYS AS IDENTITY, line jsonb) ON COMMIT DROP"
+    )
+    with _open(path, "rb") as source:
+        with cursor.copy(
+            f"COPY {lines} (line) FROM STDIN (FORMAT csv, QUOTE e'\\x01', DELIMITER e'\\x02')"
+        ) as copy:
+            while block := source.read(BLOCK_SIZE):
+                copy.write(block)
+
+    cursor.execute(
+        f"""
+        INSERT INTO {STAGING_TABLE} ({_column_list()})
+        SELECT
+            r.name,
+            r.movie,
+            COALESCE(r.category, ''),
+            COALESCE(r.description, ''),
+            COALESCE(r.search_queries, '{{}}'),
+            COALESCE(r.thumbnail_url, ''),
+            COALESCE(r.image_attribution, ''),
+            COALESCE(r.colors, '[]'),
+            COALESCE(r.created_at, now())
+        FROM {lines} l, jsonb_populate_record(NULL::{STAGING_TABLE}, l.line) r
+        WHERE l.line IS NOT NULL
+        ORDER BY l.position
+        """
+    )
+    cursor.execute(f"DROP TABLE {lines}")
+
+
+def _validate(cursor) -> None:
+    cursor.execute(
+        f"SELECT count(*) FROM {STAGING_TABLE} WHERE name IS NULL OR movie IS NULL"
+    )
+    if missing := cursor.fetchone()[0]:
+        raise ValueError(f"{missing} records have no name or movie")
+    cursor.execute(
+        f"SELECT count(*) FROM {STAGING_TABLE} "
+        "WHERE jsonb_typeof(colors) IS DISTINCT FROM 'array'"
+    )
+    if malformed := cursor.fetchone()[0]:
+        raise ValueError(f"{malformed} records have colors that aren't a list")
+
+
+def _upsert(cursor) -> tuple[int, int]:
+    """
+    Merge the staging table into the catalog. Returns (updated, created);
+    matched rows the snapshot wouldn't change aren't counted as updated.
+    """
+    table = _table()
+    # A snapshot may repeat a character; keep the last occurrence
+    cursor.execute(f"ANALYZE {STAGING_TABLE} (name)")
+    cursor.execute(
+        f"""
+        DELETE FROM {STAGING_TABLE} a USING {STAGING_TABLE} b
+        WHERE lower(a.name) = lower(b.name) AND a.position < b.position
+        """
+    )
+    cursor.execute(
+        f"""
+        UPDATE {table} AS c SET
+            movie = s.movie,
+            category = s.category,
+            description = s.description,
+            search_queries = ARRAY(
+                SELECT DISTINCT q FROM unnest(c.search_queries || s.search_queries) q
+            ),
+            thumbnail_url = COALESCE(NULLIF(s.thumbnail_url, ''), c.thumbnail_url),
+            image_attribution = CASE
+                WHEN s.thumbnail_url <> '' THEN s.image_attribution
+                ELSE c.image_attribution
+            END,
+            colors = CASE
+                WHEN jsonb_array_length(s.colors) > 0 THEN s.colors
+                ELSE c.colors
+            END,
+            updated_at = now()
+        FROM {STAGING_TABLE} s
+        WHERE lower(c.name) = lower(s.name)
+            -- Leave identical rows alone (no new row versions or index entries)
+            AND (
+                (c.movie, c.category, c.description)
+                    IS DISTINCT FROM (s.movie, s.category, s.description)
+                OR NOT c.search_queries @> s.search_queries
+                OR (
+                    s.thumbnail_url <> ''
+                    AND (c.thumbnail_url, c.image_attribution)
+                        IS DISTINCT FROM (s.thumbnail_url, s.image_attribution)
+                )
+                OR (jsonb_array_length(s.colors) > 0 AND c.colors <> s.colors)
+            )
+        """
+    )
+    updated = cursor.rowcount
+    cursor.execute(
+        f"""
+        INSERT INTO {table} ({_column_list()}, updated_at)
+        SELECT {", ".join(f"s.{column}" for column in COLUMNS)}, now()
+        FROM {STAGING_TABLE} s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {table} c WHERE lower(c.name) = lower(s.name)
+        )
+        """
+    )
+    return updated, cursor.rowcount
@@ -1 +1,1039 @@
-# Create your tests here.
+"""Tests for character search and caching."""
+
+import asyncio
+import json
+import threading
+from datetime import timedelta
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DatabaseError, connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.metrics import SEARCH_CACHE_LOOKUPS
+from apps.scraping import color_index
+from apps.scraping.parsers import ProductData
+from apps.scraping.services import upsert_products
+
+from . import analytics, api, prefetch, services
+from .jobs import create_job, run_job
+from .models import (
+    CatalogJob,
+    Character,
+    SearchEvent,
+    SearchHourlyStats,
+    SearchQueryStats,
+)
+from .services import (
+    afetch_character_thumbnail,
+    distinct_categories,
+    filter_catalog,
+    find_cached_character,
+    search_characters,
+)
+from .snapshot import SnapshotError, export_characters, import_characters
+
+
+def make_result(name="Flounder", found=True):
+    """Object shaped like a BAML CharacterSearchResult."""
+    return SimpleNamespace(
+        found=found,
+        name=name,
+        movie="The Little Mermaid (1989)",
+        category="Sidekick",
+        description="Ariel's loyal tropical fish friend.",
+        colors=[SimpleNamespace(hex="#FFD700", name="Yellow", usage="Body")],
+        notFoundMessage=None,
+    )
+
+
+@pytest.fixture
+def flounder(db):
+    return Character.objects.create(
+        name="Flounder",
+        movie="The Little Mermaid (1989)",
+        category="Sidekick",
+        description="Ariel's loyal tropical fish friend.",
+        colors=[{"hex": "#FFD700", "name": "Yellow", "usage": "Body"}],
+        search_queries=["flounder", "the fish from little mermaid"],
+        thumbnail_url="https://image.tmdb.org/t/p/w185/flounder.jpg",
+    )
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Replace the BAML client with one returning canned results."""
+    calls = []
+
+    class FakeClient:
+        def SearchCharacter(self, query):
+            calls.append(query)
+            return make_result(name=query.title())
+
+    monkeypatch.setattr("apps.characters.views.get_sync_client", FakeClient)
+    monkeypatch.setattr(
+        "apps.characters.views._start_thumbnail_fetch", lambda character: None
+    )
+    return calls
+
+
+@pytest.mark.django_db
+class TestSearch:
+    """Tests for the HTMX search endpoint."""
+
+    def test_cache_hit_skips_llm(self, client: Client, flounder, fake_llm):
+        """A cached alias is served without calling the LLM."""
+        hits = SEARCH_CACHE_LOOKUPS.value(result="hit")
+        response = client.post(
+            "/characters/search/", {"q": "The fish from little mermaid"}
+        )
+        assert response.status_code == 200
+        assert b"Flounder" in response.content
+        assert fake_llm == []
+        assert SEARCH_CACHE_LOOKUPS.value(result="hit") == hits + 1
+
+    def test_cache_miss_calls_llm_and_saves(self, client: Client, fake_llm):
+        """A miss calls the LLM once and caches the character."""
+        misses = SEARCH_CACHE_LOOKUPS.value(result="miss")
+        response = client.post("/characters/search/", {"q": "sebastian"})
+        assert response.status_code == 200
+        assert fake_llm == ["sebastian"]
+        assert Character.objects.filter(name="Sebastian").exists()
+        assert SEARCH_CACHE_LOOKUPS.value(result="miss") == misses + 1
+        assert "llm;dur=" in response["Server-Timing"]
+
+    def test_empty_query(self, client: Client, fake_llm):
+        response = client.post("/characters/search/", {"q": "  "})
+        assert b"Please enter a character name" in response.content
+        assert fake_llm == []
+
+
+@pytest.fixture
+def mermaid_cast(flounder):
+    sebastian = Character.objects.create(
+        name="Sebastian",
+        movie="The Little Mermaid (1989)",
+        category="Sidekick",
+        description="A red crab and court composer who watches over Ariel.",
+        colors=[{"hex": "#DC143C", "name": "Red", "usage": "Shell"}],
+    )
+    return {"flounder": flounder, "sebastian": sebastian}
+
+
+@pytest.mark.django_db
+class TestFullTextSearch:
+    """Descriptive queries are answered from the catalog when confident."""
+
+    def test_descriptive_query_hits(self, mermaid_cast):
+        assert (
+            find_cached_character("the crab from little mermaid")
+            == (mermaid_cast["sebastian"])
+        )
+        assert (
+            find_cached_character("tropical fish in the little mermaid")
+            == (mermaid_cast["flounder"])
+        )
+
+    def test_every_term_must_match(self, mermaid_cast):
+        assert find_cached_character("the crab from frozen") is None
+
+    def test_ambiguous_query_misses(self, mermaid_cast):
+        # Both characters rank equally on the movie title alone
+        assert search_characters("little mermaid sidekick") is None
+
+    def test_threshold_is_tunable(self, mermaid_cast, settings):
+        query = "the crab from little mermaid"
+        settings.CHARACTER_FTS_MIN_RANK = 0.99
+        assert find_cached_character(query) is None
+        settings.CHARACTER_FTS_MIN_RANK = 0.0
+        assert find_cached_character(query) == mermaid_cast["sebastian"]
+
+    def test_too_many_matches_misses(self, mermaid_cast, monkeypatch):
+        monkeypatch.setattr("apps.characters.services.FTS_MAX_CANDIDATES", 1)
+        assert search_characters("little mermaid") is None
+
+    def test_search_view_skips_llm(self, client: Client, mermaid_cast, fake_llm):
+        response = client.post(
+            "/characters/search/", {"q": "crab composer from the little mermaid"}
+        )
+        assert b"Sebastian" in response.content
+        assert fake_llm == []
+
+
+@pytest.mark.django_db
+class TestSnapshot:
+    """export_characters / import_characters round-trip the catalog."""
+
+    @pytest.mark.parametrize("filename", ["catalog.jsonl.gz", "catalog.copy"])
+    def test_round_trip(self, tmp_path, mermaid_cast, filename):
+        path = tmp_path / filename
+        assert export_characters(path) == 2
+        Character.objects.all().delete()
+
+        stats = import_characters(path)
+
+        assert (stats.rows, stats.created, stats.updated) == (2, 2, 0)
+        flounder = Character.objects.get(name="Flounder")
+        assert flounder.search_queries == ["flounder", "the fish from little mermaid"]
+        assert flounder.colors == mermaid_cast["flounder"].colors
+        assert flounder.thumbnail_url.endswith("/flounder.jpg")
+        assert flounder.created_at == mermaid_cast["flounder"].created_at
+        # The generated search column is rebuilt on insert
+        assert search_characters("tropical fish in the little mermaid") == flounder
+
+    def test_upsert_merges_existing(self, tmp_path, flounder):
+        path = tmp_path / "catalog.jsonl"
+        export_characters(path)
+        Character.objects.filter(pk=flounder.pk).update(
+            name="FLOUNDER",
+            description="Old description",
+            search_queries=["yellow fish"],
+            thumbnail_url="",
+        )
+
+        stats = import_characters(path)
+
+        assert (stats.created, stats.updated) == (0, 1)
+        flounder.refresh_from_db()
+        assert flounder.description == "Ariel's loyal tropical fish friend."
+        assert sorted(flounder.search_queries) == [
+            "flounder",
+            "the fish from little mermaid",
+            "yellow fish",
+        ]
+        assert flounder.thumbnail_url.endswith("/flounder.jpg")
+
+    def test_keeps_existing_thumbnail_and_colors(self, tmp_path, flounder):
+        path = tmp_path / "catalog.jsonl"
+        path.write_text(
+            '{"name": "Flounder", "movie": "The Little Mermaid (1989)", '
+            '"search_queries": ["guppy"]}\n'
+        )
+
+        import_characters(path)
+
+        flounder.refresh_from_db()
+        assert flounder.thumbnail_url.endswith("/flounder.jpg")
+        assert flounder.colors[0]["hex"] == "#FFD700"
+        assert "guppy" in flounder.search_queries
+
+    def test_duplicate_rows_last_wins(self, tmp_path, db):
+        path = tmp_path / "catalog.jsonl"
+        path.write_text(
+            '{"name": "Stitch", "movie": "Lilo & Stitch (2002)", '
+            '"description": "first"}\n'
+            '{"name": "stitch", "movie": "Lilo & Stitch (2002)", '
+            '"description": "second"}\n'
+        )
+
+        stats = import_characters(path)
+
+        assert stats.created == 1
+        assert Character.objects.get().description == "second"
+
+    def test_bad_input_rolls_back(self, tmp_path, flounder):
+        path = tmp_path / "catalog.jsonl"
+        path.write_text('{"name": "Stitch", "movie": "Lilo & Stitch (2002)"}\n{oops\n')
+
+        with pytest.raises(SnapshotError, match="line 2"):
+            import_characters(path)
+        assert Character.objects.count() == 1
+
+    def test_matches_on_name_like_search(self, tmp_path, flounder):
+        path = tmp_path / "catalog.jsonl"
+        path.write_text('{"name": "flounder", "movie": "The Little Mermaid II"}\n')
+
+        stats = import_characters(path)
+
+        assert (stats.created, stats.updated) == (0, 1)
+        assert Character.objects.get().movie == "The Little Mermaid II"
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            '{"name": "Stitch", "movie": "Lilo & Stitch", "colors": {"hex": "#000"}}',
+            '{"name": "Stitch", "movie": "Lilo & Stitch", "created_at": "soon"}',
+        ],
+    )
+    def test_malformed_values(self, tmp_path, flounder, record):
+        path = tmp_path / "catalog.jsonl"
+        path.write_text(record + "\n")
+
+        with pytest.raises(CommandError, match="Couldn't read"):
+            call_command("import_characters", str(path))
+        assert Character.objects.count() == 1
+
+    def test_unknown_extension(self, tmp_path, db):
+        with pytest.raises(SnapshotError):
+            export_characters(tmp_path / "catalog.csv")
+
+    def test_commands(self, tmp_path, flounder, capsys):
+        path = str(tmp_path / "catalog.copy.gz")
+        call_command("export_characters", path)
+        call_command("import_characters", path)
+
+        output = capsys.readouterr().out
+        assert "Exported 1 characters" in output
+        assert "0 created, 0 updated, 1 unchanged" in output
+
+
+@pytest.fixture
+def admin_client(db):
+    user = get_user_model().objects.create_superuser(
+        "admin", "admin@example.com", "password"
+    )
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+class TestCatalogSearch:
+    """filter_catalog matches through the name, alias and full-text indexes."""
+
+    def search(self, term):
+        return set(
+            filter_catalog(Character.objects.all(), term).values_list("name", flat=True)
+        )
+
+    def test_name_prefix(self, mermaid_cast):
+        assert self.search("Seba") == {"Sebastian"}
+
+    def test_alias(self, mermaid_cast):
+        assert self.search("the fish from little mermaid") == {"Flounder"}
+
+    def test_word_prefixes(self, mermaid_cast):
+        assert self.search("mermaid") == {"Flounder", "Sebastian"}
+        assert self.search("tropic fish") == {"Flounder"}
+
+    def test_no_array_scan(self, mermaid_cast):
+        sql = str(filter_catalog(Character.objects.all(), "fish").query)
+        assert 'search_queries"::text' not in sql
+        assert "@>" in sql
+
+    def test_trigram_when_available(self, mermaid_cast, monkeypatch):
+        monkeypatch.setattr(services, "trigram_available", lambda: True)
+        sql = str(filter_catalog(Character.objects.all(), "bast").query)
+        assert 'UPPER("characters_character"."name"::text) LIKE' in sql
+
+    def test_distinct_categories(self, mermaid_cast):
+        Character.objects.create(
+            name="Ursula",
+            movie="The Little Mermaid (1989)",
+            category="Villain",
+            description="Sea witch.",
+        )
+        assert distinct_categories() == ["Sidekick", "Villain"]
+
+
+@pytest.mark.django_db
+class TestCharacterAdmin:
+    """Changelist search, thumbnails and background bulk actions."""
+
+    url = "/admin/characters/character/"
+
+    def test_search(self, admin_client, mermaid_cast):
+        response = admin_client.get(self.url, {"q": "crab"})
+        assert response.status_code == 200
+        assert b"Sebastian" in response.content
+        assert b"Flounder" not in response.content
+
+    def test_blank_search(self, admin_client, mermaid_cast):
+        response = admin_client.get(self.url, {"q": " "})
+        assert response.status_code == 200
+        assert b"Sebastian" in response.content
+        assert b"Flounder" in response.content
+
+    def test_thumbnail_column(self, admin_client, mermaid_cast):
+        response = admin_client.get(self.url)
+        assert b'<img src="https://image.tmdb.org/t/p/w185/flounder.jpg"' in (
+            response.content
+        )
+
+    def test_no_full_count(self, admin_client, mermaid_cast):
+        with CaptureQueriesContext(connection) as queries:
+            admin_client.get(self.url, {"q": "mermaid"})
+        counts = [q["sql"] for q in queries.captured_queries if "COUNT(" in q["sql"]]
+        # Only the (small, exact) count of the search results
+        assert len(counts) == 1 and "WHERE" in counts[0]
+
+    def test_category_filter(self, admin_client, mermaid_cast):
+        Character.objects.create(
+            name="Ursula",
+            movie="The Little Mermaid (1989)",
+            category="Villain",
+            description="Sea witch.",
+        )
+        response = admin_client.get(self.url, {"category": "Villain"})
+        assert b"Ursula" in response.content
+        assert b"Sebastian" not in response.content
+
+    @pytest.mark.parametrize("action", ["refresh_thumbnails", "regenerate_palettes"])
+    def test_bulk_action_queues_job(
+        self, admin_client, mermaid_cast, monkeypatch, action
+    ):
+        started = []
+        monkeypatch.setattr("apps.characters.admin.start_job", started.append)
+        ids = [character.pk for character in mermaid_cast.values()]
+
+        response = admin_client.post(
+            self.url, {"action": action, "_selected_action": ids}, follow=True
+        )
+
+        job = CatalogJob.objects.get()
+        assert started == [job]
+        assert sorted(job.character_ids) == sorted(ids)
+        assert job.total == 2
+        assert f"job #{job.pk}" in response.content.decode()
+
+
+class FakePaletteClient:
+    """Async SearchCharacter stand-in that tracks concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def SearchCharacter(self, query):
+        self.calls.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if query.startswith("Nobody"):
+                return make_result(found=False)
+            return SimpleNamespace(
+                found=True,
+                colors=[SimpleNamespace(hex="#FF7F50", name="Coral", usage="Fins")],
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.django_db
+class TestCatalogJobs:
+    """Bulk jobs run in chunks with bounded concurrency and record progress."""
+
+    def test_regenerate_palettes(self, mermaid_cast, monkeypatch, settings):
+        settings.CATALOG_JOB_CONCURRENCY = 2
+        monkeypatch.setattr("apps.characters.jobs.CHUNK_SIZE", 3)
+        fake = FakePaletteClient()
+        monkeypatch.setattr("apps.characters.jobs.get_async_client", lambda: fake)
+        extra = [
+            Character.objects.create(name=f"Fish {i}", movie="Sea (2000)")
+            for i in range(3)
+        ]
+        nobody = Character.objects.create(name="Nobody", movie="None (2000)")
+        characters = [*mermaid_cast.values(), *extra, nobody]
+        job = create_job(CatalogJob.Kind.PALETTES, [c.pk for c in characters] + [0])
+
+        run_job(job.pk)
+
+        job.refresh_from_db()
+        assert job.status == CatalogJob.Status.DONE
+        assert (job.total, job.completed, job.failed) == (7, 5, 2)
+        assert job.finished_at is not None
+        assert 1 < fake.max_in_flight <= 2
+        assert "Flounder from The Little Mermaid (1989)" in fake.calls
+        mermaid_cast["flounder"].refresh_from_db()
+        assert mermaid_cast["flounder"].colors[0]["name"] == "Coral"
+        nobody.refresh_from_db()
+        assert nobody.colors == []
+
+    def test_refresh_thumbnails_forces_lookup(self, mermaid_cast, monkeypatch):
+        seen = []
+
+        async def fake_fetch(character, client, force=False):
+            seen.append((character.name, force))
+            return True
+
+        monkeypatch.setattr(
+            "apps.characters.jobs.afetch_character_thumbnail", fake_fetch
+        )
+        job = create_job(
+            CatalogJob.Kind.THUMBNAILS, [c.pk for c in mermaid_cast.values()]
+        )
+
+        run_job(job.pk)
+
+        job.refresh_from_db()
+        assert job.completed == 2
+        assert sorted(seen) == [("Flounder", True), ("Sebastian", True)]
+
+
+@pytest.mark.django_db
+class TestFetchThumbnail:
+    def test_saves_matching_cast_profile(self, mermaid_cast, settings):
+        settings.TMDB_API_KEY = "key"
+
+        def handler(request):
+            if request.url.path.endswith("/search/movie"):
+                return httpx.Response(200, json={"results": [{"id": 10144}]})
+            return httpx.Response(
+                200,
+                json={
+                    "cast": [
+                        {"character": "Sebastian (voice)", "profile_path": "/s.jpg"}
+                    ]
+                },
+            )
+
+        async def fetch(character):
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as client:
+                return await afetch_character_thumbnail(character, client)
+
+        sebastian = mermaid_cast["sebastian"]
+        assert async_to_sync(fetch)(sebastian)
+        sebastian.refresh_from_db()
+        assert sebastian.thumbnail_url.endswith("/s.jpg")
+        assert sebastian.image_attribution == "Image from TMDB"
+
+
+@pytest.fixture
+def api_catalog(db):
+    """Five characters with distinct, increasing updated_at."""
+    characters = []
+    for index in range(5):
+        character = Character.objects.create(
+            name=f"Character {index}",
+            movie="Catalog (2000)",
+            category="Villain" if index % 2 else "Hero",
+            description=f"Number {index}",
+            colors=[{"hex": "#000000", "name": "Black", "usage": "Cape"}],
+            search_queries=[f"alias {index}"],
+        )
+        characters.append(character)
+    return characters
+
+
+@pytest.mark.django_db
+class TestCatalogApi:
+    """Keyset-paginated JSON pages with filters and ETags."""
+
+    url = "/characters/api/"
+
+    def fetch_all(self, client, **params):
+        names, url, pages = [], self.url, 0
+        while url:
+            data = client.get(url, params if pages == 0 else None).json()
+            names += [row["name"] for row in data["results"]]
+            url = data["next"]
+            pages += 1
+        return names, pages
+
+    def test_pages_walk_catalog_in_update_order(self, client, api_catalog):
+        names, pages = self.fetch_all(client, limit=2)
+        assert names == [f"Character {index}" for index in range(5)]
+        assert pages == 3
+
+    def test_result_shape(self, client, api_catalog):
+        row = client.get(self.url).json()["results"][0]
+        assert row["id"] == api_catalog[0].pk
+        assert row["colors"] == api_catalog[0].colors
+        assert row["found"] is True
+        assert "updated_at" in row
+        assert "search_queries" not in row
+
+    def test_category_filter(self, client, api_catalog):
+        names, _ = self.fetch_all(client, category="Villain", limit=1)
+        assert names == ["Character 1", "Character 3"]
+
+    def test_edited_characters_move_to_the_end(self, client, api_catalog):
+        first = client.get(self.url, {"limit": 5}).json()
+        assert first["next"] is None
+        last_seen = api.encode_cursor(api_catalog[-1])
+
+        api_catalog[1].description = "Edited"
+        api_catalog[1].save()
+
+        data = client.get(self.url, {"cursor": last_seen}).json()
+        assert [row["name"] for row in data["results"]] == ["Character 1"]
+
+    def test_updated_since(self, client, api_catalog):
+        since = api_catalog[3].updated_at.isoformat()
+        names, _ = self.fetch_all(client, updated_since=since)
+        assert names == ["Character 3", "Character 4"]
+
+    def test_same_timestamp_rows_are_not_skipped(self, client, api_catalog):
+        stamp = api_catalog[0].updated_at
+        Character.objects.update(updated_at=stamp)
+        names, pages = self.fetch_all(client, limit=2)
+        assert sorted(names) == [f"Character {index}" for index in range(5)]
+        assert pages == 3
+
+    def test_etag(self, client, api_catalog):
+        response = client.get(self.url, {"limit": 2})
+        etag = response["ETag"]
+
+        cached = client.get(self.url, {"limit": 2}, headers={"if-none-match": etag})
+        assert cached.status_code == 304
+
+        api_catalog[0].save()
+        changed = client.get(self.url, {"limit": 2}, headers={"if-none-match": etag})
+        assert changed.status_code == 200
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"cursor": "not-a-cursor"},
+            {"limit": "0"},
+            {"limit": "lots"},
+            {"updated_since": "yesterday"},
+            {"updated_since": "2026-01-01T00:00:00"},
+        ],
+    )
+    def test_bad_parameters(self, client, api_catalog, params):
+        response = client.get(self.url, params)
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+    def test_deep_page_is_a_range_scan(self, client, api_catalog):
+        cursor = api.encode_cursor(api_catalog[2])
+        queryset = api.after(api.catalog_queryset({}), cursor)
+        sql = str(queryset.query)
+        assert "OFFSET" not in sql
+        assert '"characters_character"."updated_at" >=' in sql
+
+
+@pytest.mark.django_db
+class TestCatalogStream:
+    """NDJSON export of the whole filtered catalog."""
+
+    url = "/characters/api/stream/"
+
+    def read(self, response):
+        body = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_streams_every_character(self, client, api_catalog):
+        response = client.get(self.url)
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = self.read(response)
+        assert [row["name"] for row in rows] == [c.name for c in api_catalog]
+
+    def test_lines_match_api_results(self, client, api_catalog):
+        page = client.get("/characters/api/").json()["results"]
+        streamed = self.read(client.get(self.url))
+        for row, line in zip(page, streamed, strict=True):
+            assert list(line.items()) == list(row.items())
+
+    @pytest.mark.parametrize("server_side_cursors", [True, False])
+    def test_chunks(self, api_catalog, monkeypatch, settings, server_side_cursors):
+        monkeypatch.setattr(api, "STREAM_CHUNK_SIZE", 2)
+        monkeypatch.setitem(
+            connection.settings_dict,
+            "DISABLE_SERVER_SIDE_CURSORS",
+            not server_side_cursors,
+        )
+        chunks = list(api.iter_ndjson(api.catalog_queryset({"category": "Hero"})))
+        assert [chunk.count("\n") for chunk in chunks] == [2, 1]
+
+    def test_filters(self, client, api_catalog):
+        since = (api_catalog[2].updated_at).isoformat()
+        response = client.get(self.url, {"category": "Hero", "updated_since": since})
+        assert [row["name"] for row in self.read(response)] == [
+            "Character 2",
+            "Character 4",
+        ]
+
+    def test_conditional_requests(self, client, api_catalog):
+        response = client.get(self.url)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        assert client.get(self.url, headers={"if-none-match": etag}).status_code == 304
+        assert (
+            client.get(self.url, headers={"if-modified-since": last_modified})
+        ).status_code == 304
+
+        api_catalog[0].delete()
+        assert client.get(self.url, headers={"if-none-match": etag}).status_code == 200
+
+    def test_later_change_invalidates(self, client, api_catalog):
+        etag = client.get(self.url)["ETag"]
+        Character.objects.filter(pk=api_catalog[0].pk).update(
+            updated_at=api_catalog[-1].updated_at + timedelta(seconds=5)
+        )
+        assert client.get(self.url, headers={"if-none-match": etag}).status_code == 200
+
+
+@pytest.mark.django_db
+class TestShopPalette:
+    """Products matched to the character's palette."""
+
+    def test_products_ranked_by_palette(self, client: Client, flounder):
+        color_index.reset()
+        upsert_products(
+            [
+                ProductData(
+                    url="https://shop.example.com/1",
+                    name="Gold Tee",
+                    item_type="top",
+                    color_hex="#FFD000",
+                ),
+                ProductData(
+                    url="https://shop.example.com/2",
+                    name="Black Boots",
+                    item_type="shoes",
+                    color_hex="#000000",
+                ),
+            ]
+        )
+        response = client.get(f"/characters/{flounder.pk}/products/?type=top")
+        color_index.reset()
+
+        assert response.status_code == 200
+        assert b"Gold Tee" in response.content
+        assert b"Black Boots" not in response.content
+        assert b"Yellow" in response.content
+
+
+@pytest.fixture
+def search_analytics(db, settings):
+    """An empty analytics buffer that only flushes when told to."""
+    settings.SEARCH_ANALYTICS_BATCH_SIZE = 1000
+    settings.SEARCH_ANALYTICS_FLUSH_INTERVAL = 3600
+    settings.SEARCH_ANALYTICS_ROLLUP_INTERVAL = 0
+    analytics.discard()
+    yield
+    analytics.discard()
+
+
+def make_event(query, hit_type, latency_ms=10.0, created_at=None):
+    return SearchEvent(
+        created_at=created_at or timezone.now(),
+        query=query,
+        hit_type=hit_type,
+        latency_ms=latency_ms,
+    )
+
+
+@pytest.mark.django_db
+class TestSearchCapture:
+    """Searches are buffered in memory and written in bulk."""
+
+    def test_hit_types(self, client: Client, flounder, search_analytics, monkeypatch):
+        class FakeClient:
+            def SearchCharacter(self, query):
+                if query == "boom":
+                    raise RuntimeError("quota")
+                return make_result(name=query.title(), found=query != "nobody")
+
+        monkeypatch.setattr("apps.characters.views.get_sync_client", FakeClient)
+        monkeypatch.setattr(
+            "apps.characters.views._start_thumbnail_fetch", lambda character: None
+        )
+        for query in [
+            "Flounder",
+            "The fish from little mermaid",
+            "tropical fish in the little mermaid",
+            "Sebastian",
+            "nobody",
+            "boom",
+        ]:
+            client.post("/characters/search/", {"q": query})
+
+        assert not SearchEvent.objects.exists()
+        assert analytics.flush() == 6
+
+        events = list(SearchEvent.objects.order_by("id"))
+        assert [event.hit_type for event in events] == [
+            "exact",
+            "alias",
+            "fuzzy",
+            "llm",
+            "negative",
+            "error",
+        ]
+        assert events[0].query == "flounder"
+        assert events[0].character_id == flounder.pk
+        assert events[3].character_id == Character.objects.get(name="Sebastian").pk
+        assert events[4].character_id is None
+        assert all(event.latency_ms >= 0 for event in events)
+
+    def test_flushes_in_one_insert_when_full(
+        self, search_analytics, settings, monkeypatch
+    ):
+        started = []
+        monkeypatch.setattr(
+            analytics, "run_in_background", lambda task, func: started.append(func)
+        )
+        settings.SEARCH_ANALYTICS_BATCH_SIZE = 3
+        analytics.record_search("a", "exact", 0.01)
+        analytics.record_search("b", "alias", 0.01)
+        assert not started
+
+        with CaptureQueriesContext(connection) as queries:
+            analytics.record_search("c", "llm", 2.5)
+            # Flushed off the request thread, and only once
+            analytics.record_search("d", "llm", 2.5)
+        assert len(queries) == 0
+        assert len(started) == 1
+
+        with CaptureQueriesContext(connection) as queries:
+            started[0]()
+        assert len(queries) == 1
+        assert SearchEvent.objects.count() == 4
+        assert SearchEvent.objects.get(query="c").latency_ms == 2500
+
+    def test_timer_flushes_quiet_buffer(self, search_analytics, settings, monkeypatch):
+        started = []
+        due = threading.Event()
+
+        def start(task, func):
+            started.append(func)
+            due.set()
+
+        monkeypatch.setattr(analytics, "run_in_background", start)
+        settings.SEARCH_ANALYTICS_FLUSH_INTERVAL = 0.05
+        analytics.record_search("a", "exact", 0.01)
+        analytics.record_search("b", "exact", 0.01)
+
+        assert due.wait(5)
+        assert len(started) == 1
+        started[0]()
+        assert SearchEvent.objects.count() == 2
+
+    def test_failed_flush_is_dropped(self, search_analytics, monkeypatch):
+        def fail(*args, **kwargs):
+            raise DatabaseError("down")
+
+        monkeypatch.setattr(SearchEvent.objects, "bulk_create", fail)
+        dropped = analytics.SEARCH_EVENTS_DROPPED.value()
+        analytics.record_search("a", "exact", 0.01)
+        analytics.record_search("b", "exact", 0.01)
+
+        assert analytics.flush() == 0
+        assert analytics.SEARCH_EVENTS_DROPPED.value() == dropped + 2
+        assert analytics.flush() == 0
+
+
+@pytest.mark.django_db
+class TestSearchRollup:
+    """Raw events fold into hourly and per-query stats."""
+
+    def test_rollup(self, search_analytics):
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        SearchEvent.objects.bulk_create(
+            [
+                make_event("ariel", "exact", 5, hour),
+                make_event("ariel", "exact", 15, hour),
+                make_event("the sea witch", "llm", 2000, hour),
+                make_event("the sea witch", "negative", 3000, hour),
+                make_event("the sea witch", "exact", 5, hour),
+            ]
+        )
+        assert analytics.rollup_searches() == 5
+        assert not SearchEvent.objects.exists()
+
+        exact = SearchHourlyStats.objects.get(hour=hour, hit_type="exact")
+        assert (exact.searches, exact.latency_total_ms, exact.latency_max_ms) == (
+            3,
+            25,
+            15,
+        )
+        witch = SearchQueryStats.objects.get(query="the sea witch")
+        assert (witch.searches, witch.misses, witch.not_found) == (3, 2, 1)
+
+        # A later rollup adds to the same rows
+        SearchEvent.objects.bulk_create([make_event("ariel", "exact", 40, hour)])
+        assert analytics.rollup_searches() == 1
+        exact.refresh_from_db()
+        assert (exact.searches, exact.latency_max_ms) == (4, 40)
+        assert SearchQueryStats.objects.get(query="ariel").searches == 3
+
+    def test_rollup_in_batches(self, search_analytics, monkeypatch):
+        monkeypatch.setattr(analytics, "ROLLUP_BATCH_SIZE", 2)
+        SearchEvent.objects.bulk_create([make_event("ariel", "exact")] * 5)
+        assert analytics.rollup_searches() == 5
+        assert SearchHourlyStats.objects.get().searches == 5
+
+    def test_summarize(self, search_analytics):
+        SearchEvent.objects.bulk_create(
+            [make_event("ariel", "exact", 10)] * 3 + [make_event("x", "llm", 2000)]
+        )
+        analytics.rollup_searches()
+        summary = {row.hit_type: row for row in analytics.summarize()}
+        assert summary["exact"].share == 0.75
+        assert summary["llm"].latency_avg_ms == 2000
+        assert summary["alias"].searches == 0
+
+    def test_top_missed_queries(self, search_analytics):
+        old = timezone.now() - timedelta(days=30)
+        SearchEvent.objects.bulk_create(
+            [
+                make_event("the sea witch", "negative"),
+                make_event("the sea witch", "llm"),
+                make_event("ursula's eels", "llm"),
+                make_event("ariel", "exact"),
+                make_event("ancient query", "llm", created_at=old),
+                make_event("ancient query", "llm", created_at=old),
+                make_event("ancient query", "llm", created_at=old),
+            ]
+        )
+        analytics.rollup_searches()
+        assert analytics.top_missed_queries(days=7) == [
+            {"query": "the sea witch", "misses": 2, "not_found": 1},
+            {"query": "ursula's eels", "misses": 1, "not_found": 0},
+        ]
+        assert analytics.top_missed_queries(days=60, limit=1)[0]["query"] == (
+            "ancient query"
+        )
+
+    def test_command(self, search_analytics, capsys):
+        SearchEvent.objects.bulk_create([make_event("the sea witch", "llm")])
+        call_command("rollup_searches", "--top-missed", "5")
+        assert capsys.readouterr().out == "the sea witch\t1\n"
+
+    def test_dashboard(self, admin_client, search_analytics):
+        analytics.record_search("the sea witch", "negative", 2.0)
+        response = admin_client.get("/admin/characters/searchhourlystats/")
+        assert response.status_code == 200
+        assert b"Top missed queries" in response.content
+        assert b"the sea witch" in response.content
+        assert SearchHourlyStats.objects.get().hit_type == "negative"
+
+
+@pytest.fixture
+def prefetching(db, settings, monkeypatch):
+    """Prefetch enabled, running synchronously against a fake LLM."""
+    settings.SEARCH_PREFETCH_ENABLED = True
+    settings.SEARCH_PREFETCH_BUDGET = 3
+    settings.SEARCH_PREFETCH_CONCURRENCY = 2
+    calls = []
+
+    class FakeClient:
+        def SearchCharacter(self, query):
+            calls.append(query)
+            if query.startswith("flou"):
+                return make_result(name="Flounder")
+            return make_result(name=query.title(), found=query != "nobody")
+
+    monkeypatch.setattr(prefetch, "get_sync_client", FakeClient)
+    monkeypatch.setattr("apps.characters.views.get_sync_client", FakeClient)
+    monkeypatch.setattr(
+        prefetch, "run_in_background", lambda task, func, *args: func(*args)
+    )
+    monkeypatch.setattr(
+        "apps.characters.views._start_thumbnail_fetch", lambda character: None
+    )
+    return calls
+
+
+@pytest.mark.django_db
+class TestSearchPrefetch:
+    """Speculative searches from the search box."""
+
+    url = "/characters/prefetch/"
+
+    def test_disabled_by_default(self, client: Client):
+        assert client.post(self.url, {"q": "flounder"}).status_code == 404
+        assert b"characters/prefetch/" not in client.get("/characters/").content
+
+    def test_search_box_posts_while_typing(self, client: Client, prefetching):
+        content = client.get("/characters/").content.decode()
+        assert 'hx-post="/characters/prefetch/"' in content
+        assert f"delay:{prefetch.DEBOUNCE_MS}ms" in content
+
+    def test_prefetched_search_is_a_cache_hit(self, client: Client, prefetching):
+        hits = prefetch.PREFETCH_SETTLED.value(result="hit")
+        found = prefetch.PREFETCH_CALLS.value(outcome="found")
+
+        assert client.post(self.url, {"q": "Floun"}).status_code == 204
+        assert prefetching == ["floun"]
+        assert prefetch.PREFETCH_CALLS.value(outcome="found") == found + 1
+
+        response = client.post("/characters/search/", {"q": "Flounder"})
+        assert b"Flounder" in response.content
+        assert prefetching == ["floun"]
+        assert prefetch.PREFETCH_SETTLED.value(result="hit") == hits + 1
+        assert client.session[prefetch.SESSION_KEY] == {"calls": 1, "pending": []}
+
+    def test_unused_prefetch_is_wasted(self, client: Client, prefetching):
+        wasted = prefetch.PREFETCH_SETTLED.value(result="wasted")
+        client.post(self.url, {"q": "nobody"})
+        client.post(self.url, {"q": "sebas"})
+        client.post("/characters/search/", {"q": "ursula"})
+        assert prefetching == ["nobody", "sebas", "ursula"]
+        assert prefetch.PREFETCH_SETTLED.value(result="wasted") == wasted + 2
+
+    @pytest.mark.parametrize(
+        "query, reason",
+        [
+            ("abc", "short"),
+            ("flounder", "cached"),
+            ("the fish from little mermaid", "cached"),
+        ],
+    )
+    def test_skips(self, client: Client, prefetching, flounder, query, reason):
+        skipped = prefetch.PREFETCH_SKIPPED.value(reason=reason)
+        client.post(self.url, {"q": query})
+        assert prefetching == []
+        assert prefetch.PREFETCH_SKIPPED.value(reason=reason) == skipped + 1
+
+    def test_session_budget(self, client: Client, prefetching, settings):
+        settings.SEARCH_PREFETCH_BUDGET = 2
+        for query in ["ariel", "ursula", "sebastian"]:
+            client.post(self.url, {"q": query})
+        assert prefetching == ["ariel", "ursula"]
+        # The budget is per session
+        Client().post(self.url, {"q": "sebastian"})
+        assert prefetching == ["ariel", "ursula", "sebastian"]
+
+    def test_spent_budget_skips_catalog_lookup(
+        self, client: Client, prefetching, settings
+    ):
+        settings.SEARCH_PREFETCH_BUDGET = 1
+        client.post(self.url, {"q": "ariel"})
+        with CaptureQueriesContext(connection) as queries:
+            client.post(self.url, {"q": "ursula"})
+        assert not any(
+            "characters_character" in query["sql"] for query in queries.captured_queries
+        )
+        assert prefetching == ["ariel"]
+
+    def test_concurrency_limit(self, client: Client, prefetching, settings):
+        settings.SEARCH_PREFETCH_CONCURRENCY = 1
+        running = threading.Event()
+        prefetch._in_flight["someone else"] = running
+        try:
+            assert prefetch.start(client_request(client), "ariel") == "busy"
+        finally:
+            prefetch._in_flight.pop("someone else")
+        assert prefetching == []
+
+    def test_search_waits_for_running_prefetch(
+        self, client: Client, prefetching, monkeypatch
+    ):
+        def finish_prefetch(normalized):
+            services.save_character_from_result(make_result("Ariel"), normalized)
+            return True
+
+        monkeypatch.setattr(prefetch, "wait_for", finish_prefetch)
+        response = client.post("/characters/search/", {"q": "ariel"})
+        assert b"Ariel" in response.content
+        assert prefetching == []
+
+    def test_wait_for(self):
+        assert prefetch.wait_for("nothing running") is False
+        done = threading.Event()
+        prefetch._in_flight["ariel"] = done
+        try:
+            threading.Timer(0.05, done.set).start()
+            assert prefetch.wait_for("ariel", timeout=5)
+        finally:
+            prefetch._in_flight.pop("ariel")
+
+
+def client_request(client: Client):
+    """A request object carrying ``client``'s session."""
+    return SimpleNamespace(session=client.session)
@@ -7,5 +7,9 @@ app_name = "characters"
 urlpatterns = [
     path("", views.character_list, name="list"),
     path("search/", views.search, name="search"),
+    path("prefetch/", views.prefetch_search, name="prefetch"),
     path("<int:pk>/", views.character_detail, name="detail"),
+    path("<int:pk>/products/", views.character_products, name="products"),
+    path("api/", views.api_characters, name="api"),
+    path("api/stream/", views.api_characters_stream, name="api_stream"),
 ]
@@ -1,15 +1,32 @@
 import logging
-import threading
+import time
 
 from django.shortcuts import render, get_object_or_404
-from django.http import HttpRequest, HttpResponse
-from django.views.decorators.http import require_http_methods
+from django.conf import settings
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, urlencode
+from django.views.decorators.http import require_GET, require_http_methods
 
-from baml_client.sync_client import b as baml
+from apps.ai.client import get_sync_client, llm_timer
+from apps.core.background import run_in_background
+from apps.core.metrics import SEARCH_CACHE_LOOKUPS
+from apps.core.routers import read_primary
+from apps.outfits.models import OutfitItem
+from apps.scraping.services import shop_palette
 
-from .models import Character
+from . import api, prefetch
+from .analytics import record_search
+from .models import Character, SearchEvent
 from .services import (
-    find_cached_character,
+    lookup_cached_character,
     save_character_from_result,
     fetch_character_thumbnail,
     normalize_query,
@@ -37,6 +54,8 @@ def character_list(request: HttpRequest) -> HttpResponse:
             "characters": characters,
             "categories": sorted(set(categories)),
             "selected_category": category,
+            "prefetch_enabled": settings.SEARCH_PREFETCH_ENABLED,
+            "prefetch_delay": prefetch.DEBOUNCE_MS,
         },
     )
 
@@ -53,12 +72,28 @@ def character_detail(request: HttpRequest, pk: int) -> HttpResponse:
     )
 
 
-def _fetch_thumbnail_async(character):
-    """Fetch thumbnail in background thread."""
-    try:
-        fetch_character_thumbnail(character)
-    except Exception as e:
-        logger.error(f"Background thumbnail fetch failed: {e}")
+def character_products(request: HttpRequest, pk: int) -> HttpResponse:
+    """Shopping suggestions matched to a character's palette (HTMX partial)."""
+    character = get_object_or_404(Character, pk=pk)
+    item_type = request.GET.get("type", "")
+    if item_type not in OutfitItem.ItemType.values:
+        item_type = ""
+
+    return render(
+        request,
+        "characters/partials/products.html",
+        {
+            "character": character,
+            "matches": shop_palette(character.colors, item_type=item_type or None),
+            "item_types": OutfitItem.ItemType.choices,
+            "selected_type": item_type,
+        },
+    )
+
+
+def _start_thumbnail_fetch(character):
+    """Fetch a character's thumbnail without blocking the response."""
+    run_in_background("thumbnail", fetch_character_thumbnail, character)
 
 
 @require_http_methods(["POST"])
@@ -75,21 +110,31 @@ def search(request: HttpRequest) -> HttpResponse:
 
     # Normalize query for consistent matching
     normalized = normalize_query(query)
+    started = time.perf_counter()
 
     # Check cache first
-    cached_character = find_cached_character(normalized)
+    cached_character, hit_type = lookup_cached_character(normalized)
+    if cached_character is None and prefetch.wait_for(normalized):
+        # A prefetch of this text just finished; it may have saved the
+        # character (read it from the primary in case a replica lags)
+        with read_primary():
+            cached_character, hit_type = lookup_cached_character(normalized)
 
     if cached_character:
+        assert hit_type is not None  # Set whenever a character is found
         logger.info(f"Cache hit for query: {query}")
+        SEARCH_CACHE_LOOKUPS.inc(result="hit")
+        record_search(
+            normalized,
+            hit_type,
+            time.perf_counter() - started,
+            cached_character.pk,
+        )
+        prefetch.settle(request, cached_character)
 
         # Trigger background thumbnail fetch if missing
         if not cached_character.thumbnail_url:
-            thread = threading.Thread(
-                target=_fetch_thumbnail_async,
-                args=(cached_character,),
-                daemon=True,
-            )
-            thread.start()
+            _start_thumbnail_fetch(cached_character)
 
         return render(
             request,
@@ -102,21 +147,26 @@ def search(request: HttpRequest) -> HttpResponse:
         )
 
     # Cache miss - call BAML
+    SEARCH_CACHE_LOOKUPS.inc(result="miss")
     try:
         logger.info(f"Cache miss for query: {query}, calling LLM")
-        result = baml.SearchCharacter(query=query)
+        with llm_timer("SearchCharacter"):
+            result = get_sync_client().SearchCharacter(query=query)
 
         # Save to cache if character was found
+        character = None
         if result.found:
             character = save_character_from_result(result, query)
             if character:
                 # Trigger background thumbnail fetch
-                thread = threading.Thread(
-                    target=_fetch_thumbnail_async,
-                    args=(character,),
-                    daemon=True,
-                )
-                thread.start()
+                _start_thumbnail_fetch(character)
+        record_search(
+            normalized,
+            SearchEvent.HitType.LLM if result.found else SearchEvent.HitType.NEGATIVE,
+            time.perf_counter() - started,
+            character.pk if character else None,
+        )
+        prefetch.settle(request, character)
 
         return render(
             request,
@@ -129,6 +179,10 @@ def search(request: HttpRequest) -> HttpResponse:
         )
     except Exception as e:
         logger.error(f"Search failed: {e}")
+        record_search(
+            normalized, SearchEvent.HitType.ERROR, time.perf_counter() - started
+        )
+        prefetch.settle(request, None)
         return render(
             request,
             "characters/partials/search_results.html",
@@ -137,3 +191,81 @@ def search(request: HttpRequest) -> HttpResponse:
                 "query": query,
             },
         )
+
+
+@require_http_methods(["POST"])
+def prefetch_search(request: HttpRequest) -> HttpResponse:
+    """
+    Speculatively search for the text typed so far (debounced HTMX post
+    from the search box; nothing is swapped in).
+    """
+    if not settings.SEARCH_PREFETCH_ENABLED:
+        raise Http404
+    prefetch.start(request, request.POST.get("q", ""))
+    return HttpResponse(status=204)
+
+
+@require_GET
+def api_characters(request: HttpRequest) -> HttpResponse:
+    """
+    One keyset-paginated page of the catalog as JSON.
+
+    Query parameters: ``category``, ``updated_since``, ``limit`` (1-1000,
+    default 100) and ``cursor`` (from the previous page's ``next``).
+    """
+    try:
+        queryset = api.catalog_queryset(request.GET)
+        limit = api.parse_limit(request.GET.get("limit"))
+        rows, next_cursor = api.catalog_page(queryset, request.GET.get("cursor"), limit)
+    except api.ApiError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    etag = api.page_etag(rows, next_cursor)
+    if response := get_conditional_response(request, etag=etag):
+        return response
+
+    next_url = None
+    if next_cursor:
+        params = {**request.GET.dict(), "cursor": next_cursor}
+        next_url = f"{reverse('characters:api')}?{urlencode(params)}"
+    response = JsonResponse(
+        {
+            "results": [api.serialize(character) for character in rows],
+            "next": next_url,
+            "next_cursor": next_cursor,
+        }
+    )
+    response["ETag"] = etag
+    return response
+
+
+@require_GET
+def api_characters_stream(
+    request: HttpRequest,
+) -> HttpResponse | StreamingHttpResponse:
+    """
+    The whole (filtered) catalog as NDJSON, streamed in constant memory.
+
+    Takes the same ``category`` and ``updated_since`` filters as
+    ``api_characters``.
+    """
+    try:
+        queryset = api.catalog_queryset(request.GET)
+    except api.ApiError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    etag, last = api.stream_validators(queryset)
+    # HTTP dates have whole-second precision
+    last_modified = int(last.timestamp()) if last else None
+    if not_modified := get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    ):
+        return not_modified
+
+    stream = StreamingHttpResponse(
+        api.iter_ndjson(queryset), content_type="application/x-ndjson"
+    )
+    stream["ETag"] = etag
+    if last_modified:
+        stream["Last-Modified"] = http_date(last_modified)
+    return stream
@@ -0,0 +1,51 @@
+"""
+Fire-and-forget background work on daemon threads.
+
+Threads get their own thread-local database connections; these are closed
+(returned to the pool, when pooling is on) when the task finishes so
+background work never leaks connections.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from django.db import connections
+
+from .metrics import BACKGROUND_TASKS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+
+def _run(task: str, func: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+    try:
+        func(*args, **kwargs)
+    except Exception as e:
+        logger.error(f"Background task {task} failed: {e}")
+    finally:
+        connections.close_all()
+        BACKGROUND_TASKS_IN_FLIGHT.dec(task=task)
+
+
+def run_in_background(
+    task: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> threading.Thread:
+    """
+    Run ``func(*args, **kwargs)`` on a daemon thread.
+
+    Args:
+        task: Short name used in logs and the background_tasks_in_flight gauge
+
+    Returns:
+        The started thread
+    """
+    BACKGROUND_TASKS_IN_FLIGHT.inc(task=task)
+    thread = threading.Thread(
+        target=_run,
+        args=(task, func, args, kwargs),
+        name=f"background-{task}",
+        daemon=True,
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,19 @@
+"""Database connection helpers."""
+
+from typing import Any
+
+from django.db import connections
+
+
+def pool_stats(alias: str = "default") -> dict[str, Any]:
+    """
+    psycopg pool statistics for ``alias`` in this process.
+
+    Empty when pooling is disabled. Counters (``requests_num``,
+    ``connections_num``, ...) are cumulative since the pool was created.
+    """
+    connection = connections[alias]
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        return {}
+    return pool.get_stats()
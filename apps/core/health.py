@@ -0,0 +1,142 @@
+"""
+Liveness and readiness checks.
+
+Liveness answers "is this process serving requests" and touches nothing.
+Readiness checks dependencies (database, BAML, TMDB configuration), and
+caches the result for ``HEALTH_READY_TTL`` seconds so frequent probes don't
+keep the serverless database awake.
+"""
+
+import importlib.util
+import threading
+import time
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.template.loader import get_template
+
+from .db import pool_stats
+
+PROCESS_STARTED = time.time()
+
+# Templates compiled during warm-up so the first real request doesn't pay
+WARM_TEMPLATES = [
+    "pages/home.html",
+    "characters/list.html",
+    "characters/detail.html",
+    "characters/partials/search_results.html",
+]
+
+_lock = threading.Lock()
+_cached: dict[str, Any] | None = None
+_cached_at = 0.0
+_warmed_at: float | None = None
+
+
+def liveness() -> dict[str, Any]:
+    return {
+        "status": "alive",
+        "uptime_s": round(time.time() - PROCESS_STARTED, 1),
+    }
+
+
+def check_database() -> str:
+    try:
+        with connections["default"].cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except Exception as e:
+        return f"error: {e}"
+    return "ok"
+
+
+def check_baml() -> str:
+    if importlib.util.find_spec("baml_client") is None:
+        return "error: baml_client not generated"
+    if not settings.GOOGLE_API_KEY and not settings.GEMINI_BASE_URL:
+        return "not configured"
+    return "ok"
+
+
+def check_tmdb() -> str:
+    return "ok" if settings.TMDB_API_KEY else "not configured"
+
+
+def connection_stats() -> dict[str, Any]:
+    """Connection and pool state for the default database in this worker."""
+    connection = connections["default"]
+    return {
+        "vendor": connection.vendor,
+        "connected": connection.connection is not None,
+        "conn_max_age": connection.settings_dict.get("CONN_MAX_AGE", 0),
+        "pool": pool_stats("default") or None,
+    }
+
+
+def warm_up() -> None:
+    """Compile hot templates once per worker."""
+    global _warmed_at
+    if _warmed_at is not None:
+        return
+    for name in WARM_TEMPLATES:
+        get_template(name)
+    _warmed_at = time.time()
+
+
+def worker_state() -> dict[str, Any]:
+    return {
+        "warm": _warmed_at is not None,
+        "warmed_in_s": (
+            round(_warmed_at - PROCESS_STARTED, 2) if _warmed_at is not None else None
+        ),
+        "uptime_s": round(time.time() - PROCESS_STARTED, 1),
+    }
+
+
+def _run_checks() -> dict[str, Any]:
+    checks = {
+        "database": check_database(),
+        "baml": check_baml(),
+        "tmdb": check_tmdb(),
+    }
+    if checks["database"] != "ok":
+        status = "unavailable"
+    elif any(value != "ok" for value in checks.values()):
+        status = "degraded"
+    else:
+        status = "ready"
+    return {"status": status, "checks": checks, "checked_at": time.time()}
+
+
+def readiness(force: bool = False) -> dict[str, Any]:
+    """
+    Dependency status, re-checked at most every ``HEALTH_READY_TTL`` seconds.
+
+    Args:
+        force: Ignore the cache and re-run the checks
+
+    Returns:
+        Dict with overall status, per-dependency checks, cache age, worker
+        warm-up state and connection stats
+    """
+    global _cached, _cached_at
+    with _lock:
+        now = time.monotonic()
+        if force or _cached is None or now - _cached_at >= settings.HEALTH_READY_TTL:
+            warm_up()
+            _cached = _run_checks()
+            _cached_at = now
+        result = dict(_cached)
+        result["cache_age_s"] = round(now - _cached_at, 1)
+
+    result["worker"] = worker_state()
+    result["connections"] = connection_stats()
+    return result
+
+
+def reset() -> None:
+    """Drop cached readiness (for tests)."""
+    global _cached, _cached_at
+    with _lock:
+        _cached = None
+        _cached_at = 0.0
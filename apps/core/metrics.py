@@ -0,0 +1,290 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+A deliberately small registry (counters, gauges, histograms with labels)
+so instrumentation has no extra dependency. Values are per process: with
+several gunicorn workers, each scrape sees the worker that served it.
+"""
+
+import math
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LLM_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [
+        f'{name}="{_escape(str(value))}"'
+        for name, value in zip(names, values, strict=True)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def expose(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Metric):
+    """
+    Gauge set directly or computed from ``callback`` at scrape time.
+
+    A callback returns a number, or for labelled gauges a dict mapping label
+    values (a tuple, or a plain value for a single label) to numbers.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Iterable[str] = (),
+        callback: Callable[[], Any] | None = None,
+    ):
+        super().__init__(name, help_text, labels)
+        self._values: dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        if self._callback is not None:
+            value = self._callback()
+            if isinstance(value, dict):
+                key = self._key(labels)
+                return value.get(key[0] if len(key) == 1 else key, 0.0)
+            return value
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        if self._callback is not None:
+            value = self._callback()
+            if not isinstance(value, dict):
+                return [f"{self.name} {_format_value(value)}"]
+            # Labelled callbacks return {label value(s): sample}
+            items = sorted(
+                (key if isinstance(key, tuple) else (key,), sample)
+                for key, sample in value.items()
+            )
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> (bucket counts, sum, count)
+        self._values: dict[LabelValues, tuple[list[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(
+                key, ([0] * len(self.buckets), 0.0, 0)
+            )
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: str) -> int:
+        return self._values.get(self._key(labels), ([], 0.0, 0))[2]
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self._values.items()
+            )
+        lines = []
+        label_names = (*self.label_names, "le")
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(label_names, (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labels))  # type: ignore[return-value]
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        labels: Iterable[str] = (),
+        callback: Callable[[], Any] | None = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, help_text, labels, callback))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, help_text, labels, buckets))  # type: ignore[return-value]
+
+    def expose(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "\n".join(metric.expose() for metric in metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+# =============================================================================
+# SHARED METRICS
+# =============================================================================
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total", "HTTP responses by view and status.", ["view", "status"]
+)
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "Request latency by view.", ["view"]
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight", "Requests currently being handled."
+)
+DEPENDENCY_DURATION = REGISTRY.histogram(
+    "dependency_duration_seconds",
+    "Time spent in db, llm, tmdb and template work.",
+    ["dependency"],
+    buckets=DEFAULT_BUCKETS + (20.0, 30.0),
+)
+LLM_DURATION = REGISTRY.histogram(
+    "llm_call_duration_seconds",
+    "BAML function latency.",
+    ["function", "outcome"],
+    buckets=LLM_BUCKETS,
+)
+SEARCH_CACHE_LOOKUPS = REGISTRY.counter(
+    "search_cache_lookups_total", "Character search cache lookups.", ["result"]
+)
+BACKGROUND_TASKS_IN_FLIGHT = REGISTRY.gauge(
+    "background_tasks_in_flight",
+    "Background jobs (e.g. thumbnail fetches) queued or running.",
+    ["task"],
+)
+THREADS_ACTIVE = REGISTRY.gauge(
+    "process_threads_active",
+    "Live Python threads in this worker.",
+    callback=lambda: threading.active_count(),
+)
+
+
+def _pool_stats() -> dict[str, float]:
+    from .db import pool_stats
+
+    return pool_stats("default")
+
+
+DB_POOL = REGISTRY.gauge(
+    "db_pool",
+    "psycopg pool statistics for the default database (see psycopg_pool docs).",
+    ["stat"],
+    callback=_pool_stats,
+)
@@ -0,0 +1,86 @@
+"""Core middleware."""
+
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS, HTTP_REQUESTS_IN_FLIGHT
+from .routers import replica_alias, request_scope
+from .timing import query_timer, request_timings
+
+
+class ServerTimingMiddleware:
+    """
+    Time each request and its dependencies.
+
+    Adds a ``Server-Timing`` header (visible in browser devtools) breaking
+    the response time down into db, llm, tmdb and template work, and
+    records request metrics for the ``/metrics/`` endpoint.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        begin = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                timings = stack.enter_context(request_timings())
+                # Wrappers are per thread-local DatabaseWrapper and apply
+                # whether or not the connection has been opened yet.
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(query_timer))
+                response = self.get_response(request)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+
+        total = time.perf_counter() - begin
+        view = _view_label(request)
+        HTTP_REQUESTS.inc(view=view, status=str(response.status_code))
+        HTTP_REQUEST_DURATION.observe(total, view=view)
+        response["Server-Timing"] = timings.header(total)
+        return response
+
+
+def _view_label(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    return match.view_name or "unnamed"
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Read-your-writes with a read replica.
+
+    A request that writes a catalog model reads it from the primary for the
+    rest of the request (see apps.core.routers), and gets a short-lived
+    cookie that keeps the client's catalog reads on the primary for
+    ``REPLICA_STICKY_SECONDS``, until the replica has caught up. The cookie
+    only moves that client's own reads, so it needn't be signed.
+    """
+
+    cookie_name = "primary_reads"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if replica_alias() is None:
+            return self.get_response(request)
+
+        with request_scope(pinned=self.cookie_name in request.COOKIES) as wrote:
+            response = self.get_response(request)
+            if wrote():
+                response.set_cookie(
+                    self.cookie_name,
+                    "1",
+                    max_age=settings.REPLICA_STICKY_SECONDS,
+                    secure=settings.SESSION_COOKIE_SECURE,
+                    httponly=True,
+                    samesite="Lax",
+                )
+        return response
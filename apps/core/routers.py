@@ -0,0 +1,137 @@
+"""
+Read-replica routing for catalog traffic.
+
+When ``DATABASE_REPLICA_URL`` is set, reads of the catalog models go to the
+``replica`` database and everything else (all writes, and reads of every
+other model) stays on ``default``. Catalog reads return to the primary:
+
+- inside a transaction on the primary, so a transaction sees its own work;
+- for the rest of a request after it writes a catalog model, and for
+  ``REPLICA_STICKY_SECONDS`` afterwards for the same client (see
+  ``ReplicaStickinessMiddleware``), so users read their own writes despite
+  replication lag;
+- inside ``read_primary()``, for read-then-write code paths;
+- for ``REPLICA_RETRY_SECONDS`` after the replica fails to connect.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Models whose reads may be served by the replica ("app_label.model_name")
+CATALOG_MODELS = {"characters.character"}
+
+REPLICA_READS = REGISTRY.counter(
+    "db_replica_reads_total",
+    "Catalog reads routed by database and reason.",
+    ["database", "reason"],
+)
+
+# Set once the current request (or read_primary block) must see the primary
+_pinned: ContextVar[bool] = ContextVar("replica_pinned", default=False)
+# Set when the current request wrote a catalog model
+_wrote: ContextVar[bool] = ContextVar("replica_wrote", default=False)
+
+_down_until = 0.0
+_down_lock = threading.Lock()
+
+
+def pin_to_primary() -> None:
+    """Read catalog models from the primary for the rest of this context."""
+    _pinned.set(True)
+
+
+@contextmanager
+def read_primary():
+    """Read catalog models from the primary inside the block."""
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+@contextmanager
+def request_scope(pinned: bool = False):
+    """
+    Fresh pinning state for one request. Yields a callable returning
+    whether the request wrote a catalog model.
+    """
+    pinned_token = _pinned.set(pinned)
+    wrote_token = _wrote.set(False)
+    try:
+        yield _wrote.get
+    finally:
+        _wrote.reset(wrote_token)
+        _pinned.reset(pinned_token)
+
+
+def replica_alias() -> str | None:
+    return settings.READ_REPLICA or None
+
+
+def _replica_available(alias: str) -> bool:
+    """Connect to the replica if needed; after a failure, skip it for a while."""
+    global _down_until
+    if time.monotonic() < _down_until:
+        return False
+    try:
+        connections[alias].ensure_connection()
+    except Exception as e:
+        with _down_lock:
+            _down_until = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+        logger.warning(f"Read replica unavailable, using the primary: {e}")
+        return False
+    return True
+
+
+def reset_replica_state() -> None:
+    """Forget a recorded replica failure (tests)."""
+    global _down_until
+    _down_until = 0.0
+
+
+def _is_catalog(model) -> bool:
+    return model._meta.label_lower in CATALOG_MODELS
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replica = replica_alias()
+        if replica is None or not _is_catalog(model):
+            return None
+        if _pinned.get():
+            reason = "pinned"
+        elif connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            reason = "transaction"
+        elif not _replica_available(replica):
+            reason = "unavailable"
+        else:
+            REPLICA_READS.inc(database=replica, reason="replica")
+            return replica
+        REPLICA_READS.inc(database=DEFAULT_DB_ALIAS, reason=reason)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        if replica_alias() is None:
+            return None
+        if _is_catalog(model):
+            _wrote.set(True)
+            _pinned.set(True)
+        # Explicit, or saving an instance read from the replica would write there
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both databases hold the same data
+        if replica_alias() is not None:
+            return True
+        return None
@@ -0,0 +1,47 @@
+"""
+Database sessions read through a short-lived per-process cache.
+
+Django's ``cached_db`` backend keeps each session in the cache for its whole
+lifetime. With a local-memory cache in every worker, a logout or session
+flush handled by one worker would go unnoticed by the others until then.
+This backend caps each worker's copy at ``SESSION_LOCAL_CACHE_TTL`` seconds,
+so requests carrying a session cookie usually skip Postgres while other
+workers still notice changes soon after they happen.
+
+Enabled with ``SESSION_STORE=cached_db`` (see config/settings.py).
+"""
+
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+
+
+class _CappedCache:
+    """Cache wrapper limiting every entry's timeout to ``ttl`` seconds."""
+
+    def __init__(self, cache, ttl: int):
+        self._cache = cache
+        self._ttl = ttl
+
+    def _timeout(self, timeout) -> int:
+        return self._ttl if timeout is None else min(timeout, self._ttl)
+
+    def set(self, key, value, timeout=None):
+        self._cache.set(key, value, self._timeout(timeout))
+
+    async def aset(self, key, value, timeout=None):
+        await self._cache.aset(key, value, self._timeout(timeout))
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __getattr__(self, name):
+        return getattr(self._cache, name)
+
+    def __str__(self):
+        return str(self._cache)
+
+
+class SessionStore(cached_db.SessionStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._cache = _CappedCache(self._cache, settings.SESSION_LOCAL_CACHE_TTL)
@@ -31,3 +31,458 @@ class TestHealthCheck:
         data = response.json()
         assert "database" in data
         assert data["database"] == "ok"
+
+
+@pytest.mark.django_db
+class TestServerTiming:
+    """Tests for the Server-Timing middleware."""
+
+    def test_response_has_server_timing_header(self, client: Client):
+        """Every response carries a Server-Timing header with a total."""
+        response = client.get("/health/")
+        assert "total;dur=" in response["Server-Timing"]
+
+    def test_database_time_is_reported(self, client: Client):
+        """Queries made by the view show up as db timing."""
+        response = client.get("/health/")
+        assert "db;dur=" in response["Server-Timing"]
+
+    def test_template_time_is_reported(self, client: Client):
+        """Template renders show up as template timing."""
+        response = client.get("/characters/")
+        assert "template;dur=" in response["Server-Timing"]
+
+    def test_timer_outside_request_only_feeds_metrics(self):
+        """Timers in background threads don't need a request."""
+        from apps.core.metrics import DEPENDENCY_DURATION
+        from apps.core.timing import timer
+
+        before = DEPENDENCY_DURATION.count(dependency="tmdb")
+        with timer("tmdb"):
+            pass
+        assert DEPENDENCY_DURATION.count(dependency="tmdb") == before + 1
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    """Tests for the Prometheus metrics endpoint."""
+
+    def test_metrics_returns_prometheus_text(self, client: Client):
+        """Metrics are served in Prometheus text format."""
+        client.get("/health/")
+        response = client.get("/metrics/")
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        body = response.content.decode()
+        assert "# TYPE http_requests_total counter" in body
+        assert 'http_requests_total{view="core:health_check",status="200"}' in body
+        assert "process_threads_active" in body
+
+    def test_metrics_requires_token_when_configured(self, client: Client, settings):
+        """METRICS_TOKEN protects the endpoint."""
+        settings.METRICS_TOKEN = "secret"
+        assert client.get("/metrics/").status_code == 401
+        response = client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == 200
+
+    def test_histogram_exposition(self):
+        """Histograms expose cumulative buckets, sum and count."""
+        from apps.core.metrics import Histogram
+
+        histogram = Histogram("test_seconds", "Test.", ["kind"], buckets=(0.1, 1.0))
+        histogram.observe(0.05, kind="a")
+        histogram.observe(0.5, kind="a")
+        lines = histogram.samples()
+        assert 'test_seconds_bucket{kind="a",le="0.1"} 1' in lines
+        assert 'test_seconds_bucket{kind="a",le="1"} 2' in lines
+        assert 'test_seconds_bucket{kind="a",le="+Inf"} 2' in lines
+        assert 'test_seconds_count{kind="a"} 2' in lines
+
+
+class TestLiveness:
+    """Tests for the liveness probe."""
+
+    def test_liveness_touches_no_database(self, client: Client):
+        """Liveness needs no database access (pytest-django blocks it here)."""
+        response = client.get("/health/live/")
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+
+@pytest.mark.django_db
+class TestReadiness:
+    """Tests for the readiness probe."""
+
+    @pytest.fixture(autouse=True)
+    def reset_readiness(self):
+        from apps.core import health
+
+        health.reset()
+        yield
+        health.reset()
+
+    def test_readiness_reports_dependencies(self, client: Client, settings):
+        """Readiness reports database, BAML and TMDB status."""
+        settings.GOOGLE_API_KEY = "key"
+        settings.TMDB_API_KEY = "token"
+        data = client.get("/health/ready/").json()
+        assert data["status"] == "ready"
+        assert data["checks"] == {"database": "ok", "baml": "ok", "tmdb": "ok"}
+        assert data["worker"]["warm"] is True
+        assert "connected" in data["connections"]
+
+    def test_missing_config_is_degraded(self, client: Client, settings):
+        """Missing API keys degrade readiness without failing it."""
+        settings.GOOGLE_API_KEY = ""
+        settings.GEMINI_BASE_URL = ""
+        settings.TMDB_API_KEY = ""
+        response = client.get("/health/ready/")
+        assert response.status_code == 200
+        assert response.json()["status"] == "degraded"
+
+    def test_readiness_is_cached(
+        self, client: Client, settings, django_assert_num_queries
+    ):
+        """Probes within the TTL reuse the cached database check."""
+        settings.HEALTH_READY_TTL = 60
+        client.get("/health/ready/")
+        with django_assert_num_queries(0):
+            data = client.get("/health/ready/").json()
+        assert data["checks"]["database"] == "ok"
+
+    def test_force_bypasses_cache(
+        self, client: Client, settings, django_assert_num_queries
+    ):
+        """?force=1 re-runs the checks."""
+        settings.HEALTH_READY_TTL = 60
+        client.get("/health/ready/")
+        with django_assert_num_queries(1):
+            client.get("/health/ready/?force=1")
+
+    def test_database_failure_returns_503(self, client: Client, monkeypatch):
+        """An unreachable database makes the worker not ready."""
+        monkeypatch.setattr("apps.core.health.check_database", lambda: "error: down")
+        response = client.get("/health/ready/")
+        assert response.status_code == 503
+        assert response.json()["status"] == "unavailable"
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConnectionPooling:
+    """Tests for pooled connections and background thread cleanup."""
+
+    def test_default_database_is_pooled(self, settings):
+        """DB_POOL (on by default) configures Django's psycopg pool."""
+        from django.db import connection
+
+        if not settings.DB_POOL:
+            pytest.skip("DB_POOL disabled in this environment")
+        connection.ensure_connection()
+        assert connection.pool is not None
+
+    def test_background_task_releases_connection(self):
+        """Connections opened by background tasks are closed afterwards."""
+        from django.db import connection
+
+        from apps.core.background import run_in_background
+
+        used = []
+
+        def task():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            used.append(connection)
+
+        run_in_background("test", task).join(timeout=5)
+        assert used and used[0].connection is None
+
+    def test_pool_stats_in_metrics_and_readiness(self, client: Client, settings):
+        """Pool statistics are exported on /metrics/ and /health/ready/."""
+        if not settings.DB_POOL:
+            pytest.skip("DB_POOL disabled in this environment")
+        client.get("/health/")
+        assert 'db_pool{stat="pool_max"}' in client.get("/metrics/").content.decode()
+        data = client.get("/health/ready/?force=1").json()
+        assert data["connections"]["pool"]["pool_max"] >= 1
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    """Large results are counted from planner estimates, small ones exactly."""
+
+    def make_users(self, count):
+        from django.contrib.auth import get_user_model
+
+        User = get_user_model()
+        User.objects.bulk_create(User(username=f"user{i}") for i in range(count))
+        return User.objects.order_by("pk")
+
+    def test_small_results_are_exact(self):
+        from apps.core.pagination import EstimatedCountPaginator
+
+        users = self.make_users(5)
+        assert EstimatedCountPaginator(users, 2).count == 5
+        assert EstimatedCountPaginator(users.filter(username="user1"), 2).count == 1
+
+    def test_large_results_are_estimated(self, django_assert_num_queries):
+        from apps.core.pagination import EstimatedCountPaginator
+
+        users = self.make_users(50).filter(username__startswith="user")
+        paginator = EstimatedCountPaginator(users, 10)
+        paginator.exact_threshold = 0
+        # One EXPLAIN, no COUNT(*)
+        with django_assert_num_queries(1) as queries:
+            count = paginator.count
+        assert queries.captured_queries[0]["sql"].startswith("EXPLAIN")
+        assert count > 0
+
+    def test_unfiltered_uses_table_statistics(self):
+        from django.db import connection
+
+        from apps.core.pagination import estimate_count
+
+        users = self.make_users(20)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE auth_user")
+        assert estimate_count(users) == 20
+
+    def test_lists_are_counted(self):
+        from apps.core.pagination import EstimatedCountPaginator
+
+        assert EstimatedCountPaginator(list(range(7)), 2).count == 7
+
+
+def count_queries(client: Client, url: str) -> int:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(queries)
+
+
+SESSION_ENGINES = {
+    "cached_db": "apps.core.sessions",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+    "db": "django.contrib.sessions.backends.db",
+}
+
+
+@pytest.fixture(params=list(SESSION_ENGINES))
+def session_store(request, settings):
+    settings.SESSION_ENGINE = SESSION_ENGINES[request.param]
+    return request.param
+
+
+@pytest.mark.django_db
+class TestQueryFreePages:
+    """Public pages render for anonymous visitors without database work."""
+
+    @pytest.fixture
+    def character(self):
+        from apps.characters.models import Character
+
+        return Character.objects.create(
+            name="Flounder",
+            movie="The Little Mermaid (1989)",
+            category="Sidekick",
+            description="Ariel's loyal tropical fish friend.",
+        )
+
+    @pytest.mark.parametrize("url", ["/", "/outfits/", "/trips/"])
+    def test_anonymous_pages(self, client: Client, session_store, url):
+        assert count_queries(client, url) == 0
+
+    def test_character_detail_only_loads_the_character(
+        self, client: Client, session_store, character
+    ):
+        assert count_queries(client, f"/characters/{character.pk}/") == 1
+
+    def test_anonymous_session_cookie(self, client: Client, session_store):
+        """A visitor with an (anonymous) session only costs a query with "db"."""
+        from django.conf import settings
+
+        session = client.session
+        session["seen_intro"] = True
+        session.save()
+        assert session.session_key
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+
+        # cached_db: the session was cached when it was saved
+        expected = 1 if session_store == "db" else 0
+        assert count_queries(client, "/") == expected
+        assert count_queries(client, "/trips/") == expected
+
+    def test_logged_in_user(self, client: Client, session_store):
+        """Signed-in pages load the user; only "db" also loads the session."""
+        from django.contrib.auth import get_user_model
+
+        user = get_user_model().objects.create_user("ariel", "ariel@example.com")
+        client.force_login(user)
+        client.get("/")
+        assert count_queries(client, "/") == (2 if session_store == "db" else 1)
+
+
+@pytest.mark.django_db
+class TestCachedSessions:
+    """The cached_db backend's per-worker cache is short-lived."""
+
+    def make_session(self):
+        from apps.core.sessions import SessionStore
+
+        session = SessionStore()
+        session["seen_intro"] = True
+        session.save()
+        return session.session_key
+
+    def test_reads_from_cache(self):
+        from django.contrib.sessions.models import Session
+
+        from apps.core.sessions import SessionStore
+
+        key = self.make_session()
+        Session.objects.filter(session_key=key).delete()
+        # Still served from this worker's cache
+        assert SessionStore(key).load() == {"seen_intro": True}
+
+    def test_cache_lifetime_is_capped(self, settings):
+        from django.contrib.sessions.models import Session
+
+        from apps.core.sessions import SessionStore
+
+        settings.SESSION_LOCAL_CACHE_TTL = 0
+        key = self.make_session()
+        Session.objects.filter(session_key=key).delete()
+        assert SessionStore(key).load() == {}
+
+    def test_logout_clears_cache(self):
+        from apps.core.sessions import SessionStore
+
+        key = self.make_session()
+        SessionStore(key).flush()
+        assert SessionStore(key).load() == {}
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+class TestReplicaRouter:
+    """Catalog reads go to the replica unless the primary is needed."""
+
+    @pytest.fixture(autouse=True)
+    def replica(self, settings):
+        from apps.core.routers import request_scope, reset_replica_state
+
+        settings.READ_REPLICA = "replica"
+        reset_replica_state()
+        with request_scope():
+            yield
+        reset_replica_state()
+
+    def make_character(self, database, name):
+        from apps.characters.models import Character
+
+        return Character.objects.using(database).create(
+            name=name, movie="The Little Mermaid (1989)", category="Sidekick"
+        )
+
+    def names(self):
+        from apps.characters.models import Character
+
+        return set(Character.objects.values_list("name", flat=True))
+
+    def test_catalog_reads_use_replica(self):
+        from django.contrib.auth import get_user_model
+
+        self.make_character("default", "Flounder")
+        self.make_character("replica", "Sebastian")
+        assert self.names() == {"Sebastian"}
+
+        # Everything else stays on the primary
+        get_user_model().objects.create_user("ariel", "ariel@example.com")
+        assert get_user_model().objects.filter(username="ariel").exists()
+
+    def test_write_pins_the_rest_of_the_request(self):
+        from apps.characters.models import Character
+        from apps.core.routers import request_scope
+
+        self.make_character("replica", "Sebastian")
+        with request_scope() as wrote:
+            character = Character.objects.create(
+                name="Flounder", movie="The Little Mermaid (1989)", category="Sidekick"
+            )
+            assert wrote()
+            assert self.names() == {"Flounder"}
+            character.description = "Yellow and blue"
+            character.save()
+        assert Character.objects.using("default").get().description == (
+            "Yellow and blue"
+        )
+        # A new request reads from the replica again
+        with request_scope():
+            assert self.names() == {"Sebastian"}
+
+    def test_read_primary_and_transactions(self):
+        from django.db import transaction
+
+        from apps.core.routers import read_primary
+
+        self.make_character("default", "Flounder")
+        with read_primary():
+            assert self.names() == {"Flounder"}
+        with transaction.atomic():
+            assert self.names() == {"Flounder"}
+        assert self.names() == set()
+
+    def test_unavailable_replica_falls_back(self, monkeypatch):
+        from django.db import OperationalError, connections
+
+        from apps.core import routers
+
+        attempts = []
+
+        def refuse():
+            attempts.append(1)
+            raise OperationalError("connection refused")
+
+        monkeypatch.setattr(connections["replica"], "ensure_connection", refuse)
+        self.make_character("default", "Flounder")
+        assert self.names() == {"Flounder"}
+        assert self.names() == {"Flounder"}
+        # The failure is remembered for REPLICA_RETRY_SECONDS
+        assert len(attempts) == 1
+        assert routers.REPLICA_READS.value(database="default", reason="unavailable")
+
+    def test_sticky_cookie_after_write(self, client: Client, monkeypatch):
+        from types import SimpleNamespace
+
+        from apps.core.middleware import ReplicaStickinessMiddleware
+
+        class FakeClient:
+            def SearchCharacter(self, query):
+                return SimpleNamespace(
+                    found=True,
+                    name="Flounder",
+                    movie="The Little Mermaid (1989)",
+                    category="Sidekick",
+                    description="Ariel's loyal tropical fish friend.",
+                    colors=[],
+                    notFoundMessage=None,
+                )
+
+        monkeypatch.setattr("apps.characters.views.get_sync_client", FakeClient)
+        monkeypatch.setattr(
+            "apps.characters.views._start_thumbnail_fetch", lambda character: None
+        )
+        cookie = ReplicaStickinessMiddleware.cookie_name
+
+        assert client.get("/characters/1/").status_code == 404
+        response = client.post("/characters/search/", {"q": "flounder"})
+        assert response.cookies[cookie]["max-age"] == 10
+
+        # The character only exists on the primary, which the cookie selects
+        from apps.characters.models import Character
+
+        pk = Character.objects.using("default").get().pk
+        assert client.get(f"/characters/{pk}/").status_code == 200
+        del client.cookies[cookie]
+        assert client.get(f"/characters/{pk}/").status_code == 404
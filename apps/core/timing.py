@@ -0,0 +1,106 @@
+"""
+Request-scoped timers feeding Server-Timing headers and metrics.
+
+``ServerTimingMiddleware`` opens a ``RequestTimings`` for each request.
+Code that calls a slow dependency wraps it in ``timer("llm")`` (or
+``"tmdb"``, ``"db"``, ``"template"``); the duration is added to the current
+request's Server-Timing header and observed in ``dependency_duration_seconds``.
+Timers outside a request (background threads) only feed the histogram.
+"""
+
+import functools
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from .metrics import DEPENDENCY_DURATION
+
+DESCRIPTIONS = {
+    "db": "Postgres",
+    "llm": "Gemini (BAML)",
+    "tmdb": "TMDB API",
+    "template": "Template render",
+}
+
+
+@dataclass
+class RequestTimings:
+    """Accumulated dependency time (seconds) and call counts for one request."""
+
+    durations: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def header(self, total: float) -> str:
+        """Render a ``Server-Timing`` header value (durations in ms)."""
+        entries = []
+        for name, seconds in self.durations.items():
+            description = f"{DESCRIPTIONS.get(name, name)} x{self.counts[name]}"
+            entries.append(f'{name};dur={seconds * 1000:.1f};desc="{description}"')
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current.get()
+
+
+@contextmanager
+def request_timings() -> Iterator[RequestTimings]:
+    """Collect timers for the duration of a request."""
+    timings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def record(name: str, seconds: float) -> None:
+    DEPENDENCY_DURATION.observe(seconds, dependency=name)
+    timings = _current.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """Time the enclosed block as dependency ``name``."""
+    begin = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - begin)
+
+
+def query_timer(execute, sql, params, many, context):
+    """``connection.execute_wrapper`` hook timing every ORM query."""
+    with timer("db"):
+        return execute(sql, params, many, context)
+
+
+def instrument_templates() -> None:
+    """Time top-level renders made through the Django template backend."""
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, "timed", False):
+        return
+    original = Template.render
+
+    @functools.wraps(original)
+    def render(self, context=None, request=None):
+        with timer("template"):
+            return original(self, context, request)
+
+    render.timed = True  # type: ignore[attr-defined]
+    Template.render = render  # type: ignore[method-assign]
@@ -8,4 +8,7 @@ app_name = "core"
 
 urlpatterns = [
     path("health/", views.health_check, name="health_check"),
+    path("health/live/", views.liveness, name="liveness"),
+    path("health/ready/", views.readiness, name="readiness"),
+    path("metrics/", views.metrics, name="metrics"),
 ]
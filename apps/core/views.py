@@ -1,14 +1,19 @@
-"""Core views including health check endpoint."""
+"""Core views including health check and metrics endpoints."""
 
+from django.conf import settings
 from django.db import connection
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+
+from . import health
+from .metrics import REGISTRY
 
 
 def health_check(request):
     """
-    Health check endpoint for Fly.io.
+    Full health check that always queries the database.
 
-    Returns JSON with status and database connectivity.
+    Fly.io probes use ``liveness`` instead so the serverless database can
+    suspend. Returns JSON with status and database connectivity.
     Returns 200 if healthy, 503 if unhealthy.
     """
     checks = {
@@ -25,3 +30,41 @@ def health_check(request):
         return JsonResponse(checks, status=503)
 
     return JsonResponse(checks)
+
+
+def liveness(request):
+    """
+    Liveness probe: the worker is up and serving requests.
+
+    Touches no dependencies, so frequent probes never wake the database.
+    """
+    return JsonResponse(health.liveness())
+
+
+def readiness(request):
+    """
+    Readiness probe with cached dependency status.
+
+    Returns 200 when the database is reachable (``degraded`` if BAML or
+    TMDB are not configured), 503 otherwise. Pass ``?force=1`` to bypass
+    the HEALTH_READY_TTL cache.
+    """
+    result = health.readiness(force=request.GET.get("force") == "1")
+    status = 503 if result["status"] == "unavailable" else 200
+    return JsonResponse(result, status=status)
+
+
+def metrics(request):
+    """
+    Prometheus text-format metrics for this worker process.
+
+    If METRICS_TOKEN is set, requires ``Authorization: Bearer <token>``.
+    """
+    token = settings.METRICS_TOKEN
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponse(status=401)
+
+    return HttpResponse(
+        REGISTRY.expose(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
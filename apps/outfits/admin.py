@@ -1 +1,30 @@
-# Register your models here.
+from django.contrib import admin
+
+from .models import Outfit, OutfitItem
+from .services import refresh_summary
+
+
+class OutfitItemInline(admin.TabularInline):
+    model = OutfitItem
+    extra = 0
+    raw_id_fields = ["character"]
+
+
+@admin.register(Outfit)
+class OutfitAdmin(admin.ModelAdmin):
+    list_display = ["name", "user", "character", "item_count", "updated_at"]
+    list_select_related = ["user", "character"]
+    search_fields = ["name"]
+    raw_id_fields = ["user", "character"]
+    readonly_fields = [
+        "color_summary",
+        "character_summary",
+        "item_count",
+        "created_at",
+        "updated_at",
+    ]
+    inlines = [OutfitItemInline]
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        refresh_summary(form.instance)
@@ -0,0 +1,135 @@
+# Generated by Django 6.0.1 on 2026-10-19 01:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("characters", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Outfit",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("notes", models.TextField(blank=True)),
+                (
+                    "color_summary",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Item hex colors in item order",
+                    ),
+                ),
+                (
+                    "character_summary",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="[{id, name}] of referenced characters",
+                    ),
+                ),
+                ("item_count", models.PositiveSmallIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "character",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Main character inspiration",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="outfits",
+                        to="characters.character",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="outfits",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-updated_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="OutfitItem",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "item_type",
+                    models.CharField(
+                        choices=[
+                            ("top", "Top"),
+                            ("bottom", "Bottom"),
+                            ("dress", "Dress"),
+                            ("jacket", "Jacket"),
+                            ("shoes", "Shoes"),
+                            ("accessory", "Accessory"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("description", models.CharField(max_length=255)),
+                ("color_name", models.CharField(blank=True, max_length=100)),
+                ("color_hex", models.CharField(blank=True, max_length=7)),
+                ("product_url", models.URLField(blank=True, max_length=500)),
+                ("image_url", models.URLField(blank=True, max_length=500)),
+                ("position", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "character",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="characters.character",
+                    ),
+                ),
+                (
+                    "outfit",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="items",
+                        to="outfits.outfit",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position", "id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="outfit",
+            index=models.Index(
+                fields=["user", "-updated_at"], name="outfit_user_updated_idx"
+            ),
+        ),
+    ]
@@ -1 +1,90 @@
-# Create your models here.
+from django.conf import settings
+from django.db import models
+
+from apps.characters.models import Character
+
+
+class Outfit(models.Model):
+    """A Disneybound outfit: a set of clothing items inspired by characters."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="outfits",
+    )
+    name = models.CharField(max_length=255)
+    character = models.ForeignKey(
+        Character,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="outfits",
+        help_text="Main character inspiration",
+    )
+    notes = models.TextField(blank=True)
+
+    # Denormalized from items on write (see services.refresh_summary) so
+    # list cards render without joining OutfitItem.
+    color_summary = models.JSONField(
+        default=list, blank=True, help_text="Item hex colors in item order"
+    )
+    character_summary = models.JSONField(
+        default=list, blank=True, help_text="[{id, name}] of referenced characters"
+    )
+    item_count = models.PositiveSmallIntegerField(default=0)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-updated_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "-updated_at"], name="outfit_user_updated_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class OutfitItem(models.Model):
+    """A single clothing item within an outfit."""
+
+    class ItemType(models.TextChoices):
+        TOP = "top", "Top"
+        BOTTOM = "bottom", "Bottom"
+        DRESS = "dress", "Dress"
+        JACKET = "jacket", "Jacket"
+        SHOES = "shoes", "Shoes"
+        ACCESSORY = "accessory", "Accessory"
+
+    outfit = models.ForeignKey(Outfit, on_delete=models.CASCADE, related_name="items")
+    item_type = models.CharField(max_length=20, choices=ItemType.choices)
+    description = models.CharField(max_length=255)
+
+    # Color this item contributes to the bound
+    color_name = models.CharField(max_length=100, blank=True)
+    color_hex = models.CharField(max_length=7, blank=True)
+
+    # Character this piece evokes (defaults to the outfit's character)
+    character = models.ForeignKey(
+        Character,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
+    # Optional shopping/visual links
+    product_url = models.URLField(max_length=500, blank=True)
+    image_url = models.URLField(max_length=500, blank=True)
+
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ["position", "id"]
+
+    def __str__(self):
+        return f"{self.get_item_type_display()}: {self.description}"
@@ -0,0 +1,123 @@
+"""
+Outfit write paths.
+
+All item changes go through these functions so the denormalized
+``color_summary``/``character_summary``/``item_count`` on Outfit stay in
+sync with its items.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.db import transaction
+
+from apps.characters.models import Character
+
+from .models import Outfit, OutfitItem
+
+
+def build_summary(
+    items: Iterable[OutfitItem], character: Character | None
+) -> dict[str, Any]:
+    """
+    Compute an outfit's denormalized summary fields.
+
+    Args:
+        items: The outfit's items, in display order
+        character: The outfit's main character, if any
+
+    Returns:
+        Dict of Outfit field values (color_summary, character_summary,
+        item_count)
+    """
+    items = list(items)
+    colors: list[str] = []
+    for item in items:
+        hex_code = item.color_hex.upper()
+        if hex_code and hex_code not in colors:
+            colors.append(hex_code)
+
+    characters: list[dict[str, Any]] = []
+    seen: set[int] = set()
+    for candidate in [character, *(item.character for item in items)]:
+        if candidate is not None and candidate.pk not in seen:
+            seen.add(candidate.pk)
+            characters.append({"id": candidate.pk, "name": candidate.name})
+
+    if not colors and character is not None:
+        colors = [
+            color["hex"].upper() for color in character.colors if color.get("hex")
+        ]
+
+    return {
+        "color_summary": colors,
+        "character_summary": characters,
+        "item_count": len(items),
+    }
+
+
+def refresh_summary(outfit: Outfit) -> Outfit:
+    """Recompute and save an outfit's summary from the database."""
+    items = outfit.items.select_related("character")
+    for field, value in build_summary(items, outfit.character).items():
+        setattr(outfit, field, value)
+    outfit.save(
+        update_fields=["color_summary", "character_summary", "item_count", "updated_at"]
+    )
+    return outfit
+
+
+@transaction.atomic
+def create_outfit(
+    user,
+    name: str,
+    items: list[dict[str, Any]],
+    character: Character | None = None,
+    notes: str = "",
+) -> Outfit:
+    """
+    Create an outfit and its items in one transaction.
+
+    Args:
+        user: Owner
+        name: Outfit name
+        items: Dicts of OutfitItem field values, in display order
+        character: Main character inspiration
+        notes: Free-form notes
+
+    Returns:
+        The saved Outfit with summary fields populated
+    """
+    item_objects = [
+        OutfitItem(position=position, **{"character": character, **item})
+        for position, item in enumerate(items)
+    ]
+    outfit = Outfit.objects.create(
+        user=user,
+        name=name,
+        character=character,
+        notes=notes,
+        **build_summary(item_objects, character),
+    )
+    for item in item_objects:
+        item.outfit = outfit
+    OutfitItem.objects.bulk_create(item_objects)
+    return outfit
+
+
+@transaction.atomic
+def add_item(outfit: Outfit, **fields: Any) -> OutfitItem:
+    """Append an item to an outfit and refresh its summary."""
+    fields.setdefault("character", outfit.character)
+    fields.setdefault("position", outfit.item_count)
+    item = OutfitItem.objects.create(outfit=outfit, **fields)
+    refresh_summary(outfit)
+    return item
+
+
+@transaction.atomic
+def remove_item(item: OutfitItem) -> None:
+    """Delete an item and refresh its outfit's summary."""
+    outfit = item.outfit
+    item.delete()
+    refresh_summary(outfit)
@@ -1 +1,197 @@
-# Create your tests here.
+"""Tests for the outfit builder."""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from apps.characters.models import Character
+
+from .models import Outfit, OutfitItem
+from .services import add_item, create_outfit, remove_item
+
+
+@pytest.fixture
+def user(db):
+    return get_user_model().objects.create_user(
+        username="belle", email="belle@example.com", password="password"
+    )
+
+
+@pytest.fixture
+def auth_client(client: Client, user):
+    client.force_login(user)
+    return client
+
+
+@pytest.fixture
+def flounder(db):
+    return Character.objects.create(
+        name="Flounder",
+        movie="The Little Mermaid (1989)",
+        category="Sidekick",
+        description="Ariel's loyal tropical fish friend.",
+        colors=[
+            {"hex": "#ffd700", "name": "Yellow", "usage": "Body"},
+            {"hex": "#1E90FF", "name": "Blue", "usage": "Stripes"},
+        ],
+    )
+
+
+def make_outfit(user, character, item_count, name="Outfit"):
+    return create_outfit(
+        user,
+        name=name,
+        character=character,
+        items=[
+            {
+                "item_type": "top",
+                "description": f"Item {index}",
+                "color_hex": f"#{index:06X}",
+            }
+            for index in range(item_count)
+        ],
+    )
+
+
+def count_queries(client: Client, url: str) -> int:
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(queries)
+
+
+@pytest.mark.django_db
+class TestOutfitSummary:
+    """The denormalized summary follows item writes."""
+
+    def test_create_populates_summary(self, user, flounder):
+        outfit = create_outfit(
+            user,
+            name="Fishy",
+            character=flounder,
+            items=[
+                {
+                    "item_type": "top",
+                    "description": "Yellow tee",
+                    "color_hex": "#ffd700",
+                },
+                {
+                    "item_type": "bottom",
+                    "description": "Blue jeans",
+                    "color_hex": "#1E90FF",
+                },
+                {
+                    "item_type": "shoes",
+                    "description": "Yellow flats",
+                    "color_hex": "#FFD700",
+                },
+            ],
+        )
+        assert outfit.item_count == 3
+        assert outfit.color_summary == ["#FFD700", "#1E90FF"]
+        assert outfit.character_summary == [{"id": flounder.pk, "name": "Flounder"}]
+
+    def test_falls_back_to_character_palette(self, user, flounder):
+        outfit = create_outfit(
+            user,
+            name="Plain",
+            character=flounder,
+            items=[{"item_type": "top", "description": "Tee"}],
+        )
+        assert outfit.color_summary == ["#FFD700", "#1E90FF"]
+
+    def test_add_and_remove_item_refresh_summary(self, user, flounder):
+        outfit = make_outfit(user, flounder, 1)
+        item = add_item(
+            outfit, item_type="accessory", description="Bow", color_hex="#FF0000"
+        )
+        outfit.refresh_from_db()
+        assert outfit.item_count == 2
+        assert "#FF0000" in outfit.color_summary
+
+        remove_item(item)
+        outfit.refresh_from_db()
+        assert outfit.item_count == 1
+        assert "#FF0000" not in outfit.color_summary
+
+
+@pytest.mark.django_db
+class TestOutfitQueryCounts:
+    """List and detail pages render in a fixed number of queries."""
+
+    def test_list_is_constant(self, auth_client, user, flounder):
+        make_outfit(user, flounder, 1)
+        small = count_queries(auth_client, "/outfits/")
+
+        for index in range(10):
+            make_outfit(user, flounder, 8, name=f"Outfit {index}")
+        large = count_queries(auth_client, "/outfits/")
+
+        assert small == large
+        # user, COUNT(*), outfits (the session is cached)
+        assert large == 3
+
+    def test_list_never_joins_items(self, auth_client, user, flounder):
+        make_outfit(user, flounder, 5)
+        with CaptureQueriesContext(connection) as queries:
+            auth_client.get("/outfits/")
+        assert not any("outfits_outfititem" in query["sql"] for query in queries)
+
+    def test_detail_is_constant(self, auth_client, user, flounder):
+        few = make_outfit(user, flounder, 1)
+        many = make_outfit(user, flounder, 12)
+
+        small = count_queries(auth_client, f"/outfits/{few.pk}/")
+        large = count_queries(auth_client, f"/outfits/{many.pk}/")
+
+        assert small == large
+        # user, outfit + character, items + characters (the session is cached)
+        assert large == 3
+
+
+@pytest.mark.django_db
+class TestOutfitViews:
+    def test_anonymous_list_prompts_sign_in(self, client: Client):
+        response = client.get("/outfits/")
+        assert b"Sign in to save outfits" in response.content
+
+    def test_create_outfit(self, auth_client, user, flounder):
+        response = auth_client.post(
+            "/outfits/create/",
+            {
+                "name": "Fishy",
+                "character": flounder.pk,
+                "item_type[]": ["top", "bottom"],
+                "item_description[]": ["Yellow tee", "Blue jeans"],
+                "item_color_name[]": ["Yellow", "Blue"],
+                "item_color_hex[]": ["#ffd700", "not-a-color"],
+            },
+        )
+        outfit = Outfit.objects.get(user=user)
+        assert response.status_code == 302
+        assert response["Location"] == f"/outfits/{outfit.pk}/"
+        assert outfit.item_count == 2
+        assert list(outfit.items.values_list("color_hex", flat=True)) == ["#FFD700", ""]
+        assert OutfitItem.objects.filter(character=flounder).count() == 2
+
+    def test_create_requires_items(self, auth_client, user):
+        response = auth_client.post("/outfits/create/", {"name": "Empty"})
+        assert b"Add at least one item" in response.content
+        assert not Outfit.objects.exists()
+
+    def test_other_users_outfits_are_hidden(self, client: Client, user, flounder):
+        outfit = make_outfit(user, flounder, 1)
+        other = get_user_model().objects.create_user(
+            username="gaston", email="gaston@example.com", password="password"
+        )
+        client.force_login(other)
+        assert client.get(f"/outfits/{outfit.pk}/").status_code == 404
+
+    def test_delete_outfit(self, auth_client, user, flounder):
+        outfit = make_outfit(user, flounder, 2)
+        response = auth_client.post(f"/outfits/{outfit.pk}/delete/")
+        assert response.status_code == 302
+        assert not Outfit.objects.exists()
+        assert not OutfitItem.objects.exists()
@@ -1,18 +1,12 @@
 from django.urls import path
-from django.views.generic import TemplateView
+
+from . import views
 
 app_name = "outfits"
 
 urlpatterns = [
-    path("", TemplateView.as_view(template_name="outfits/list.html"), name="list"),
-    path(
-        "create/",
-        TemplateView.as_view(template_name="outfits/create.html"),
-        name="create",
-    ),
-    path(
-        "<int:pk>/",
-        TemplateView.as_view(template_name="outfits/detail.html"),
-        name="detail",
-    ),
+    path("", views.outfit_list, name="list"),
+    path("create/", views.outfit_create, name="create"),
+    path("<int:pk>/", views.outfit_detail, name="detail"),
+    path("<int:pk>/delete/", views.outfit_delete, name="delete"),
 ]
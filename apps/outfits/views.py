@@ -1 +1,136 @@
-# Create your views here.
+import re
+
+from django.contrib.auth.decorators import login_required
+from django.core.paginator import Paginator
+from django.db.models import Prefetch
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.views.decorators.http import require_http_methods
+
+from apps.characters.models import Character
+
+from .models import Outfit, OutfitItem
+from .services import create_outfit
+
+OUTFITS_PER_PAGE = 24
+# Characters offered in the create form's dropdown
+CHARACTER_CHOICES_LIMIT = 200
+
+HEX_PATTERN = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+# Columns the list cards need; everything else stays in the database
+LIST_FIELDS = [
+    "id",
+    "name",
+    "color_summary",
+    "character_summary",
+    "item_count",
+    "updated_at",
+]
+
+
+def outfit_list(request: HttpRequest) -> HttpResponse:
+    """
+    The user's outfits as cards.
+
+    Cards render from the denormalized summary columns, so this is one
+    query for the page (plus one COUNT) regardless of how many items each
+    outfit has.
+    """
+    page = None
+    if request.user.is_authenticated:
+        outfits = Outfit.objects.filter(user=request.user).only(*LIST_FIELDS)
+        page = Paginator(outfits, OUTFITS_PER_PAGE).get_page(request.GET.get("page"))
+
+    return render(request, "outfits/list.html", {"page": page})
+
+
+@login_required
+def outfit_detail(request: HttpRequest, pk: int) -> HttpResponse:
+    """An outfit with its items: two queries however many items it has."""
+    items = OutfitItem.objects.select_related("character")
+    outfit = get_object_or_404(
+        Outfit.objects.select_related("character").prefetch_related(
+            Prefetch("items", queryset=items)
+        ),
+        pk=pk,
+        user=request.user,
+    )
+    return render(request, "outfits/detail.html", {"outfit": outfit})
+
+
+def _parse_items(request: HttpRequest) -> list[dict]:
+    """Read the repeated item_* form fields into OutfitItem field dicts."""
+    types = request.POST.getlist("item_type[]")
+    descriptions = request.POST.getlist("item_description[]")
+    color_names = request.POST.getlist("item_color_name[]")
+    color_hexes = request.POST.getlist("item_color_hex[]")
+
+    items = []
+    valid_types = set(OutfitItem.ItemType.values)
+    for index, (item_type, description) in enumerate(zip(types, descriptions)):
+        description = description.strip()
+        if not description or item_type not in valid_types:
+            continue
+        color_hex = color_hexes[index].strip() if index < len(color_hexes) else ""
+        items.append(
+            {
+                "item_type": item_type,
+                "description": description[:255],
+                "color_name": (
+                    color_names[index].strip()[:100] if index < len(color_names) else ""
+                ),
+                "color_hex": color_hex.upper() if HEX_PATTERN.match(color_hex) else "",
+            }
+        )
+    return items
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def outfit_create(request: HttpRequest) -> HttpResponse:
+    """Create an outfit from a character and a list of items."""
+    selected = request.POST.get("character") or request.GET.get("character") or ""
+    character = None
+    if selected.isdigit():
+        character = Character.objects.filter(pk=selected).first()
+
+    error = None
+    if request.method == "POST":
+        name = request.POST.get("name", "").strip()
+        items = _parse_items(request)
+        if not name:
+            error = "Please give your outfit a name."
+        elif not items:
+            error = "Add at least one item with a description."
+        else:
+            outfit = create_outfit(
+                request.user,
+                name=name[:255],
+                items=items,
+                character=character,
+                notes=request.POST.get("notes", "").strip(),
+            )
+            return redirect("outfits:detail", pk=outfit.pk)
+
+    characters = Character.objects.order_by("name").only("id", "name", "movie")[
+        :CHARACTER_CHOICES_LIMIT
+    ]
+    return render(
+        request,
+        "outfits/create.html",
+        {
+            "characters": characters,
+            "selected_character": character,
+            "item_types": OutfitItem.ItemType.choices,
+            "error": error,
+        },
+    )
+
+
+@login_required
+@require_http_methods(["POST"])
+def outfit_delete(request: HttpRequest, pk: int) -> HttpResponse:
+    outfit = get_object_or_404(Outfit, pk=pk, user=request.user)
+    outfit.delete()
+    return redirect("outfits:list")
@@ -1 +1,32 @@
-# Register your models here.
+from django.contrib import admin
+
+from . import color_index
+from .models import CrawlPage, Product
+from .services import set_color_features
+
+
+@admin.register(Product)
+class ProductAdmin(admin.ModelAdmin):
+    list_display = [
+        "name",
+        "retailer",
+        "item_type",
+        "color_name",
+        "price",
+        "updated_at",
+    ]
+    list_filter = ["item_type", "retailer"]
+    search_fields = ["name", "brand", "url"]
+    readonly_fields = ["lab_l", "lab_a", "lab_b", "created_at", "updated_at"]
+
+    def save_model(self, request, obj, form, change):
+        set_color_features([obj])
+        super().save_model(request, obj, form, change)
+        color_index.notify([obj])
+
+
+@admin.register(CrawlPage)
+class CrawlPageAdmin(admin.ModelAdmin):
+    list_display = ["url", "status_code", "fetched_at", "changed_at"]
+    list_filter = ["status_code", "host"]
+    search_fields = ["url"]
@@ -0,0 +1,235 @@
+"""
+In-memory color index over the product catalog.
+
+Product CIELAB features are held in contiguous NumPy arrays, one row per
+channel, so ranking tens of thousands of products against a character
+palette is a handful of vectorized passes per palette color. Each process
+builds the index once on first use, then applies incremental updates:
+``upsert_products`` pushes new rows directly, and ``get_color_index`` picks
+up other processes' writes by re-reading rows changed since its
+``updated_at`` watermark every ``COLOR_INDEX_REFRESH`` seconds.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+from django.conf import settings
+
+from apps.outfits.models import OutfitItem
+
+# Item type codes; 0 is "unknown"
+ITEM_TYPES = ["", *OutfitItem.ItemType.values]
+_TYPE_CODES = {item_type: code for code, item_type in enumerate(ITEM_TYPES)}
+
+MIN_CAPACITY = 1024
+
+
+@dataclass
+class Match:
+    product_id: int
+    # CIE76 ΔE to the closest palette color
+    distance: float
+    # Index of that color in the palette
+    palette_index: int
+
+
+class ColorIndex:
+    def __init__(self):
+        self.ids = np.empty(0, dtype=np.int64)
+        # (3, capacity): L, a and b rows are each contiguous
+        self.lab = np.empty((3, 0), dtype=np.float32)
+        self.types = np.empty(0, dtype=np.int8)
+        self.size = 0
+        self.positions: dict[int, int] = {}
+        self.watermark: datetime | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(MIN_CAPACITY, len(self.ids))
+        while capacity < needed:
+            capacity *= 2
+        if capacity == len(self.ids):
+            return
+        for name in ("ids", "types"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        lab = np.zeros((3, capacity), dtype=np.float32)
+        lab[:, : self.size] = self.lab[:, : self.size]
+        self.lab = lab
+
+    def upsert(self, ids, labs, item_types) -> None:
+        """Add or replace products' features."""
+        labs = np.asarray(labs, dtype=np.float32).reshape(-1, 3)
+        types = np.array(
+            [_TYPE_CODES.get(item_type, 0) for item_type in item_types], dtype=np.int8
+        )
+        with self._lock:
+            self._grow(self.size + len(ids))
+            rows = np.empty(len(ids), dtype=np.int64)
+            for row, product_id in enumerate(ids):
+                position = self.positions.get(product_id)
+                if position is None:
+                    position = self.positions[product_id] = self.size
+                    self.size += 1
+                rows[row] = position
+            self.ids[rows] = ids
+            self.lab[:, rows] = labs.T
+            self.types[rows] = types
+
+    def remove(self, ids) -> None:
+        """Drop products (swap-with-last, so arrays stay contiguous)."""
+        with self._lock:
+            for product_id in ids:
+                position = self.positions.pop(product_id, None)
+                if position is None:
+                    continue
+                last = self.size - 1
+                if position != last:
+                    moved = int(self.ids[last])
+                    self.ids[position] = self.ids[last]
+                    self.types[position] = self.types[last]
+                    self.lab[:, position] = self.lab[:, last]
+                    self.positions[moved] = position
+                self.size = last
+
+    def upsert_products(self, products) -> None:
+        """Apply Product instances: colored ones are upserted, others removed."""
+        colored = [product for product in products if product.lab_l is not None]
+        self.upsert(
+            [product.pk for product in colored],
+            [[p.lab_l, p.lab_a, p.lab_b] for p in colored],
+            [product.item_type for product in colored],
+        )
+        self.remove([product.pk for product in products if product.lab_l is None])
+
+    def refresh(self) -> int:
+        """Load products changed since the watermark. Returns rows read."""
+        from .models import Product
+
+        rows = Product.objects.order_by("updated_at").values_list(
+            "id", "lab_l", "lab_a", "lab_b", "item_type", "updated_at"
+        )
+        if self.watermark is not None:
+            # >= so rows sharing the watermark's timestamp aren't missed
+            rows = rows.filter(updated_at__gte=self.watermark)
+
+        ids, labs, types, removed = [], [], [], []
+        count = 0
+        for product_id, lab_l, a, b, item_type, updated_at in rows.iterator(
+            chunk_size=5000
+        ):
+            count += 1
+            self.watermark = updated_at
+            if lab_l is None:
+                removed.append(product_id)
+            else:
+                ids.append(product_id)
+                labs.append((lab_l, a, b))
+                types.append(item_type)
+        self.upsert(ids, labs, types)
+        self.remove(removed)
+        return count
+
+    def rank(
+        self,
+        palette: np.ndarray,
+        item_type: str | None = None,
+        limit: int = 20,
+    ) -> list[Match]:
+        """
+        Products closest to any palette color, best first.
+
+        Args:
+            palette: ``(p, 3)`` CIELAB array (see colors.palette_lab)
+            item_type: Only consider this OutfitItem.ItemType
+            limit: Maximum matches returned
+        """
+        palette = np.asarray(palette, dtype=np.float32).reshape(-1, 3)
+        if not len(palette) or limit <= 0:
+            return []
+
+        with self._lock:
+            if item_type:
+                rows = np.flatnonzero(
+                    self.types[: self.size] == _TYPE_CODES.get(item_type, -1)
+                )
+                ids, lab = self.ids[rows], self.lab[:, rows]
+            else:
+                ids, lab = self.ids[: self.size].copy(), self.lab[:, : self.size]
+            if not len(ids):
+                return []
+
+            # Squared distance to the closest palette color, channel by
+            # channel (faster than an (n, 3) x (3, p) product for tiny p)
+            best = np.full(len(ids), np.inf, dtype=np.float32)
+            for color in palette:
+                squared = _squared_distance(lab, color)
+                np.minimum(best, squared, out=best)
+
+            limit = min(limit, len(ids))
+            top = np.argpartition(best, limit - 1)[:limit]
+            top = top[np.argsort(best[top], kind="stable")]
+            top_lab = lab[:, top]
+
+        nearest = np.stack(
+            [_squared_distance(top_lab, color) for color in palette]
+        ).argmin(axis=0)
+        distances = np.sqrt(best[top])
+        return [
+            Match(int(product_id), float(distance), int(palette_index))
+            for product_id, distance, palette_index in zip(
+                ids[top].tolist(), distances.tolist(), nearest.tolist()
+            )
+        ]
+
+
+def _squared_distance(lab: np.ndarray, color: np.ndarray) -> np.ndarray:
+    """Squared CIE76 distance from each column of ``lab`` to ``color``."""
+    squared = lab[0] - color[0]
+    squared *= squared
+    for channel in (1, 2):
+        delta = lab[channel] - color[channel]
+        delta *= delta
+        squared += delta
+    return squared
+
+
+_index: ColorIndex | None = None
+_refreshed_at = 0.0
+_build_lock = threading.Lock()
+
+
+def get_color_index() -> ColorIndex:
+    """This process's index, built on first use and refreshed periodically."""
+    global _index, _refreshed_at
+    with _build_lock:
+        now = time.monotonic()
+        if _index is None:
+            index = ColorIndex()
+            index.refresh()
+            _index, _refreshed_at = index, now
+        elif now - _refreshed_at >= settings.COLOR_INDEX_REFRESH:
+            _index.refresh()
+            _refreshed_at = now
+        return _index
+
+
+def notify(products) -> None:
+    """Apply freshly written products to the index, if it's loaded."""
+    if _index is not None:
+        _index.upsert_products(products)
+
+
+def reset() -> None:
+    """Forget the index (tests, after bulk deletes)."""
+    global _index
+    with _build_lock:
+        _index = None
@@ -0,0 +1,133 @@
+"""
+Color conversion for palette matching.
+
+Colors are compared in CIELAB (D65), where Euclidean distance (CIE76 ΔE)
+roughly tracks perceived difference; sRGB distance does not.
+"""
+
+import re
+
+import numpy as np
+
+HEX_COLOR = re.compile(r"^#?([0-9a-fA-F]{6})$")
+
+# Common clothing color names -> hex, for products listed by name only.
+# Longer names are matched first, so "navy blue" wins over "blue".
+NAMED_COLORS = {
+    "black": "#000000",
+    "white": "#FFFFFF",
+    "ivory": "#FFFFF0",
+    "cream": "#FFFDD0",
+    "beige": "#F5F5DC",
+    "tan": "#D2B48C",
+    "khaki": "#C3B091",
+    "brown": "#8B4513",
+    "chocolate": "#7B3F00",
+    "camel": "#C19A6B",
+    "gray": "#808080",
+    "grey": "#808080",
+    "charcoal": "#36454F",
+    "silver": "#C0C0C0",
+    "gold": "#FFD700",
+    "yellow": "#FFFF00",
+    "mustard": "#E1AD01",
+    "orange": "#FFA500",
+    "coral": "#FF7F50",
+    "peach": "#FFE5B4",
+    "red": "#FF0000",
+    "burgundy": "#800020",
+    "maroon": "#800000",
+    "wine": "#722F37",
+    "pink": "#FFC0CB",
+    "hot pink": "#FF69B4",
+    "blush": "#DE5D83",
+    "magenta": "#FF00FF",
+    "fuchsia": "#FF00FF",
+    "purple": "#800080",
+    "lavender": "#E6E6FA",
+    "lilac": "#C8A2C8",
+    "violet": "#8F00FF",
+    "plum": "#8E4585",
+    "blue": "#0000FF",
+    "navy": "#000080",
+    "navy blue": "#000080",
+    "royal blue": "#4169E1",
+    "light blue": "#ADD8E6",
+    "sky blue": "#87CEEB",
+    "baby blue": "#89CFF0",
+    "denim": "#1560BD",
+    "teal": "#008080",
+    "turquoise": "#40E0D0",
+    "aqua": "#00FFFF",
+    "mint": "#98FF98",
+    "green": "#008000",
+    "sage": "#9CAF88",
+    "olive": "#808000",
+    "emerald": "#50C878",
+    "forest green": "#228B22",
+}
+_NAMES_LONGEST_FIRST = sorted(NAMED_COLORS, key=len, reverse=True)
+
+
+def parse_hex(value: str) -> str | None:
+    """Normalize ``#rrggbb`` / ``rrggbb`` to ``#RRGGBB``."""
+    match = HEX_COLOR.match(value.strip()) if value else None
+    return f"#{match.group(1).upper()}" if match else None
+
+
+def hex_for_name(name: str) -> str | None:
+    """Best-effort hex for a color name like "Navy Blue Heather"."""
+    lowered = name.lower()
+    for candidate in _NAMES_LONGEST_FIRST:
+        if re.search(rf"\b{re.escape(candidate)}\b", lowered):
+            return NAMED_COLORS[candidate]
+    return None
+
+
+def hex_to_rgb(values: list[str]) -> np.ndarray:
+    """``(n, 3)`` array of sRGB components in [0, 1]."""
+    return (
+        np.array(
+            [[int(value[i : i + 2], 16) for i in (1, 3, 5)] for value in values],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        / 255.0
+    )
+
+
+# sRGB (linear) -> XYZ, D65
+_RGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+_WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert an ``(n, 3)`` sRGB array to CIELAB, vectorized."""
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ _RGB_TO_XYZ.T / _WHITE_D65
+    delta = 6 / 29
+    f = np.where(xyz > delta**3, np.cbrt(xyz), xyz / (3 * delta**2) + 4 / 29)
+    return np.stack(
+        [
+            116 * f[:, 1] - 16,
+            500 * (f[:, 0] - f[:, 1]),
+            200 * (f[:, 1] - f[:, 2]),
+        ],
+        axis=1,
+    )
+
+
+def hex_to_lab(values: list[str]) -> np.ndarray:
+    """``(n, 3)`` CIELAB array for ``#RRGGBB`` strings."""
+    return rgb_to_lab(hex_to_rgb(values))
+
+
+def palette_lab(colors: list[dict]) -> np.ndarray:
+    """CIELAB for a ``Character.colors`` palette, skipping invalid entries."""
+    hexes = [parse_hex(color.get("hex", "")) for color in colors]
+    return hex_to_lab([value for value in hexes if value])
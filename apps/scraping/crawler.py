@@ -0,0 +1,254 @@
+"""
+Asynchronous, rate-limited product crawler.
+
+A fixed pool of workers shares one ``httpx.AsyncClient`` (so connections
+are reused) and a per-host token bucket sized by ``SCRAPE_RATE_LIMIT``.
+Re-crawls send ``If-None-Match`` / ``If-Modified-Since`` from the stored
+page state and skip pages whose content hash hasn't changed, while still
+following their previously seen links. Results are bulk-upserted in
+batches as the crawl progresses.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from urllib.parse import urldefrag, urlsplit
+
+import httpx
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+from .models import CrawlPage
+from .parsers import ProductData, parse_page
+from .ratelimit import HostRateLimiter
+from .services import known_pages, page_state, upsert_pages, upsert_products
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "DisneyboundPlannerBot/1.0 (+https://disneybound-planner.fly.dev)"
+HTML_TYPES = ("text/html", "application/xhtml+xml")
+
+
+@dataclass
+class CrawlStats:
+    fetched: int = 0  # 200 responses
+    not_modified: int = 0  # 304 responses
+    unchanged: int = 0  # 200 responses with the same content as last time
+    products: int = 0
+    errors: int = 0
+    unsaved: int = 0  # pages whose results couldn't be stored
+    elapsed: float = 0.0
+
+    @property
+    def pages(self) -> int:
+        return self.fetched + self.not_modified + self.errors
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+
+class Crawler:
+    """
+    Crawl from start URLs, staying on their hosts.
+
+    Args:
+        rate_limit: Requests per second per host (default SCRAPE_RATE_LIMIT;
+            0 disables limiting)
+        concurrency: Concurrent requests across all hosts
+        max_pages: Stop discovering new URLs after this many
+        follow: Only follow links matching this regex (start URLs are
+            always fetched)
+        batch_size: Pages buffered before a bulk upsert
+        transport: Custom httpx transport (tests)
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_limit: float | None = None,
+        concurrency: int = 8,
+        max_pages: int = 1000,
+        follow: str | None = None,
+        batch_size: int = 200,
+        timeout: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        if rate_limit is None:
+            rate_limit = settings.SCRAPE_RATE_LIMIT
+        self.limiter = HostRateLimiter(rate_limit)
+        self.concurrency = concurrency
+        self.max_pages = max_pages
+        self.follow = re.compile(follow) if follow else None
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.transport = transport
+
+        self.stats = CrawlStats()
+        self.known: dict[str, CrawlPage] = {}
+        self.hosts: set[str] = set()
+        self.seen: set[str] = set()
+        self._pages: list[CrawlPage] = []
+        self._products: list[ProductData] = []
+
+    async def crawl(self, start_urls: Iterable[str]) -> CrawlStats:
+        started = time.perf_counter()
+        start_urls = [urldefrag(url).url for url in start_urls]
+        self.hosts = {urlsplit(url).netloc for url in start_urls}
+        self.known = await sync_to_async(known_pages)(self.hosts)
+
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for url in start_urls:
+            if url not in self.seen:
+                self.seen.add(url)
+                queue.put_nowait(url)
+
+        async with httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+            transport=self.transport,
+        ) as client:
+            workers = [
+                asyncio.create_task(self._worker(client, queue))
+                for _ in range(self.concurrency)
+            ]
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        await self._flush()
+        self.stats.unsaved = len(self._pages)
+        self.stats.elapsed = time.perf_counter() - started
+        return self.stats
+
+    async def _worker(self, client: httpx.AsyncClient, queue: asyncio.Queue) -> None:
+        while True:
+            url = await queue.get()
+            try:
+                for link in await self._fetch(client, url):
+                    self._enqueue(queue, link)
+                if len(self._pages) >= self.batch_size:
+                    await self._flush()
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(f"Crawl of {url} failed: {e}")
+            finally:
+                queue.task_done()
+
+    def _enqueue(self, queue: asyncio.Queue, url: str) -> None:
+        if url in self.seen or len(self.seen) >= self.max_pages:
+            return
+        if urlsplit(url).netloc not in self.hosts:
+            return
+        if self.follow and not self.follow.search(url):
+            return
+        self.seen.add(url)
+        queue.put_nowait(url)
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> list[str]:
+        """Fetch one page, buffer its results and return links to follow."""
+        known = self.known.get(url)
+        headers = {}
+        if known is not None:
+            if known.etag:
+                headers["If-None-Match"] = known.etag
+            if known.last_modified:
+                headers["If-Modified-Since"] = known.last_modified
+
+        await self.limiter.acquire(urlsplit(url).netloc)
+        response = await client.get(url, headers=headers)
+
+        if response.status_code == 304 and known is not None:
+            self.stats.not_modified += 1
+            self._pages.append(
+                page_state(
+                    url,
+                    status_code=200,
+                    etag=response.headers.get("ETag", known.etag),
+                    last_modified=response.headers.get(
+                        "Last-Modified", known.last_modified
+                    ),
+                    content_hash=known.content_hash,
+                    links=known.links,
+                    changed_at=known.changed_at,
+                )
+            )
+            return known.links
+
+        if response.status_code != 200:
+            self.stats.errors += 1
+            self._pages.append(page_state(url, status_code=response.status_code))
+            return []
+
+        self.stats.fetched += 1
+        body = response.content
+        content_hash = hashlib.sha256(body).hexdigest()
+        validators = {
+            "status_code": 200,
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "content_hash": content_hash,
+        }
+
+        if known is not None and known.content_hash == content_hash:
+            self.stats.unchanged += 1
+            self._pages.append(
+                page_state(
+                    url, links=known.links, changed_at=known.changed_at, **validators
+                )
+            )
+            return known.links
+
+        links = []
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.startswith(HTML_TYPES):
+            parsed = parse_page(body, url)
+            links = parsed.links
+            if parsed.product is not None:
+                self._products.append(parsed.product)
+        self._pages.append(
+            page_state(url, links=links, changed_at=timezone.now(), **validators)
+        )
+        return links
+
+    async def _flush(self) -> None:
+        # Swap the buffers before awaiting so other workers keep appending
+        pages, self._pages = self._pages, []
+        products, self._products = self._products, []
+        try:
+            if products:
+                written = await sync_to_async(upsert_products)(products)
+                self.stats.products += written
+                products = []
+            if pages:
+                await sync_to_async(upsert_pages)(pages)
+        except DatabaseError as e:
+            # Keep what wasn't stored for the next flush
+            logger.error(
+                f"Storing {len(products)} products and {len(pages)} pages "
+                f"failed, will retry: {e}"
+            )
+            self._products[:0] = products
+            self._pages[:0] = pages
+
+
+def crawl(start_urls: Iterable[str], **options) -> CrawlStats:
+    """
+    Synchronous entry point (management command, background threads).
+
+    ``async_to_sync`` runs the ORM calls on the calling thread, so they use
+    its database connection.
+    """
+    return async_to_sync(Crawler(**options).crawl)(start_urls)
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from apps.scraping.crawler import crawl
+
+
+class Command(BaseCommand):
+    help = "Crawl retailer pages for products, skipping pages unchanged since last run"
+
+    def add_arguments(self, parser):
+        parser.add_argument("urls", nargs="+", help="Start URLs")
+        parser.add_argument("--max-pages", type=int, default=1000)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument(
+            "--rate-limit",
+            type=float,
+            default=None,
+            help="Requests per second per host (default: SCRAPE_RATE_LIMIT)",
+        )
+        parser.add_argument(
+            "--follow", default=None, help="Only follow links matching this regex"
+        )
+
+    def handle(self, *args, **options):
+        stats = crawl(
+            options["urls"],
+            max_pages=options["max_pages"],
+            concurrency=options["concurrency"],
+            rate_limit=options["rate_limit"],
+            follow=options["follow"],
+        )
+        self.stdout.write(
+            f"{stats.pages} pages in {stats.elapsed:.1f}s "
+            f"({stats.pages_per_second:.1f}/s): {stats.fetched} fetched, "
+            f"{stats.not_modified} not modified, {stats.unchanged} unchanged, "
+            f"{stats.errors} errors, {stats.products} products"
+            + (f", {stats.unsaved} pages not stored" if stats.unsaved else "")
+        )
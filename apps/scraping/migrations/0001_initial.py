@@ -0,0 +1,89 @@
+# Generated by Django 6.0.1 on 2026-10-19 01:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CrawlPage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("url", models.URLField(max_length=1000, unique=True)),
+                ("host", models.CharField(db_index=True, max_length=255)),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(blank=True, null=True),
+                ),
+                ("etag", models.CharField(blank=True, max_length=255)),
+                ("last_modified", models.CharField(blank=True, max_length=64)),
+                ("content_hash", models.CharField(blank=True, max_length=64)),
+                ("links", models.JSONField(blank=True, default=list)),
+                ("fetched_at", models.DateTimeField()),
+                ("changed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["url"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Product",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("url", models.URLField(max_length=1000, unique=True)),
+                ("retailer", models.CharField(db_index=True, max_length=255)),
+                ("name", models.CharField(max_length=500)),
+                ("brand", models.CharField(blank=True, max_length=255)),
+                (
+                    "item_type",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("top", "Top"),
+                            ("bottom", "Bottom"),
+                            ("dress", "Dress"),
+                            ("jacket", "Jacket"),
+                            ("shoes", "Shoes"),
+                            ("accessory", "Accessory"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("color_name", models.CharField(blank=True, max_length=100)),
+                ("color_hex", models.CharField(blank=True, max_length=7)),
+                (
+                    "price",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=10, null=True
+                    ),
+                ),
+                ("currency", models.CharField(blank=True, max_length=3)),
+                ("image_url", models.URLField(blank=True, max_length=1000)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+    ]
@@ -1 +1,67 @@
-# Create your models here.
+from django.db import models
+
+from apps.outfits.models import OutfitItem
+
+
+class Product(models.Model):
+    """A clothing product scraped from a retailer, for shopping suggestions."""
+
+    url = models.URLField(max_length=1000, unique=True)
+    retailer = models.CharField(max_length=255, db_index=True)
+    name = models.CharField(max_length=500)
+    brand = models.CharField(max_length=255, blank=True)
+    item_type = models.CharField(
+        max_length=20, choices=OutfitItem.ItemType.choices, blank=True
+    )
+    color_name = models.CharField(max_length=100, blank=True)
+    color_hex = models.CharField(max_length=7, blank=True)
+    price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    currency = models.CharField(max_length=3, blank=True)
+    image_url = models.URLField(max_length=1000, blank=True)
+
+    # CIELAB of the product color (from color_hex, or color_name when only a
+    # name is listed); null when the color is unknown. See colors.py.
+    lab_l = models.FloatField(null=True, blank=True)
+    lab_a = models.FloatField(null=True, blank=True)
+    lab_b = models.FloatField(null=True, blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+        indexes = [
+            # Incremental color index refreshes scan by updated_at
+            models.Index(fields=["updated_at"], name="product_updated_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class CrawlPage(models.Model):
+    """
+    What the crawler last saw at a URL.
+
+    Validators (ETag / Last-Modified) drive conditional re-crawls; the
+    content hash and stored links let unchanged pages be skipped without
+    re-parsing while still being traversed.
+    """
+
+    url = models.URLField(max_length=1000, unique=True)
+    host = models.CharField(max_length=255, db_index=True)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True)
+    links = models.JSONField(default=list, blank=True)
+
+    fetched_at = models.DateTimeField()
+    changed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["url"]
+
+    def __str__(self):
+        return self.url
@@ -0,0 +1,213 @@
+"""
+Product page parsing with lxml.
+
+Each page is parsed once into an lxml tree; products are read from
+schema.org JSON-LD, falling back to OpenGraph product meta tags, and links
+are pulled with a single XPath query.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+import lxml.html
+from lxml import etree
+
+from apps.outfits.models import OutfitItem
+
+from .colors import parse_hex
+
+# Whole-word keywords (plurals included) in a product's category or name
+ITEM_TYPE_KEYWORDS = [
+    (OutfitItem.ItemType.DRESS, ("dress", "jumpsuit", "romper")),
+    (OutfitItem.ItemType.JACKET, ("jacket", "cardigan", "coat", "blazer", "hoodie")),
+    (OutfitItem.ItemType.SHOES, ("shoe", "sneaker", "boot", "flat", "sandal", "heel")),
+    (
+        OutfitItem.ItemType.BOTTOM,
+        ("skirt", "pant", "jean", "short", "legging", "chino", "trouser", "jogger"),
+    ),
+    (
+        OutfitItem.ItemType.TOP,
+        ("top", "tee", "shirt", "sweatshirt", "blouse", "sweater", "tank"),
+    ),
+    (
+        OutfitItem.ItemType.ACCESSORY,
+        ("bag", "backpack", "hat", "ear", "earring", "bow", "scarf", "jewelry"),
+    ),
+]
+_KEYWORD_TYPES = {
+    keyword: item_type
+    for item_type, keywords in ITEM_TYPE_KEYWORDS
+    for keyword in keywords
+}
+ITEM_TYPE_PATTERN = re.compile(
+    rf"\b({'|'.join(sorted(_KEYWORD_TYPES, key=len, reverse=True))})(?:e?s)?\b"
+)
+
+
+@dataclass
+class ProductData:
+    url: str
+    name: str
+    brand: str = ""
+    item_type: str = ""
+    color_name: str = ""
+    color_hex: str = ""
+    price: Decimal | None = None
+    currency: str = ""
+    image_url: str = ""
+
+
+@dataclass
+class ParsedPage:
+    product: ProductData | None
+    links: list[str]
+
+
+def parse_page(body: bytes, url: str) -> ParsedPage:
+    """Parse a fetched page into its product (if any) and outgoing links."""
+    try:
+        doc = lxml.html.document_fromstring(body)
+    except (etree.ParserError, ValueError):
+        return ParsedPage(product=None, links=[])
+    return ParsedPage(product=extract_product(doc, url), links=extract_links(doc, url))
+
+
+def extract_links(doc, base_url: str) -> list[str]:
+    """Absolute http(s) links in document order, without fragments or repeats."""
+    links = []
+    seen = set()
+    for href in doc.xpath("//a/@href"):
+        link = urldefrag(urljoin(base_url, href.strip())).url
+        if urlsplit(link).scheme in ("http", "https") and link not in seen:
+            seen.add(link)
+            links.append(link)
+    return links
+
+
+def extract_product(doc, url: str) -> ProductData | None:
+    for data in _json_ld(doc):
+        if _is_product(data):
+            return _product_from_json_ld(data, url)
+    return _product_from_meta(doc, url)
+
+
+def _json_ld(doc):
+    for text in doc.xpath('//script[@type="application/ld+json"]/text()'):
+        try:
+            data = json.loads(text)
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if isinstance(item, dict) and "@graph" in item:
+                yield from (node for node in item["@graph"] if isinstance(node, dict))
+            elif isinstance(item, dict):
+                yield item
+
+
+def _is_product(data: dict) -> bool:
+    kind = data.get("@type")
+    kinds = kind if isinstance(kind, list) else [kind]
+    return "Product" in kinds
+
+
+def _first(value):
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _text(value, key: str = "name") -> str:
+    value = _first(value)
+    if isinstance(value, dict):
+        value = value.get(key)
+    return str(value).strip() if value else ""
+
+
+def _product_from_json_ld(data: dict, url: str) -> ProductData | None:
+    name = _text(data.get("name"))
+    if not name:
+        return None
+    offer = _first(data.get("offers")) or {}
+    if not isinstance(offer, dict):
+        offer = {}
+    if offer.get("@type") == "AggregateOffer" and "price" not in offer:
+        offer = {**offer, "price": offer.get("lowPrice")}
+    return _build(
+        url,
+        name=name,
+        brand=_text(data.get("brand")),
+        category=_text(data.get("category")),
+        color=_text(data.get("color")),
+        price=offer.get("price"),
+        currency=_text(offer.get("priceCurrency")),
+        image=_text(data.get("image"), key="url"),
+    )
+
+
+def _product_from_meta(doc, url: str) -> ProductData | None:
+    meta = {
+        element.get("property") or element.get("name"): element.get("content", "")
+        for element in doc.xpath("//meta[@property or @name][@content]")
+    }
+    if meta.get("og:type") != "product" and "product:price:amount" not in meta:
+        return None
+    name = meta.get("og:title", "").strip()
+    if not name:
+        return None
+    return _build(
+        url,
+        name=name,
+        brand=meta.get("product:brand", ""),
+        category=meta.get("product:category", ""),
+        color=meta.get("product:color", ""),
+        price=meta.get("product:price:amount"),
+        currency=meta.get("product:price:currency", ""),
+        image=meta.get("og:image", ""),
+    )
+
+
+def item_type_for(*texts: str) -> str:
+    """
+    Best OutfitItem.ItemType for a category or product name.
+
+    When several keywords match, the last wins: the garment noun ends the
+    name and earlier words are modifiers ("Short Sleeve Tee").
+    """
+    for text in texts:
+        matches = ITEM_TYPE_PATTERN.findall(text.lower())
+        if matches:
+            return _KEYWORD_TYPES[matches[-1]]
+    return ""
+
+
+def _price(value) -> Decimal | None:
+    if value in (None, ""):
+        return None
+    try:
+        price = Decimal(str(value).replace(",", "").strip())
+    except InvalidOperation:
+        return None
+    if not price.is_finite() or not 0 <= price < 10**8:
+        return None
+    return price.quantize(Decimal("0.01"))
+
+
+def _build(url, *, name, brand, category, color, price, currency, image):
+    color_hex = parse_hex(color) or ""
+    if color_hex:
+        color = ""
+    return ProductData(
+        url=url,
+        name=name[:500],
+        brand=brand[:255],
+        item_type=item_type_for(category, name),
+        color_name=color[:100],
+        color_hex=color_hex,
+        price=_price(price),
+        currency=currency.upper()[:3],
+        image_url=urljoin(url, image)[:1000] if image else "",
+    )
@@ -0,0 +1,60 @@
+"""
+Per-host token buckets for polite crawling.
+
+Each host gets ``rate`` requests per second with bursts of up to
+``capacity``. Waiting happens with ``asyncio.sleep`` so a slow host never
+blocks fetches from other hosts.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Async token bucket; ``rate <= 0`` disables limiting."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        if self.rate <= 0:
+            return
+        # Waiters queue on the lock so tokens are handed out in order
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, created on first use."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets: dict[str, TokenBucket] = {}
+
+    async def acquire(self, host: str) -> None:
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = TokenBucket(self.rate, self.capacity)
+        await bucket.acquire()
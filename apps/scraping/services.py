@@ -0,0 +1,166 @@
+"""
+Bulk persistence for crawl results.
+
+Products and page states are written with ``INSERT ... ON CONFLICT DO
+UPDATE`` in batches, so a crawl costs one statement per batch rather than a
+lookup and a save per page.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from django.utils import timezone
+
+from . import color_index
+from .colors import hex_for_name, hex_to_lab, palette_lab, parse_hex
+from .models import CrawlPage, Product
+from .parsers import ProductData
+
+BATCH_SIZE = 500
+
+PRODUCT_FIELDS = [
+    "retailer",
+    "name",
+    "brand",
+    "item_type",
+    "color_name",
+    "color_hex",
+    "price",
+    "currency",
+    "image_url",
+    "lab_l",
+    "lab_a",
+    "lab_b",
+    "updated_at",
+]
+PAGE_FIELDS = [
+    "host",
+    "status_code",
+    "etag",
+    "last_modified",
+    "content_hash",
+    "links",
+    "fetched_at",
+    "changed_at",
+]
+
+
+def set_color_features(products: list[Product]) -> None:
+    """Fill lab_l/lab_a/lab_b for products, converting all colors at once."""
+    hexes = [
+        parse_hex(product.color_hex) or hex_for_name(product.color_name)
+        for product in products
+    ]
+    known = [(product, value) for product, value in zip(products, hexes) if value]
+    for product, value in zip(products, hexes):
+        if not value:
+            product.lab_l = product.lab_a = product.lab_b = None
+    if not known:
+        return
+    labs = hex_to_lab([value for _, value in known])
+    for (product, _), (lab_l, a, b) in zip(known, labs.tolist()):
+        product.lab_l, product.lab_a, product.lab_b = lab_l, a, b
+
+
+def upsert_products(records: Iterable[ProductData]) -> int:
+    """
+    Insert or update products by URL. Returns the number written.
+
+    Color features are computed here, and the in-process color index (if
+    loaded) is updated so new products are rankable immediately.
+    """
+    products = [
+        Product(
+            url=record.url,
+            retailer=urlsplit(record.url).hostname or "",
+            name=record.name,
+            brand=record.brand,
+            item_type=record.item_type,
+            color_name=record.color_name,
+            color_hex=record.color_hex,
+            price=record.price,
+            currency=record.currency,
+            image_url=record.image_url,
+        )
+        for record in records
+    ]
+    set_color_features(products)
+    Product.objects.bulk_create(
+        products,
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["url"],
+        update_fields=PRODUCT_FIELDS,
+    )
+    # Upserted rows only get their primary keys back on Postgres
+    if all(product.pk for product in products):
+        color_index.notify(products)
+    return len(products)
+
+
+def upsert_pages(pages: Iterable[CrawlPage]) -> int:
+    """Insert or update crawl state by URL. Returns the number written."""
+    pages = list(pages)
+    CrawlPage.objects.bulk_create(
+        pages,
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["url"],
+        update_fields=PAGE_FIELDS,
+    )
+    return len(pages)
+
+
+def known_pages(hosts: Iterable[str]) -> dict[str, CrawlPage]:
+    """Previous crawl state for every page on the given hosts, by URL."""
+    return {
+        page.url: page
+        for page in CrawlPage.objects.filter(host__in=set(hosts)).only(
+            "url", "etag", "last_modified", "content_hash", "links", "changed_at"
+        )
+    }
+
+
+def page_state(url: str, **fields) -> CrawlPage:
+    return CrawlPage(
+        url=url,
+        host=urlsplit(url).netloc,
+        fetched_at=timezone.now(),
+        **fields,
+    )
+
+
+@dataclass
+class ProductMatch:
+    product: Product
+    # CIE76 ΔE to the closest palette color
+    distance: float
+    # The Character.colors entry it matched
+    color: dict
+
+
+def shop_palette(
+    colors: list[dict], item_type: str | None = None, limit: int = 12
+) -> list[ProductMatch]:
+    """
+    Products closest in color to a ``Character.colors`` palette, best first.
+
+    Ranking happens in the in-memory color index; only the top ``limit``
+    products are then loaded, in one query.
+    """
+    palette = [color for color in colors if parse_hex(color.get("hex", ""))]
+    matches = color_index.get_color_index().rank(
+        palette_lab(palette), item_type=item_type, limit=limit
+    )
+    products = Product.objects.in_bulk([match.product_id for match in matches])
+    # Skip products deleted since the index last refreshed
+    return [
+        ProductMatch(
+            product=products[match.product_id],
+            distance=match.distance,
+            color=palette[match.palette_index],
+        )
+        for match in matches
+        if match.product_id in products
+    ]
@@ -1 +1,453 @@
-# Create your tests here.
+"""Tests for the product crawler."""
+
+import asyncio
+import hashlib
+import json
+import time
+from decimal import Decimal
+
+import httpx
+import numpy as np
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import DatabaseError
+from django.utils import timezone
+
+from . import color_index
+from .color_index import ITEM_TYPES, ColorIndex
+from .colors import hex_for_name, hex_to_lab, palette_lab
+from .crawler import Crawler, crawl
+from .models import CrawlPage, Product
+from .parsers import ProductData, item_type_for, parse_page
+from .ratelimit import HostRateLimiter, TokenBucket
+from .services import shop_palette, upsert_products
+
+SITE = "https://shop.example.com"
+
+
+def product_html(name, color="#1e90ff", price="19.99", category="T-Shirt"):
+    data = {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "name": name,
+        "brand": {"@type": "Brand", "name": "Example"},
+        "category": category,
+        "color": color,
+        "image": ["/img/1.jpg"],
+        "offers": [{"@type": "Offer", "price": price, "priceCurrency": "usd"}],
+    }
+    return (
+        f'<html><head><script type="application/ld+json">{json.dumps(data)}'
+        '</script></head><body><a href="/">Home</a></body></html>'
+    )
+
+
+class FakeShop:
+    """httpx handler for a tiny shop that honors If-None-Match."""
+
+    def __init__(self):
+        self.pages = {
+            "/": '<a href="/p/1">1</a><a href="/p/2#reviews">2</a>'
+            '<a href="https://elsewhere.example.com/p/3">3</a>',
+            "/p/1": product_html("Blue Tee"),
+            "/p/2": product_html("Gold Skirt", color="Gold", category="Skirts"),
+        }
+        self.requests: list[httpx.Request] = []
+        self.send_etags = True
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = self.pages.get(request.url.path)
+        if body is None:
+            return httpx.Response(404)
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        if self.send_etags:
+            etag = f'"{hashlib.md5(body.encode()).hexdigest()}"'
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+            headers["ETag"] = etag
+        return httpx.Response(200, text=body, headers=headers)
+
+    def paths(self):
+        return sorted(request.url.path for request in self.requests)
+
+
+@pytest.fixture
+def shop():
+    return FakeShop()
+
+
+def run_crawl(shop, **options):
+    options.setdefault("rate_limit", 0)
+    return crawl([f"{SITE}/"], transport=httpx.MockTransport(shop), **options)
+
+
+class TestParsers:
+    """Products come from JSON-LD, falling back to OpenGraph meta."""
+
+    def test_json_ld_product(self):
+        page = parse_page(product_html("Blue Tee").encode(), f"{SITE}/p/1")
+        product = page.product
+        assert product.name == "Blue Tee"
+        assert product.brand == "Example"
+        assert product.item_type == "top"
+        assert product.color_hex == "#1E90FF"
+        assert product.price == Decimal("19.99")
+        assert product.currency == "USD"
+        assert product.image_url == f"{SITE}/img/1.jpg"
+        assert page.links == [f"{SITE}/"]
+
+    def test_json_ld_graph_and_color_name(self):
+        html = (
+            '<script type="application/ld+json">'
+            + json.dumps(
+                {
+                    "@graph": [
+                        {"@type": "BreadcrumbList"},
+                        {"@type": "Product", "name": "Red Flats", "color": "Red"},
+                    ]
+                }
+            )
+            + "</script>"
+        )
+        product = parse_page(html.encode(), f"{SITE}/p").product
+        assert product.name == "Red Flats"
+        assert product.item_type == "shoes"
+        assert (product.color_name, product.color_hex) == ("Red", "")
+        assert product.price is None
+
+    def test_open_graph_fallback(self):
+        html = """
+        <html><head>
+          <meta property="og:type" content="product">
+          <meta property="og:title" content="Mickey Ears">
+          <meta property="og:image" content="https://cdn.example.com/ears.jpg">
+          <meta property="product:price:amount" content="1,299.00">
+          <meta property="product:price:currency" content="USD">
+        </head></html>
+        """
+        product = parse_page(html.encode(), f"{SITE}/ears").product
+        assert product.name == "Mickey Ears"
+        assert product.item_type == "accessory"
+        assert product.price == Decimal("1299.00")
+
+    @pytest.mark.parametrize(
+        ("name", "item_type"),
+        [
+            ("Short Sleeve Tee", "top"),
+            ("Bootcut Jeans", "bottom"),
+            ("Flat Front Chinos", "bottom"),
+            ("Shirt Dress", "dress"),
+            ("Dress Shoes", "shoes"),
+            ("Cotton Blend", ""),
+        ],
+    )
+    def test_item_type_prefers_garment_noun(self, name, item_type):
+        assert item_type_for(name) == item_type
+
+    def test_non_product_page(self):
+        page = parse_page(b"<html><body><a href='/x#top'>x</a></body></html>", SITE)
+        assert page.product is None
+        assert page.links == [f"{SITE}/x"]
+
+    def test_malformed_json_ld_is_ignored(self):
+        html = b'<script type="application/ld+json">{not json</script>'
+        assert parse_page(html, SITE).product is None
+
+
+class TestTokenBucket:
+    """The token bucket spaces requests to the configured rate."""
+
+    def test_limits_rate(self):
+        async def acquire_many():
+            bucket = TokenBucket(rate=50, capacity=1)
+            started = time.perf_counter()
+            for _ in range(6):
+                await bucket.acquire()
+            return time.perf_counter() - started
+
+        # First request is free, then one every 20ms
+        assert asyncio.run(acquire_many()) >= 0.1
+
+    def test_limits_each_host_separately(self):
+        async def acquire_hosts():
+            limiter = HostRateLimiter(rate=5, capacity=1)
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(limiter.acquire(f"host{i}.example.com") for i in range(10))
+            )
+            return time.perf_counter() - started
+
+        assert asyncio.run(acquire_hosts()) < 0.1
+
+    def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket(rate=0)
+        asyncio.run(bucket.acquire())
+
+
+@pytest.mark.django_db
+class TestCrawler:
+    """Crawls stay on-site, upsert in bulk and re-crawl incrementally."""
+
+    def test_crawl_saves_products_and_pages(self, shop):
+        stats = run_crawl(shop)
+
+        assert shop.paths() == ["/", "/p/1", "/p/2"]
+        assert stats.fetched == 3
+        assert stats.products == 2
+        assert set(Product.objects.values_list("name", flat=True)) == {
+            "Blue Tee",
+            "Gold Skirt",
+        }
+        assert Product.objects.get(name="Gold Skirt").item_type == "bottom"
+        assert CrawlPage.objects.count() == 3
+        assert CrawlPage.objects.get(url=f"{SITE}/").links == [
+            f"{SITE}/p/1",
+            f"{SITE}/p/2",
+            "https://elsewhere.example.com/p/3",
+        ]
+
+    def test_recrawl_uses_conditional_requests(self, shop):
+        run_crawl(shop)
+        shop.requests.clear()
+
+        stats = run_crawl(shop)
+
+        # Unchanged pages are still traversed through their stored links
+        assert shop.paths() == ["/", "/p/1", "/p/2"]
+        assert all("If-None-Match" in request.headers for request in shop.requests)
+        assert stats.not_modified == 3
+        assert stats.fetched == 0
+        assert stats.products == 0
+
+    def test_recrawl_skips_unchanged_content_without_validators(self, shop):
+        shop.send_etags = False
+        run_crawl(shop)
+        shop.pages["/p/2"] = product_html("Gold Skirt", color="Gold", price="9.99")
+
+        stats = run_crawl(shop)
+
+        assert stats.fetched == 3
+        assert stats.unchanged == 2
+        assert stats.products == 1
+        assert Product.objects.get(name="Gold Skirt").price == Decimal("9.99")
+
+    def test_max_pages_and_follow(self, shop):
+        stats = run_crawl(shop, max_pages=2)
+        assert stats.pages == 2
+
+        shop.requests.clear()
+        run_crawl(shop, follow=r"/p/2$")
+        assert "/p/1" not in shop.paths()
+
+    def test_errors_are_counted(self, shop):
+        shop.pages["/"] = '<a href="/missing">x</a>'
+        stats = run_crawl(shop)
+        assert stats.errors == 1
+        assert CrawlPage.objects.get(url=f"{SITE}/missing").status_code == 404
+
+    def test_flushes_in_batches(self, shop):
+        crawler = Crawler(
+            rate_limit=0, batch_size=1, transport=httpx.MockTransport(shop)
+        )
+        stats = async_to_sync(crawler.crawl)([f"{SITE}/"])
+        assert stats.products == 2
+        assert Product.objects.count() == 2
+        assert CrawlPage.objects.count() == 3
+
+    def test_failed_flush_is_retried(self, shop, monkeypatch):
+        failures = iter([DatabaseError("connection lost")])
+
+        def flaky_upsert(products):
+            if error := next(failures, None):
+                raise error
+            return upsert_products(products)
+
+        monkeypatch.setattr("apps.scraping.crawler.upsert_products", flaky_upsert)
+        crawler = Crawler(
+            rate_limit=0, batch_size=1, transport=httpx.MockTransport(shop)
+        )
+        stats = async_to_sync(crawler.crawl)([f"{SITE}/"])
+        assert stats.products == 2
+        assert stats.unsaved == 0
+        assert Product.objects.count() == 2
+        assert CrawlPage.objects.count() == 3
+
+    def test_unstored_pages_are_reported(self, shop, monkeypatch):
+        def failing_upsert(pages):
+            raise DatabaseError("connection lost")
+
+        monkeypatch.setattr("apps.scraping.crawler.upsert_pages", failing_upsert)
+        stats = run_crawl(shop)
+        assert stats.products == 2
+        assert stats.unsaved == 3
+        assert CrawlPage.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestUpsert:
+    """Products are upserted by URL."""
+
+    def test_updates_existing(self):
+        page = parse_page(product_html("Blue Tee").encode(), f"{SITE}/p/1")
+        upsert_products([page.product])
+        page.product.price = Decimal("5.00")
+        upsert_products([page.product])
+
+        product = Product.objects.get()
+        assert product.price == Decimal("5.00")
+        assert product.retailer == "shop.example.com"
+
+
+class TestColors:
+    """Color conversion to CIELAB."""
+
+    def test_hex_to_lab(self):
+        lab = hex_to_lab(["#FFFFFF", "#000000", "#FF0000"])
+        assert lab[0] == pytest.approx([100, 0, 0], abs=0.01)
+        assert lab[1] == pytest.approx([0, 0, 0], abs=0.01)
+        assert lab[2] == pytest.approx([53.24, 80.09, 67.20], abs=0.01)
+
+    def test_hex_for_name_prefers_longest(self):
+        assert hex_for_name("Navy Blue Heather") == "#000080"
+        assert hex_for_name("Dusty Rose") is None
+
+    def test_palette_skips_invalid(self):
+        assert palette_lab([{"hex": "#FFD700"}, {"hex": "gold"}, {}]).shape == (1, 3)
+
+
+def random_index(count, seed=0):
+    rng = np.random.default_rng(seed)
+    labs = rng.uniform([0, -100, -100], [100, 100, 100], size=(count, 3))
+    types = rng.choice(ITEM_TYPES[1:], size=count)
+    index = ColorIndex()
+    index.upsert(list(range(1, count + 1)), labs, types)
+    return index, labs.astype(np.float32), types
+
+
+class TestColorIndex:
+    """Vectorized ranking matches a brute-force reference."""
+
+    def test_rank_matches_brute_force(self):
+        index, labs, _ = random_index(3000)
+        palette = hex_to_lab(["#FFD700", "#1E90FF", "#DC143C"])
+
+        matches = index.rank(palette, limit=10)
+
+        distances = np.linalg.norm(
+            labs[:, None, :] - palette[None].astype(np.float32), axis=2
+        )
+        expected = np.argsort(distances.min(axis=1))[:10] + 1
+        assert [match.product_id for match in matches] == expected.tolist()
+        best = matches[0]
+        assert best.distance == pytest.approx(
+            distances[best.product_id - 1].min(), abs=0.01
+        )
+        assert best.palette_index == distances[best.product_id - 1].argmin()
+
+    def test_filter_by_item_type(self):
+        index, _, types = random_index(500)
+        matches = index.rank(hex_to_lab(["#000000"]), item_type="shoes", limit=50)
+        assert matches
+        assert all(types[match.product_id - 1] == "shoes" for match in matches)
+
+    def test_incremental_upsert_and_remove(self):
+        index = ColorIndex()
+        black, white = hex_to_lab(["#000000", "#FFFFFF"])
+        index.upsert([1, 2, 3], [black, white, white], ["top", "top", "top"])
+        assert index.rank([black], limit=1)[0].product_id == 1
+
+        # Product 1 changes color; product 3 is dropped
+        index.upsert([1], [white], ["top"])
+        index.remove([3])
+        assert len(index) == 2
+        assert {match.product_id for match in index.rank([white])} == {1, 2}
+
+    def test_grows_past_capacity(self):
+        index, _, _ = random_index(5000)
+        assert len(index) == 5000
+        assert len(index.rank(hex_to_lab(["#808080"]), limit=5000)) == 5000
+
+    def test_empty(self):
+        assert ColorIndex().rank(hex_to_lab(["#000000"])) == []
+
+
+def product(url, color="", color_name="", item_type="T-Shirt"):
+    return ProductData(
+        url=f"{SITE}/{url}",
+        name=url,
+        color_hex=color,
+        color_name=color_name,
+        item_type=item_type_for(item_type),
+    )
+
+
+@pytest.fixture
+def fresh_index():
+    color_index.reset()
+    yield
+    color_index.reset()
+
+
+@pytest.mark.django_db
+class TestShopPalette:
+    """Products are ranked against character palettes."""
+
+    def test_upsert_computes_color_features(self, fresh_index):
+        upsert_products(
+            [
+                product("gold", color="#FFD700"),
+                product("navy", color_name="Navy Blue"),
+                product("mystery", color_name="Unicorn"),
+            ]
+        )
+        assert Product.objects.get(name="navy").lab_l == pytest.approx(12.97, abs=0.01)
+        assert Product.objects.get(name="mystery").lab_l is None
+
+    def test_ranks_and_filters(self, fresh_index):
+        upsert_products(
+            [
+                product("gold-tee", color="#FFD700"),
+                product("blue-tee", color="#1E90FF"),
+                product("gold-shoes", color="#FFD000", item_type="Sneakers"),
+                product("black-tee", color="#000000"),
+            ]
+        )
+        palette = [
+            {"hex": "#ffd700", "name": "Yellow"},
+            {"hex": "#1E90FF", "name": "Blue"},
+        ]
+
+        matches = shop_palette(palette, limit=3)
+        assert [match.product.name for match in matches] == [
+            "gold-tee",
+            "blue-tee",
+            "gold-shoes",
+        ]
+        assert matches[0].color["name"] == "Yellow"
+        assert matches[0].distance == pytest.approx(0, abs=0.01)
+
+        shoes = shop_palette(palette, item_type="shoes")
+        assert [match.product.name for match in shoes] == ["gold-shoes"]
+
+    def test_new_products_are_indexed_incrementally(self, fresh_index):
+        upsert_products([product("black-tee", color="#000000")])
+        palette = [{"hex": "#FF0000", "name": "Red"}]
+        assert shop_palette(palette, limit=1)[0].product.name == "black-tee"
+
+        # The loaded index picks up scraper writes without a rebuild
+        upsert_products([product("red-tee", color="#FF0000")])
+        assert shop_palette(palette, limit=1)[0].product.name == "red-tee"
+
+    def test_refresh_reads_changes_since_watermark(self, fresh_index, settings):
+        settings.COLOR_INDEX_REFRESH = 0
+        upsert_products([product("black-tee", color="#000000")])
+        index = color_index.get_color_index()
+        assert len(index) == 1
+
+        # Written by "another process": bypass notify()
+        Product.objects.filter(name="black-tee").update(
+            lab_l=None, updated_at=timezone.now()
+        )
+        color_index.get_color_index()
+        assert len(index) == 0
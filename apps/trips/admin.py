@@ -1 +1,45 @@
-# Register your models here.
+from django.contrib import admin
+
+from .models import DaySuggestion, SuggestionBatch, Trip, TripDay
+
+
+class TripDayInline(admin.TabularInline):
+    model = TripDay
+    extra = 0
+    raw_id_fields = ["outfit"]
+
+
+@admin.register(Trip)
+class TripAdmin(admin.ModelAdmin):
+    list_display = ["name", "user", "destination", "start_date", "end_date"]
+    list_filter = ["destination", "start_date"]
+    list_select_related = ["user"]
+    search_fields = ["name"]
+    raw_id_fields = ["user"]
+    readonly_fields = ["created_at", "updated_at"]
+    inlines = [TripDayInline]
+
+
+@admin.register(SuggestionBatch)
+class SuggestionBatchAdmin(admin.ModelAdmin):
+    list_display = [
+        "trip",
+        "status",
+        "completed",
+        "failed",
+        "total",
+        "unique_inputs",
+        "created_at",
+    ]
+    list_filter = ["status"]
+    list_select_related = ["trip"]
+    raw_id_fields = ["trip"]
+    readonly_fields = ["created_at", "finished_at"]
+
+
+@admin.register(DaySuggestion)
+class DaySuggestionAdmin(admin.ModelAdmin):
+    list_display = ["traveler", "character", "day", "status"]
+    list_filter = ["status"]
+    list_select_related = ["character", "day__trip"]
+    raw_id_fields = ["batch", "day", "character"]
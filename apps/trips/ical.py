@@ -0,0 +1,92 @@
+"""
+Lazy iCalendar (RFC 5545) export for trips.
+
+``iter_trip_calendar`` yields the calendar line by line while iterating the
+trip's days in chunks, so very long or large group trips are never built
+in memory.
+"""
+
+from collections.abc import Iterator
+from datetime import UTC, timedelta
+
+from .models import Trip
+from .services import calendar_days
+
+CHUNK_SIZE = 100
+PRODID = "-//Disneybound Planner//Trip Calendar//EN"
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line to 75 octets, CRLF-terminated."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    current = b""
+    limit = 75
+    for char in line:
+        char_bytes = char.encode()
+        if len(current) + len(char_bytes) > limit:
+            parts.append(current.decode())
+            current = b""
+            limit = 74  # continuation lines start with a space
+        current += char_bytes
+    parts.append(current.decode())
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _day_description(day) -> str:
+    outfit = day.outfit
+    lines = []
+    if outfit is not None:
+        if outfit.character is not None:
+            lines.append(
+                f"Bounding as {outfit.character.name} ({outfit.character.movie})"
+            )
+        for item in outfit.items.all():
+            color = f" ({item.color_name})" if item.color_name else ""
+            lines.append(f"- {item.get_item_type_display()}: {item.description}{color}")
+    if day.notes:
+        lines.append(day.notes)
+    return "\n".join(lines)
+
+
+def iter_trip_calendar(trip: Trip) -> Iterator[str]:
+    """Yield the trip's calendar as folded iCalendar lines."""
+    stamp = trip.updated_at.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+    yield fold("BEGIN:VCALENDAR")
+    yield fold("VERSION:2.0")
+    yield fold(f"PRODID:{PRODID}")
+    yield fold("CALSCALE:GREGORIAN")
+    yield fold(f"X-WR-CALNAME:{escape_text(trip.name)}")
+
+    days = calendar_days().filter(trip=trip).order_by("date")
+    for day in days.iterator(chunk_size=CHUNK_SIZE):
+        outfit = day.outfit
+        summary = outfit.name if outfit is not None else "No outfit planned"
+        if day.park:
+            summary = f"{summary} @ {day.park}"
+        yield fold("BEGIN:VEVENT")
+        yield fold(f"UID:tripday-{day.pk}@disneybound-planner")
+        yield fold(f"DTSTAMP:{stamp}")
+        yield fold(f"DTSTART;VALUE=DATE:{day.date:%Y%m%d}")
+        yield fold(f"DTEND;VALUE=DATE:{day.date + timedelta(days=1):%Y%m%d}")
+        yield fold(f"SUMMARY:{escape_text(summary)}")
+        description = _day_description(day)
+        if description:
+            yield fold(f"DESCRIPTION:{escape_text(description)}")
+        yield fold("END:VEVENT")
+
+    yield fold("END:VCALENDAR")
@@ -0,0 +1,120 @@
+# Generated by Django 6.0.1 on 2026-10-19 01:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("outfits", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Trip",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                (
+                    "destination",
+                    models.CharField(
+                        choices=[
+                            ("wdw", "Walt Disney World"),
+                            ("dlr", "Disneyland Resort"),
+                            ("dlp", "Disneyland Paris"),
+                            ("tdr", "Tokyo Disney Resort"),
+                            ("hkdl", "Hong Kong Disneyland"),
+                            ("shdl", "Shanghai Disneyland"),
+                        ],
+                        default="wdw",
+                        max_length=10,
+                    ),
+                ),
+                ("start_date", models.DateField()),
+                ("end_date", models.DateField()),
+                ("notes", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="trips",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["start_date", "id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="TripDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("park", models.CharField(blank=True, max_length=100)),
+                ("notes", models.TextField(blank=True)),
+                (
+                    "outfit",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="trip_days",
+                        to="outfits.outfit",
+                    ),
+                ),
+                (
+                    "trip",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="days",
+                        to="trips.trip",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="trip",
+            index=models.Index(
+                fields=["user", "start_date"], name="trip_user_start_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="trip",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("end_date__gte", models.F("start_date"))),
+                name="trip_end_after_start",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="tripday",
+            constraint=models.UniqueConstraint(
+                fields=("trip", "date"), name="tripday_unique_date"
+            ),
+        ),
+    ]
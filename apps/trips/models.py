@@ -1 +1,165 @@
-# Create your models here.
+from django.conf import settings
+from django.db import models
+
+from apps.outfits.models import Outfit
+
+
+class Trip(models.Model):
+    """A Disney park vacation made of consecutive days."""
+
+    class Destination(models.TextChoices):
+        WDW = "wdw", "Walt Disney World"
+        DLR = "dlr", "Disneyland Resort"
+        DLP = "dlp", "Disneyland Paris"
+        TDR = "tdr", "Tokyo Disney Resort"
+        HKDL = "hkdl", "Hong Kong Disneyland"
+        SHDL = "shdl", "Shanghai Disneyland"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="trips",
+    )
+    name = models.CharField(max_length=255)
+    destination = models.CharField(
+        max_length=10, choices=Destination.choices, default=Destination.WDW
+    )
+    start_date = models.DateField()
+    end_date = models.DateField()
+    notes = models.TextField(blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["start_date", "id"]
+        indexes = [
+            models.Index(fields=["user", "start_date"], name="trip_user_start_idx"),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(end_date__gte=models.F("start_date")),
+                name="trip_end_after_start",
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def length(self) -> int:
+        return (self.end_date - self.start_date).days + 1
+
+
+class TripDay(models.Model):
+    """One calendar day of a trip, with the outfit planned for it."""
+
+    trip = models.ForeignKey(Trip, on_delete=models.CASCADE, related_name="days")
+    date = models.DateField()
+    park = models.CharField(max_length=100, blank=True)
+    outfit = models.ForeignKey(
+        Outfit,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="trip_days",
+    )
+    notes = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["trip", "date"], name="tripday_unique_date"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.trip.name} - {self.date:%a %b %d}"
+
+
+class SuggestionBatch(models.Model):
+    """A background job asking the LLM for outfits for every traveler and day."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    trip = models.ForeignKey(
+        Trip, on_delete=models.CASCADE, related_name="suggestion_batches"
+    )
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    # Shared preferences (budget, style, climateConsiderations)
+    preferences = models.JSONField(default=dict)
+
+    # Progress, counted in suggestions (traveler x day)
+    total = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    # Distinct LLM calls after deduplicating identical inputs
+    unique_inputs = models.PositiveIntegerField(default=0)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name_plural = "suggestion batches"
+
+    def __str__(self):
+        return f"{self.trip.name} suggestions ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.Status.DONE, self.Status.FAILED)
+
+    @property
+    def percent(self) -> int:
+        if not self.total:
+            return 100
+        return round(100 * (self.completed + self.failed) / self.total)
+
+
+class DaySuggestion(models.Model):
+    """One traveler's suggested outfit for one trip day."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    batch = models.ForeignKey(
+        SuggestionBatch, on_delete=models.CASCADE, related_name="suggestions"
+    )
+    day = models.ForeignKey(
+        TripDay, on_delete=models.CASCADE, related_name="suggestions"
+    )
+    traveler = models.CharField(max_length=100)
+    character = models.ForeignKey(
+        "characters.Character", on_delete=models.CASCADE, related_name="+"
+    )
+    # Hash of the SuggestOutfit inputs; identical inputs share one LLM call
+    input_key = models.CharField(max_length=64)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    # OutfitSuggestion as returned by BAML
+    result = models.JSONField(null=True, blank=True)
+    error = models.CharField(max_length=500, blank=True)
+
+    class Meta:
+        ordering = ["day__date", "traveler"]
+        indexes = [
+            models.Index(
+                fields=["batch", "input_key"], name="suggestion_batch_key_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.traveler} as {self.character.name} on {self.day.date}"
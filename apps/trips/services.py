@@ -0,0 +1,120 @@
+"""
+Trip calendar services.
+
+Loading and bulk-editing a trip's days happen in a bounded number of
+queries no matter how long the trip is.
+"""
+
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Prefetch, QuerySet
+
+from apps.outfits.models import Outfit, OutfitItem
+
+from .models import Trip, TripDay
+
+# Longest trip we'll generate days for
+MAX_TRIP_DAYS = 90
+
+
+class TripError(ValueError):
+    """Invalid trip dates or outfit assignments."""
+
+
+def date_range(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def validate_dates(start: date, end: date) -> None:
+    if end < start:
+        raise TripError("The trip can't end before it starts.")
+    if (end - start).days + 1 > MAX_TRIP_DAYS:
+        raise TripError(f"Trips can be at most {MAX_TRIP_DAYS} days long.")
+
+
+def calendar_days() -> QuerySet[TripDay]:
+    """
+    TripDays with outfit, items and character palettes loaded.
+
+    Three queries total for any number of days: days (joined to outfit and
+    its character), then items (joined to their characters).
+    """
+    items = OutfitItem.objects.select_related("character")
+    return TripDay.objects.select_related("outfit__character").prefetch_related(
+        Prefetch("outfit__items", queryset=items)
+    )
+
+
+def load_calendar(user, pk: int) -> Trip:
+    """
+    A user's trip with its whole calendar prefetched.
+
+    Raises:
+        Trip.DoesNotExist: If the trip doesn't exist or isn't the user's
+    """
+    return Trip.objects.prefetch_related(
+        Prefetch("days", queryset=calendar_days())
+    ).get(pk=pk, user=user)
+
+
+@transaction.atomic
+def create_trip(user, name: str, start_date: date, end_date: date, **fields) -> Trip:
+    """Create a trip and one TripDay per date."""
+    validate_dates(start_date, end_date)
+    trip = Trip.objects.create(
+        user=user, name=name, start_date=start_date, end_date=end_date, **fields
+    )
+    TripDay.objects.bulk_create(
+        [TripDay(trip=trip, date=day) for day in date_range(start_date, end_date)]
+    )
+    return trip
+
+
+@transaction.atomic
+def assign_outfits(trip: Trip, assignments: dict[int, int | None]) -> int:
+    """
+    Set (or clear) the outfit on many days at once.
+
+    Moving or swapping outfits between days is just a new mapping, applied
+    atomically in one UPDATE.
+
+    Args:
+        trip: Trip being edited
+        assignments: TripDay id -> Outfit id (None clears the day)
+
+    Returns:
+        Number of days changed
+
+    Raises:
+        TripError: If a day isn't part of the trip or an outfit isn't owned
+            by the trip's user
+    """
+    days = {
+        day.pk: day
+        for day in TripDay.objects.select_for_update().filter(
+            trip=trip, pk__in=assignments
+        )
+    }
+    if len(days) != len(assignments):
+        raise TripError("Some days don't belong to this trip.")
+
+    outfit_ids = {outfit_id for outfit_id in assignments.values() if outfit_id}
+    owned = set(
+        Outfit.objects.filter(user_id=trip.user_id, pk__in=outfit_ids).values_list(
+            "pk", flat=True
+        )
+    )
+    if owned != outfit_ids:
+        raise TripError("Some outfits aren't yours.")
+
+    changed = []
+    for day_id, outfit_id in assignments.items():
+        day = days[day_id]
+        if day.outfit_id != outfit_id:
+            day.outfit_id = outfit_id
+            changed.append(day)
+    TripDay.objects.bulk_update(changed, ["outfit"])
+    if changed:
+        trip.save(update_fields=["updated_at"])
+    return len(changed)
@@ -0,0 +1,212 @@
+"""
+Batched SuggestOutfit calls for a whole trip.
+
+A batch asks for one outfit per traveler per day. Identical inputs
+(same character, same preferences) are sent to the LLM once, calls fan
+out concurrently up to ``SUGGESTION_CONCURRENCY``, and each result is
+written as soon as it arrives so the trip page can poll for progress.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.ai.client import get_async_client, llm_timer
+from apps.characters.models import Character
+from baml_client import types
+
+from .models import DaySuggestion, SuggestionBatch, Trip
+from .services import TripError
+
+logger = logging.getLogger(__name__)
+
+BUDGETS = ["low", "medium", "high"]
+STYLES = ["casual", "dressy", "athletic", "vintage"]
+CLIMATES = ["hot", "mild", "cold", "rainy"]
+
+MAX_TRAVELERS = 10
+
+
+@dataclass
+class Traveler:
+    name: str
+    character: Character
+
+
+def baml_character(character: Character) -> dict:
+    """SuggestOutfit's Character input built from a cached character."""
+    color_names = [color.get("name", "") for color in character.colors]
+    color_names = [name for name in color_names if name]
+    return {
+        "name": character.name,
+        "movie": character.movie,
+        "category": character.category,
+        "primaryColors": color_names[:2],
+        "secondaryColors": color_names[2:],
+        "aestheticKeywords": [character.category] if character.category else [],
+    }
+
+
+def baml_preferences(preferences: dict) -> dict:
+    """SuggestOutfit's UserPreferences input."""
+    return {
+        "budget": preferences["budget"],
+        "style": preferences["style"],
+        "climateConsiderations": preferences["climateConsiderations"],
+        "existingWardrobe": [],
+    }
+
+
+def input_key(character: Character, preferences: dict) -> str:
+    """Stable hash of everything that goes into the prompt."""
+    payload = json.dumps(
+        {"character": baml_character(character), "preferences": preferences},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def validate_preferences(budget: str, style: str, climate: str) -> dict:
+    if budget not in BUDGETS or style not in STYLES or climate not in CLIMATES:
+        raise TripError("Please choose a budget, style and climate.")
+    return {"budget": budget, "style": style, "climateConsiderations": climate}
+
+
+@transaction.atomic
+def create_batch(
+    trip: Trip, travelers: list[Traveler], preferences: dict
+) -> SuggestionBatch:
+    """
+    Queue one suggestion per traveler per day of the trip.
+
+    Raises:
+        TripError: If there are no travelers or too many
+    """
+    if not travelers:
+        raise TripError("Add at least one traveler.")
+    if len(travelers) > MAX_TRAVELERS:
+        raise TripError(f"Suggestions support up to {MAX_TRAVELERS} travelers.")
+
+    batch = SuggestionBatch.objects.create(trip=trip, preferences=preferences)
+    # Per traveler, not per name: two travelers may share a name
+    keys = [input_key(traveler.character, preferences) for traveler in travelers]
+    suggestions = [
+        DaySuggestion(
+            batch=batch,
+            day=day,
+            traveler=traveler.name,
+            character=traveler.character,
+            input_key=key,
+        )
+        for day in trip.days.all()
+        for traveler, key in zip(travelers, keys)
+    ]
+    DaySuggestion.objects.bulk_create(suggestions)
+
+    batch.total = len(suggestions)
+    batch.unique_inputs = len(set(keys))
+    batch.save(update_fields=["total", "unique_inputs"])
+    return batch
+
+
+async def _suggest(client, semaphore: asyncio.Semaphore, key, character, preferences):
+    """Returns ``(key, result, error)``; failures don't cancel the batch."""
+    async with semaphore:
+        try:
+            with llm_timer("SuggestOutfit"):
+                result = await client.SuggestOutfit(
+                    character=types.Character(**character),
+                    preferences=preferences,
+                )
+        except Exception as e:
+            logger.error(f"SuggestOutfit failed for {character['name']}: {e}")
+            return key, None, str(e) or e.__class__.__name__
+    return key, result, ""
+
+
+async def _save_result(batch_id: int, key: str, result=None, error: str = "") -> None:
+    """Write one input's outcome to every suggestion sharing it."""
+    pending = DaySuggestion.objects.filter(
+        batch_id=batch_id, input_key=key, status=DaySuggestion.Status.PENDING
+    )
+    if error:
+        count = await pending.aupdate(
+            status=DaySuggestion.Status.FAILED, error=error[:500]
+        )
+        await SuggestionBatch.objects.filter(pk=batch_id).aupdate(
+            failed=F("failed") + count
+        )
+    else:
+        count = await pending.aupdate(
+            status=DaySuggestion.Status.DONE, result=result.model_dump()
+        )
+        await SuggestionBatch.objects.filter(pk=batch_id).aupdate(
+            completed=F("completed") + count
+        )
+
+
+async def arun_batch(batch_id: int) -> None:
+    """Run a batch's LLM calls concurrently, saving each as it completes."""
+    batch = await SuggestionBatch.objects.aget(pk=batch_id)
+    await SuggestionBatch.objects.filter(pk=batch_id).aupdate(
+        status=SuggestionBatch.Status.RUNNING
+    )
+
+    # One representative suggestion per distinct input
+    unique: dict[str, DaySuggestion] = {}
+    pending = DaySuggestion.objects.filter(
+        batch_id=batch_id, status=DaySuggestion.Status.PENDING
+    ).select_related("character")
+    async for suggestion in pending:
+        unique.setdefault(suggestion.input_key, suggestion)
+
+    client = get_async_client()
+    semaphore = asyncio.Semaphore(settings.SUGGESTION_CONCURRENCY)
+    preferences = types.UserPreferences(**baml_preferences(batch.preferences))
+    tasks = [
+        _suggest(
+            client,
+            semaphore,
+            key,
+            baml_character(suggestion.character),
+            preferences,
+        )
+        for key, suggestion in unique.items()
+    ]
+
+    failures = 0
+    for next_done in asyncio.as_completed(tasks):
+        key, result, error = await next_done
+        failures += bool(error)
+        await _save_result(batch_id, key, result=result, error=error)
+
+    status = SuggestionBatch.Status.DONE
+    if tasks and failures == len(tasks):
+        status = SuggestionBatch.Status.FAILED
+    await SuggestionBatch.objects.filter(pk=batch_id).aupdate(
+        status=status, finished_at=timezone.now()
+    )
+
+
+def run_batch(batch_id: int) -> None:
+    """
+    Synchronous entry point for background threads.
+
+    ``async_to_sync`` runs the ORM calls back on the calling thread, so the
+    thread's database connection is the one cleaned up when it finishes.
+    """
+    try:
+        async_to_sync(arun_batch)(batch_id)
+    except Exception:
+        SuggestionBatch.objects.filter(pk=batch_id).update(
+            status=SuggestionBatch.Status.FAILED, finished_at=timezone.now()
+        )
+        raise
@@ -1 +1,502 @@
-# Create your tests here.
+"""Tests for the trip calendar."""
+
+import asyncio
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.characters.models import Character
+from apps.outfits.services import create_outfit
+from baml_client import types
+
+from .ical import fold
+from .models import DaySuggestion, SuggestionBatch, Trip, TripDay
+from .services import TripError, assign_outfits, create_trip
+from .suggestions import Traveler, create_batch, run_batch
+
+
+@pytest.fixture
+def user(db):
+    return get_user_model().objects.create_user(
+        username="moana", email="moana@example.com", password="password"
+    )
+
+
+@pytest.fixture
+def other_user(db):
+    return get_user_model().objects.create_user(
+        username="maui", email="maui@example.com", password="password"
+    )
+
+
+@pytest.fixture
+def auth_client(client: Client, user):
+    client.force_login(user)
+    return client
+
+
+@pytest.fixture
+def heihei(db):
+    return Character.objects.create(
+        name="Heihei",
+        movie="Moana (2016)",
+        category="Sidekick",
+        colors=[
+            {"hex": "#8B4513", "name": "Brown", "usage": "Feathers"},
+            {"hex": "#DC143C", "name": "Red", "usage": "Comb"},
+        ],
+    )
+
+
+def make_trip(user, days: int, name="Vacation") -> Trip:
+    return create_trip(
+        user,
+        name=name,
+        start_date=date(2026, 3, 1),
+        end_date=date(2026, 3, days),
+    )
+
+
+def make_outfit(user, character, name="Outfit"):
+    return create_outfit(
+        user,
+        name=name,
+        character=character,
+        items=[
+            {"item_type": "top", "description": "Brown tee", "color_hex": "#8B4513"},
+            {"item_type": "shoes", "description": "Red flats", "color_hex": "#DC143C"},
+        ],
+    )
+
+
+def fill_calendar(trip: Trip, character) -> None:
+    assign_outfits(
+        trip,
+        {
+            day.pk: make_outfit(trip.user, character, name=f"Day {index}").pk
+            for index, day in enumerate(trip.days.all())
+        },
+    )
+
+
+def count_queries(client: Client, url: str) -> int:
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(queries)
+
+
+@pytest.mark.django_db
+class TestCreateTrip:
+    """Trips are created with one day per date."""
+
+    def test_creates_days(self, user):
+        trip = make_trip(user, 5)
+        assert trip.length == 5
+        assert list(trip.days.values_list("date", flat=True)) == [
+            date(2026, 3, day) for day in range(1, 6)
+        ]
+
+    def test_rejects_end_before_start(self, user):
+        with pytest.raises(TripError):
+            create_trip(
+                user,
+                name="Backwards",
+                start_date=date(2026, 3, 5),
+                end_date=date(2026, 3, 1),
+            )
+        assert not Trip.objects.exists()
+
+    def test_create_view(self, auth_client):
+        response = auth_client.post(
+            reverse("trips:create"),
+            {
+                "name": "Spring Break",
+                "start_date": "2026-03-01",
+                "end_date": "2026-03-04",
+                "destination": "dlr",
+            },
+        )
+        trip = Trip.objects.get()
+        assert response.status_code == 302
+        assert response.url == reverse("trips:detail", args=[trip.pk])
+        assert trip.destination == Trip.Destination.DLR
+        assert trip.days.count() == 4
+
+    def test_create_view_shows_date_errors(self, auth_client):
+        response = auth_client.post(
+            reverse("trips:create"),
+            {"name": "Oops", "start_date": "2026-03-05", "end_date": "2026-03-01"},
+        )
+        assert response.status_code == 200
+        assert b"can&#x27;t end before it starts" in response.content
+        assert not Trip.objects.exists()
+
+
+@pytest.mark.django_db
+class TestCalendarQueries:
+    """The calendar loads in a constant number of queries."""
+
+    def test_detail_query_count_is_constant(self, auth_client, user, heihei):
+        short = make_trip(user, 2, name="Weekend")
+        long = make_trip(user, 21, name="Three weeks")
+        fill_calendar(short, heihei)
+        fill_calendar(long, heihei)
+
+        short_queries = count_queries(
+            auth_client, reverse("trips:detail", args=[short.pk])
+        )
+        long_queries = count_queries(
+            auth_client, reverse("trips:detail", args=[long.pk])
+        )
+        assert short_queries == long_queries
+
+    def test_detail_renders_outfits(self, auth_client, user, heihei):
+        trip = make_trip(user, 3)
+        fill_calendar(trip, heihei)
+
+        response = auth_client.get(reverse("trips:detail", args=[trip.pk]))
+        assert b"Day 0" in response.content
+        assert b"Heihei" in response.content
+        assert b"#DC143C" in response.content
+
+    def test_other_users_trip_is_404(self, client, other_user, user):
+        trip = make_trip(user, 2)
+        client.force_login(other_user)
+        response = client.get(reverse("trips:detail", args=[trip.pk]))
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestAssignOutfits:
+    """Bulk assignment is atomic and scoped to the trip's owner."""
+
+    def test_swap_days(self, user, heihei):
+        trip = make_trip(user, 2)
+        first, second = trip.days.all()
+        a = make_outfit(user, heihei, name="A")
+        b = make_outfit(user, heihei, name="B")
+        assign_outfits(trip, {first.pk: a.pk, second.pk: b.pk})
+
+        with CaptureQueriesContext(connection) as queries:
+            changed = assign_outfits(trip, {first.pk: b.pk, second.pk: a.pk})
+
+        assert changed == 2
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert (first.outfit_id, second.outfit_id) == (b.pk, a.pk)
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        # One bulk UPDATE for the days, one to touch the trip
+        assert len(updates) == 2
+
+    def test_clear_day(self, user, heihei):
+        trip = make_trip(user, 1)
+        day = trip.days.get()
+        assign_outfits(trip, {day.pk: make_outfit(user, heihei).pk})
+        assign_outfits(trip, {day.pk: None})
+        day.refresh_from_db()
+        assert day.outfit is None
+
+    def test_rejects_other_users_outfit(self, user, other_user, heihei):
+        trip = make_trip(user, 2)
+        first, second = trip.days.all()
+        mine = make_outfit(user, heihei)
+        theirs = make_outfit(other_user, heihei)
+
+        with pytest.raises(TripError):
+            assign_outfits(trip, {first.pk: mine.pk, second.pk: theirs.pk})
+
+        # Nothing was applied
+        assert not TripDay.objects.filter(outfit__isnull=False).exists()
+
+    def test_rejects_days_from_other_trips(self, user, heihei):
+        trip = make_trip(user, 1)
+        other = make_trip(user, 1, name="Other")
+        outfit = make_outfit(user, heihei)
+        with pytest.raises(TripError):
+            assign_outfits(trip, {other.days.get().pk: outfit.pk})
+
+    def test_assign_view(self, auth_client, user, heihei):
+        trip = make_trip(user, 2)
+        first, second = trip.days.all()
+        outfit = make_outfit(user, heihei)
+
+        response = auth_client.post(
+            reverse("trips:assign", args=[trip.pk]),
+            {f"day_{first.pk}": outfit.pk, f"day_{second.pk}": ""},
+        )
+        assert response.status_code == 302
+        first.refresh_from_db()
+        assert first.outfit == outfit
+
+    def test_assign_view_rejects_bad_input(self, auth_client, user):
+        trip = make_trip(user, 1)
+        response = auth_client.post(
+            reverse("trips:assign", args=[trip.pk]),
+            {f"day_{trip.days.get().pk}": "nope"},
+        )
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestCalendarExport:
+    """The .ics export streams one event per day."""
+
+    def test_streams_events(self, auth_client, user, heihei):
+        trip = make_trip(user, 4, name="Moana; Maui, & friends")
+        fill_calendar(trip, heihei)
+
+        response = auth_client.get(reverse("trips:calendar_ics", args=[trip.pk]))
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"].startswith("text/calendar")
+        assert "moana-maui-friends.ics" in response["Content-Disposition"]
+
+        body = b"".join(response.streaming_content).decode()
+        assert body.startswith("BEGIN:VCALENDAR\r\n")
+        assert body.endswith("END:VCALENDAR\r\n")
+        assert body.count("BEGIN:VEVENT") == 4
+        assert "DTSTART;VALUE=DATE:20260301" in body
+        assert r"Moana\; Maui\, & friends" in body
+
+    def test_fold_long_lines(self):
+        line = "DESCRIPTION:" + "x" * 200
+        folded = fold(line)
+        assert folded.endswith("\r\n")
+        parts = folded.removesuffix("\r\n").split("\r\n ")
+        assert all(len(part.encode()) <= 75 for part in parts)
+        assert "".join(parts) == line
+
+
+class FakeSuggestClient:
+    """Async SuggestOutfit stand-in that tracks calls and concurrency."""
+
+    def __init__(self, fail_for=()):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_for = set(fail_for)
+
+    async def SuggestOutfit(self, character, preferences):
+        self.calls.append(character.name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if character.name in self.fail_for:
+                raise RuntimeError("Gemini unavailable")
+            return types.OutfitSuggestion(
+                items=[
+                    types.ClothingItem(
+                        itemType="top",
+                        description=f"{character.name} tee",
+                        color=character.primaryColors[0],
+                    )
+                ],
+                explanation=f"Channel {character.name}",
+                colorHarmony="Matches",
+                styleNotes="Comfy",
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def fake_suggest(monkeypatch):
+    fake = FakeSuggestClient()
+    monkeypatch.setattr("apps.trips.suggestions.get_async_client", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def started(monkeypatch):
+    """Capture batches the views would start in the background."""
+    batches = []
+    monkeypatch.setattr("apps.trips.views._start_suggestions", batches.append)
+    return batches
+
+
+@pytest.fixture
+def characters(heihei):
+    pua = Character.objects.create(
+        name="Pua",
+        movie="Moana (2016)",
+        category="Sidekick",
+        colors=[{"hex": "#FFC0CB", "name": "Pink", "usage": "Body"}],
+    )
+    return {"heihei": heihei, "pua": pua}
+
+
+PREFERENCES = {"budget": "medium", "style": "casual", "climateConsiderations": "hot"}
+
+
+@pytest.mark.django_db
+class TestSuggestionBatch:
+    """Batched suggestions fan out concurrently and dedupe inputs."""
+
+    def test_dedupes_identical_inputs(self, user, characters, fake_suggest):
+        trip = make_trip(user, 6)
+        travelers = [
+            Traveler("Mom", characters["heihei"]),
+            Traveler("Dad", characters["heihei"]),
+            Traveler("Kid", characters["pua"]),
+        ]
+        batch = create_batch(trip, travelers, PREFERENCES)
+        assert batch.total == 18
+        assert batch.unique_inputs == 2
+
+        run_batch(batch.pk)
+
+        batch.refresh_from_db()
+        assert sorted(fake_suggest.calls) == ["Heihei", "Pua"]
+        assert batch.status == SuggestionBatch.Status.DONE
+        assert batch.completed == 18
+        assert batch.finished_at is not None
+        suggestion = DaySuggestion.objects.filter(traveler="Kid").first()
+        assert suggestion.result["items"][0]["description"] == "Pua tee"
+
+    def test_travelers_sharing_a_name(self, user, characters, fake_suggest):
+        trip = make_trip(user, 2)
+        travelers = [
+            Traveler("Mom", characters["heihei"]),
+            Traveler("Mom", characters["pua"]),
+        ]
+        batch = create_batch(trip, travelers, PREFERENCES)
+        assert batch.unique_inputs == 2
+
+        run_batch(batch.pk)
+
+        assert sorted(fake_suggest.calls) == ["Heihei", "Pua"]
+        for suggestion in DaySuggestion.objects.select_related("character"):
+            description = suggestion.result["items"][0]["description"]
+            assert description == f"{suggestion.character.name} tee"
+
+    def test_concurrency_is_bounded(self, user, fake_suggest, settings):
+        settings.SUGGESTION_CONCURRENCY = 3
+        trip = make_trip(user, 1)
+        travelers = [
+            Traveler(
+                f"Traveler {index}",
+                Character.objects.create(
+                    name=f"Character {index}",
+                    movie="Movie",
+                    category="Classic",
+                    colors=[{"hex": "#000000", "name": "Black", "usage": "All"}],
+                ),
+            )
+            for index in range(8)
+        ]
+        batch = create_batch(trip, travelers, PREFERENCES)
+
+        run_batch(batch.pk)
+
+        assert len(fake_suggest.calls) == 8
+        assert 1 < fake_suggest.max_in_flight <= 3
+
+    def test_failures_are_recorded(self, user, characters, fake_suggest):
+        fake_suggest.fail_for = {"Pua"}
+        trip = make_trip(user, 2)
+        batch = create_batch(
+            trip,
+            [Traveler("Mom", characters["heihei"]), Traveler("Kid", characters["pua"])],
+            PREFERENCES,
+        )
+
+        run_batch(batch.pk)
+
+        batch.refresh_from_db()
+        assert batch.status == SuggestionBatch.Status.DONE
+        assert (batch.completed, batch.failed) == (2, 2)
+        failed = DaySuggestion.objects.filter(status=DaySuggestion.Status.FAILED)
+        assert set(failed.values_list("traveler", flat=True)) == {"Kid"}
+        assert failed.first().error == "Gemini unavailable"
+
+    def test_requires_travelers(self, user):
+        with pytest.raises(TripError):
+            create_batch(make_trip(user, 1), [], PREFERENCES)
+
+
+@pytest.mark.django_db
+class TestSuggestionViews:
+    """The trip page starts batches and polls their progress."""
+
+    def test_suggest_starts_background_batch(
+        self, auth_client, user, characters, started
+    ):
+        trip = make_trip(user, 3)
+        response = auth_client.post(
+            reverse("trips:suggest", args=[trip.pk]),
+            {
+                "traveler_name[]": ["Mom", ""],
+                "traveler_character[]": ["heihei", ""],
+                "budget": "low",
+                "style": "casual",
+                "climate": "hot",
+            },
+        )
+        assert response.status_code == 200
+        (batch,) = started
+        assert batch.total == 3
+        # Still running, so the partial keeps polling
+        poll_url = reverse("trips:suggestions", args=[trip.pk, batch.pk])
+        assert f'hx-get="{poll_url}"'.encode() in response.content
+
+    def test_unknown_character(self, auth_client, user, started):
+        trip = make_trip(user, 1)
+        response = auth_client.post(
+            reverse("trips:suggest", args=[trip.pk]),
+            {
+                "traveler_name[]": ["Mom"],
+                "traveler_character[]": ["Nobody"],
+                "budget": "low",
+                "style": "casual",
+                "climate": "hot",
+            },
+        )
+        assert b"Characters page" in response.content
+        assert not started
+        assert not SuggestionBatch.objects.exists()
+
+    def test_finished_batch_stops_polling(
+        self, auth_client, user, characters, fake_suggest
+    ):
+        trip = make_trip(user, 2)
+        batch = create_batch(trip, [Traveler("Kid", characters["pua"])], PREFERENCES)
+        run_batch(batch.pk)
+
+        url = reverse("trips:suggestions", args=[trip.pk, batch.pk])
+        response = auth_client.get(url)
+        assert b"hx-trigger" not in response.content
+        assert b"Pua tee" in response.content
+
+    def test_results_query_count_is_constant(
+        self, auth_client, user, characters, fake_suggest
+    ):
+        small = make_trip(user, 1, name="Small")
+        large = make_trip(user, 10, name="Large")
+        for trip in (small, large):
+            batch = create_batch(
+                trip,
+                [
+                    Traveler("Mom", characters["heihei"]),
+                    Traveler("Kid", characters["pua"]),
+                ],
+                PREFERENCES,
+            )
+            run_batch(batch.pk)
+
+        assert count_queries(
+            auth_client, reverse("trips:detail", args=[small.pk])
+        ) == count_queries(auth_client, reverse("trips:detail", args=[large.pk]))
+
+    def test_other_users_batch_is_404(self, client, other_user, user, characters):
+        trip = make_trip(user, 1)
+        batch = create_batch(trip, [Traveler("Kid", characters["pua"])], PREFERENCES)
+        client.force_login(other_user)
+        response = client.get(reverse("trips:suggestions", args=[trip.pk, batch.pk]))
+        assert response.status_code == 404
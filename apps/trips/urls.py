@@ -1,18 +1,20 @@
 from django.urls import path
-from django.views.generic import TemplateView
+
+from . import views
 
 app_name = "trips"
 
 urlpatterns = [
-    path("", TemplateView.as_view(template_name="trips/list.html"), name="list"),
-    path(
-        "create/",
-        TemplateView.as_view(template_name="trips/create.html"),
-        name="create",
-    ),
+    path("", views.trip_list, name="list"),
+    path("create/", views.trip_create, name="create"),
+    path("<int:pk>/", views.trip_detail, name="detail"),
+    path("<int:pk>/assign/", views.trip_assign, name="assign"),
+    path("<int:pk>/suggest/", views.trip_suggest, name="suggest"),
     path(
-        "<int:pk>/",
-        TemplateView.as_view(template_name="trips/detail.html"),
-        name="detail",
+        "<int:pk>/suggestions/<int:batch_id>/",
+        views.trip_suggestions,
+        name="suggestions",
     ),
+    path("<int:pk>/calendar.ics", views.trip_calendar_ics, name="calendar_ics"),
+    path("<int:pk>/delete/", views.trip_delete, name="delete"),
 ]
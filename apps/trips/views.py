@@ -1 +1,252 @@
-# Create your views here.
+from datetime import date
+
+from django.contrib.auth.decorators import login_required
+from django.db.models import Prefetch, QuerySet
+from django.db.models.functions import Lower
+from django.http import Http404, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.text import slugify
+from django.views.decorators.http import require_http_methods
+
+from apps.characters.models import Character
+from apps.core.background import run_in_background
+from apps.outfits.models import Outfit
+
+from .ical import iter_trip_calendar
+from .models import DaySuggestion, SuggestionBatch, Trip
+from .services import TripError, assign_outfits, create_trip, load_calendar
+from .suggestions import (
+    BUDGETS,
+    CLIMATES,
+    STYLES,
+    Traveler,
+    create_batch,
+    run_batch,
+    validate_preferences,
+)
+
+
+def trip_list(request: HttpRequest) -> HttpResponse:
+    """The user's trips, soonest first."""
+    trips = None
+    if request.user.is_authenticated:
+        trips = Trip.objects.filter(user=request.user)
+    return render(request, "trips/list.html", {"trips": trips})
+
+
+def _parse_date(value: str) -> date | None:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def trip_create(request: HttpRequest) -> HttpResponse:
+    """Create a trip; one calendar day is generated per date."""
+    error = None
+    if request.method == "POST":
+        name = request.POST.get("name", "").strip()
+        start = _parse_date(request.POST.get("start_date", ""))
+        end = _parse_date(request.POST.get("end_date", ""))
+        destination = request.POST.get("destination", Trip.Destination.WDW)
+        if not name:
+            error = "Please give your trip a name."
+        elif start is None or end is None:
+            error = "Please choose start and end dates."
+        elif destination not in Trip.Destination.values:
+            error = "Please choose a destination."
+        else:
+            try:
+                trip = create_trip(
+                    request.user,
+                    name=name[:255],
+                    start_date=start,
+                    end_date=end,
+                    destination=destination,
+                    notes=request.POST.get("notes", "").strip(),
+                )
+            except TripError as e:
+                error = str(e)
+            else:
+                return redirect("trips:detail", pk=trip.pk)
+
+    return render(
+        request,
+        "trips/create.html",
+        {"destinations": Trip.Destination.choices, "error": error},
+    )
+
+
+@login_required
+def trip_detail(request: HttpRequest, pk: int) -> HttpResponse:
+    """
+    The trip calendar.
+
+    Every day's outfit, items and character palette load in a fixed number
+    of queries (see services.load_calendar), however long the trip is.
+    """
+    try:
+        trip = load_calendar(request.user, pk)
+    except Trip.DoesNotExist:
+        raise Http404("Trip not found")
+
+    assert request.user.is_authenticated  # login_required
+    outfits = Outfit.objects.filter(user=request.user).only("id", "name")
+    return render(
+        request,
+        "trips/detail.html",
+        {
+            "trip": trip,
+            "outfits": outfits,
+            "batch": _batches(trip).first(),
+            "budgets": BUDGETS,
+            "styles": STYLES,
+            "climates": CLIMATES,
+            "error": request.GET.get("error"),
+        },
+    )
+
+
+def _batches(trip: Trip) -> QuerySet[SuggestionBatch]:
+    """The trip's batches with suggestions, days and characters loaded."""
+    suggestions = DaySuggestion.objects.select_related("day", "character")
+    return SuggestionBatch.objects.filter(trip=trip).prefetch_related(
+        Prefetch("suggestions", queryset=suggestions)
+    )
+
+
+def _start_suggestions(batch: SuggestionBatch) -> None:
+    """Run a suggestion batch without blocking the response."""
+    run_in_background("suggestions", run_batch, batch.pk)
+
+
+def _parse_travelers(request: HttpRequest) -> list[Traveler]:
+    """
+    Travelers from ``traveler_name[]`` / ``traveler_character[]`` fields.
+
+    Characters are matched by name (case-insensitive) against the catalog
+    in one query.
+
+    Raises:
+        TripError: If a character isn't in the catalog
+    """
+    rows = [
+        (name.strip(), character.strip())
+        for name, character in zip(
+            request.POST.getlist("traveler_name[]"),
+            request.POST.getlist("traveler_character[]"),
+        )
+        if character.strip()
+    ]
+    wanted = {character.lower() for _, character in rows}
+    found: dict[str, Character] = {}
+    for character in (
+        Character.objects.annotate(name_lower=Lower("name"))
+        .filter(name_lower__in=wanted)
+        .order_by("-updated_at")
+    ):
+        found.setdefault(character.name_lower, character)
+
+    missing = wanted - found.keys()
+    if missing:
+        raise TripError(
+            f"Search for {', '.join(sorted(missing))} on the Characters page first."
+        )
+    return [
+        Traveler(
+            name=name[:100] or f"Traveler {index}",
+            character=found[character.lower()],
+        )
+        for index, (name, character) in enumerate(rows, start=1)
+    ]
+
+
+@login_required
+@require_http_methods(["POST"])
+def trip_suggest(request: HttpRequest, pk: int) -> HttpResponse:
+    """
+    Start a batch of AI outfit suggestions for every traveler and day.
+
+    The LLM calls run in the background; the response is the progress
+    partial, which polls ``trip_suggestions`` until the batch finishes.
+    """
+    trip = get_object_or_404(Trip, pk=pk, user=request.user)
+    try:
+        travelers = _parse_travelers(request)
+        preferences = validate_preferences(
+            request.POST.get("budget", ""),
+            request.POST.get("style", ""),
+            request.POST.get("climate", ""),
+        )
+        batch = create_batch(trip, travelers, preferences)
+    except TripError as e:
+        return render(
+            request,
+            "trips/partials/suggestions.html",
+            {"trip": trip, "suggest_error": str(e)},
+        )
+
+    _start_suggestions(batch)
+    return render(
+        request, "trips/partials/suggestions.html", {"trip": trip, "batch": batch}
+    )
+
+
+@login_required
+def trip_suggestions(request: HttpRequest, pk: int, batch_id: int) -> HttpResponse:
+    """Progress and results of a suggestion batch (polled by HTMX)."""
+    trip = get_object_or_404(Trip, pk=pk, user=request.user)
+    batch = get_object_or_404(_batches(trip), pk=batch_id)
+    return render(
+        request, "trips/partials/suggestions.html", {"trip": trip, "batch": batch}
+    )
+
+
+@login_required
+@require_http_methods(["POST"])
+def trip_assign(request: HttpRequest, pk: int) -> HttpResponse:
+    """
+    Assign, move or clear outfits on many days in one transaction.
+
+    Expects ``day_<TripDay id>`` fields whose value is an Outfit id, or empty
+    to clear the day.
+    """
+    trip = get_object_or_404(Trip, pk=pk, user=request.user)
+
+    assignments: dict[int, int | None] = {}
+    for key in request.POST:
+        if not key.startswith("day_"):
+            continue
+        day_id = key.removeprefix("day_")
+        value = request.POST.get(key, "")
+        if not day_id.isdigit() or (value and not value.isdigit()):
+            return HttpResponse("Invalid assignment", status=400)
+        assignments[int(day_id)] = int(value) if value else None
+
+    try:
+        assign_outfits(trip, assignments)
+    except TripError as e:
+        return HttpResponse(str(e), status=400)
+    return redirect("trips:detail", pk=trip.pk)
+
+
+@login_required
+def trip_calendar_ics(request: HttpRequest, pk: int) -> StreamingHttpResponse:
+    """Stream the trip as an .ics file, generated lazily day by day."""
+    trip = get_object_or_404(Trip, pk=pk, user=request.user)
+    response = StreamingHttpResponse(
+        iter_trip_calendar(trip), content_type="text/calendar; charset=utf-8"
+    )
+    filename = slugify(trip.name) or "trip"
+    response["Content-Disposition"] = f'attachment; filename="{filename}.ics"'
+    return response
+
+
+@login_required
+@require_http_methods(["POST"])
+def trip_delete(request: HttpRequest, pk: int) -> HttpResponse:
+    trip = get_object_or_404(Trip, pk=pk, user=request.user)
+    trip.delete()
+    return redirect("trips:list")
@@ -0,0 +1,19 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+_file_map = {
+
+    "main.baml": "// Disneybound Planner - BAML Configuration\n// This file defines the LLM functions for outfit suggestions and character matching.\n\n// =============================================================================\n// CLIENT CONFIGURATION\n// =============================================================================\n\nclient<llm> Gemini {\n  provider google-ai\n  options {\n    model \"gemini-2.5-pro\"\n    api_key env.GOOGLE_API_KEY\n  }\n}\n\n// =============================================================================\n// DATA TYPES\n// =============================================================================\n\nclass Character {\n  name string\n  movie string\n  category string @description(\"Princess, Villain, Pixar, Marvel, Star Wars, etc.\")\n  primaryColors string[] @description(\"Main colors associated with this character\")\n  secondaryColors string[] @description(\"Accent colors\")\n  aestheticKeywords string[] @description(\"Style descriptors like 'elegant', 'rugged', 'whimsical'\")\n}\n\nclass ColorInfo {\n  hex string @description(\"Hex color code like #FFD700\")\n  name string @description(\"Human readable color name like 'Bright Yellow'\")\n  usage string @description(\"Where this color appears, e.g. 'Primary body color'\")\n}\n\nclass CharacterSearchResult {\n  found bool @description(\"Whether a matching Disney character was found\")\n  name string @description(\"Character's name\")\n  movie string @description(\"Film or show the character is from, with year if known\")\n  description string @description(\"Brief description of the character (1-2 sentences)\")\n  category string @description(\"Princess, Villain, Pixar, Sidekick, Classic, etc.\")\n  colors ColorInfo[] @description(\"3-5 signature colors for this character\")\n  notFoundMessage string? @description(\"Helpful message if character wasn't found\")\n}\n\nclass ClothingItem {\n  itemType string @description(\"top, bottom, shoes, accessory, dress, jacket\")\n  description string\n  color string\n  productUrl string?\n}\n\nclass OutfitSuggestion {\n  items ClothingItem[]\n  explanation string @description(\"Why this outfit works for the character\")\n  colorHarmony string @description(\"How the colors relate to the character\")\n  styleNotes string @description(\"Tips for wearing this outfit\")\n}\n\nclass UserPreferences {\n  budget string @description(\"low, medium, high\")\n  style string @description(\"casual, dressy, athletic, vintage\")\n  climateConsiderations string @description(\"hot, mild, cold, rainy\")\n  existingWardrobe ClothingItem[] @description(\"Items the user already owns\")\n}\n\n// =============================================================================\n// FUNCTIONS\n// =============================================================================\n\nfunction SuggestOutfit(character: Character, preferences: UserPreferences) -> OutfitSuggestion {\n  client Gemini\n  prompt #\"\n    You are a fashion expert specializing in Disneybounding - creating everyday outfits\n    inspired by Disney characters that are appropriate for theme parks.\n\n    Character to bound:\n    - Name: {{ character.name }}\n    - Movie: {{ character.movie }}\n    - Category: {{ character.category }}\n    - Primary Colors: {{ character.primaryColors }}\n    - Secondary Colors: {{ character.secondaryColors }}\n    - Aesthetic: {{ character.aestheticKeywords }}\n\n    User Preferences:\n    - Budget: {{ preferences.budget }}\n    - Style: {{ preferences.style }}\n    - Weather: {{ preferences.climateConsiderations }}\n\n    User's existing wardrobe items:\n    {{ preferences.existingWardrobe }}\n\n    Create an outfit suggestion that:\n    1. Captures the essence of the character through color and style\n    2. Uses everyday clothing (no costumes)\n    3. Is practical for walking around a theme park\n    4. Incorporates items from the user's wardrobe when possible\n    5. Fits the user's budget and style preferences\n\n    {{ ctx.output_format }}\n  \"#\n}\n\nfunction MatchCharacterByColors(colors: string[]) -> Character[] {\n  client Gemini\n  prompt #\"\n    You are a Disney character expert. Given these colors from someone's wardrobe,\n    suggest Disney characters that would work well for a Disneybound outfit.\n\n    Colors available: {{ colors }}\n\n    Suggest 3-5 Disney characters whose color palettes match well with these colors.\n    For each character, explain why the color match works.\n\n    {{ ctx.output_format }}\n  \"#\n}\n\nfunction GenerateColorPalette(character: Character) -> string[] {\n  client Gemini\n  prompt #\"\n    You are a color expert specializing in Disney character aesthetics.\n\n    For the character {{ character.name }} from {{ character.movie }}:\n    - Category: {{ character.category }}\n    - Known primary colors: {{ character.primaryColors }}\n\n    Generate a complete Disneybound color palette with hex codes.\n    Include:\n    - 2-3 primary colors (the most recognizable character colors)\n    - 2-3 secondary/accent colors\n    - 1-2 neutral colors that work well with the palette\n\n    Return as an array of hex color codes.\n\n    {{ ctx.output_format }}\n  \"#\n}\n\nfunction DescribeOutfit(items: ClothingItem[]) -> string {\n  client Gemini\n  prompt #\"\n    Write a short, engaging description of this Disneybound outfit for sharing on social media.\n    Keep it under 280 characters.\n\n    Outfit items:\n    {{ items }}\n\n    The description should:\n    - Mention the character inspiration if evident\n    - Highlight key pieces\n    - Be fun and enthusiastic\n    - Include relevant hashtags\n\n    {{ ctx.output_format }}\n  \"#\n}\n\nfunction SearchCharacter(query: string) -> CharacterSearchResult {\n  client Gemini\n  prompt #\"\n    You are a Disney character expert helping users find characters for Disneybounding\n    (creating everyday outfits inspired by Disney characters).\n\n    User's search query: \"{{ query }}\"\n\n    Identify the Disney character the user is looking for. Handle:\n    - Exact names (\"Flounder\")\n    - Partial names (\"the fish from little mermaid\")\n    - Descriptions (\"Ariel's yellow fish friend\")\n    - Misspellings and variations\n\n    If you identify a Disney character:\n    - Set found to true\n    - Provide the character's full name\n    - Include the film/show name with year\n    - Write a brief 1-2 sentence description\n    - Categorize them (Princess, Villain, Sidekick, Pixar, Classic, Marvel, Star Wars, etc.)\n    - List 3-5 signature colors with hex codes that someone could use for Disneybounding\n\n    If you cannot identify a Disney character:\n    - Set found to false\n    - Provide a helpful notFoundMessage suggesting how to refine the search\n\n    For the colors, focus on the character's most recognizable visual elements\n    that would be useful for creating a Disneybound outfit.\n\n    {{ ctx.output_format }}\n  \"#\n}\n\n// =============================================================================\n// TEST CASES\n// =============================================================================\n\ntest SuggestOutfit {\n  functions [SuggestOutfit]\n  args {\n    character {\n      name \"Cinderella\"\n      movie \"Cinderella\"\n      category \"Princess\"\n      primaryColors [\"light blue\", \"silver\"]\n      secondaryColors [\"white\", \"pink\"]\n      aestheticKeywords [\"elegant\", \"dreamy\", \"romantic\"]\n    }\n    preferences {\n      budget \"medium\"\n      style \"dressy\"\n      climateConsiderations \"hot\"\n      existingWardrobe [\n        {\n          itemType \"top\"\n          description \"Light blue blouse\"\n          color \"light blue\"\n        }\n      ]\n    }\n  }\n}\n\ntest SearchCharacterFlounder {\n  functions [SearchCharacter]\n  args {\n    query \"Flounder\"\n  }\n}\n\ntest SearchCharacterFuzzy {\n  functions [SearchCharacter]\n  args {\n    query \"the fish from little mermaid\"\n  }\n}\n\ntest SearchCharacterNotFound {\n  functions [SearchCharacter]\n  args {\n    query \"asdfghjkl random gibberish\"\n  }\n}\n",
+}
+
+def get_baml_files():
+    return _file_map
\ No newline at end of file
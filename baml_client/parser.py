@@ -0,0 +1,94 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+
+
+from . import stream_types, types
+from .runtime import DoNotUseDirectlyCallManager, BamlCallOptions
+
+class LlmResponseParser:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def DescribeOutfit(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="DescribeOutfit", llm_response=llm_response, mode="request")
+        return typing.cast(str, __result__)
+
+    def GenerateColorPalette(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List[str]:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="GenerateColorPalette", llm_response=llm_response, mode="request")
+        return typing.cast(typing.List[str], __result__)
+
+    def MatchCharacterByColors(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.Character"]:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="MatchCharacterByColors", llm_response=llm_response, mode="request")
+        return typing.cast(typing.List["types.Character"], __result__)
+
+    def SearchCharacter(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.CharacterSearchResult:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="SearchCharacter", llm_response=llm_response, mode="request")
+        return typing.cast(types.CharacterSearchResult, __result__)
+
+    def SuggestOutfit(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.OutfitSuggestion:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="SuggestOutfit", llm_response=llm_response, mode="request")
+        return typing.cast(types.OutfitSuggestion, __result__)
+
+    
+
+class LlmStreamParser:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def DescribeOutfit(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="DescribeOutfit", llm_response=llm_response, mode="stream")
+        return typing.cast(str, __result__)
+
+    def GenerateColorPalette(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List[str]:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="GenerateColorPalette", llm_response=llm_response, mode="stream")
+        return typing.cast(typing.List[str], __result__)
+
+    def MatchCharacterByColors(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["stream_types.Character"]:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="MatchCharacterByColors", llm_response=llm_response, mode="stream")
+        return typing.cast(typing.List["stream_types.Character"], __result__)
+
+    def SearchCharacter(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.CharacterSearchResult:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="SearchCharacter", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.CharacterSearchResult, __result__)
+
+    def SuggestOutfit(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.OutfitSuggestion:
+        __result__ = self.__options.merge_options(baml_options).parse_response(function_name="SuggestOutfit", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.OutfitSuggestion, __result__)
+
+    
\ No newline at end of file
@@ -0,0 +1,86 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+from pydantic import BaseModel, ConfigDict, Field
+
+import baml_py
+
+from . import types
+
+StreamStateValueT = typing.TypeVar('StreamStateValueT')
+class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
+    value: StreamStateValueT
+    state: typing_extensions.Literal["Pending", "Incomplete", "Complete"]
+# #########################################################################
+# Generated classes (6)
+# #########################################################################
+
+class Character(BaseModel):
+    name: typing.Optional[str] = None
+    movie: typing.Optional[str] = None
+    category: typing.Optional[str] = Field(default=None, description='Princess, Villain, Pixar, Marvel, Star Wars, etc.')
+    primaryColors: typing.List[str] = Field(description='Main colors associated with this character')
+    secondaryColors: typing.List[str] = Field(description='Accent colors')
+    aestheticKeywords: typing.List[str] = Field(description='Style descriptors like \'elegant\', \'rugged\', \'whimsical\'')
+
+class CharacterSearchResult(BaseModel):
+    found: typing.Optional[bool] = Field(default=None, description='Whether a matching Disney character was found')
+    name: typing.Optional[str] = Field(default=None, description='Character\'s name')
+    movie: typing.Optional[str] = Field(default=None, description='Film or show the character is from, with year if known')
+    description: typing.Optional[str] = Field(default=None, description='Brief description of the character (1-2 sentences)')
+    category: typing.Optional[str] = Field(default=None, description='Princess, Villain, Pixar, Sidekick, Classic, etc.')
+    colors: typing.List["ColorInfo"] = Field(description='3-5 signature colors for this character')
+    notFoundMessage: typing.Optional[str] = Field(default=None, description='Helpful message if character wasn\'t found')
+
+class ClothingItem(BaseModel):
+    itemType: typing.Optional[str] = Field(default=None, description='top, bottom, shoes, accessory, dress, jacket')
+    description: typing.Optional[str] = None
+    color: typing.Optional[str] = None
+    productUrl: typing.Optional[str] = None
+
+class ColorInfo(BaseModel):
+    hex: typing.Optional[str] = Field(default=None, description='Hex color code like #FFD700')
+    name: typing.Optional[str] = Field(default=None, description='Human readable color name like \'Bright Yellow\'')
+    usage: typing.Optional[str] = Field(default=None, description='Where this color appears, e.g. \'Primary body color\'')
+
+class OutfitSuggestion(BaseModel):
+    items: typing.List["ClothingItem"]
+    explanation: typing.Optional[str] = Field(default=None, description='Why this outfit works for the character')
+    colorHarmony: typing.Optional[str] = Field(default=None, description='How the colors relate to the character')
+    styleNotes: typing.Optional[str] = Field(default=None, description='Tips for wearing this outfit')
+
+class UserPreferences(BaseModel):
+    budget: typing.Optional[str] = Field(default=None, description='low, medium, high')
+    style: typing.Optional[str] = Field(default=None, description='casual, dressy, athletic, vintage')
+    climateConsiderations: typing.Optional[str] = Field(default=None, description='hot, mild, cold, rainy')
+    existingWardrobe: typing.List["ClothingItem"] = Field(description='Items the user already owns')
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
+
+
+# #########################################################################
+# Model rebuilds (6)
+# #########################################################################
+# Resolve string forward references now that every model above is defined so
+# class declaration order never breaks Pydantic construction (issue #793).
+# Recursive models are intentionally omitted (Pydantic resolves those lazily;
+# eagerly rebuilding them can recurse).
+Character.model_rebuild()
+CharacterSearchResult.model_rebuild()
+ClothingItem.model_rebuild()
+ColorInfo.model_rebuild()
+OutfitSuggestion.model_rebuild()
+UserPreferences.model_rebuild()
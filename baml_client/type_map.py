@@ -0,0 +1,38 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+from . import types
+from . import stream_types
+
+
+type_map = {
+
+    "types.Character": types.Character,
+    "stream_types.Character": stream_types.Character,
+
+    "types.CharacterSearchResult": types.CharacterSearchResult,
+    "stream_types.CharacterSearchResult": stream_types.CharacterSearchResult,
+
+    "types.ClothingItem": types.ClothingItem,
+    "stream_types.ClothingItem": stream_types.ClothingItem,
+
+    "types.ColorInfo": types.ColorInfo,
+    "stream_types.ColorInfo": stream_types.ColorInfo,
+
+    "types.OutfitSuggestion": types.OutfitSuggestion,
+    "stream_types.OutfitSuggestion": stream_types.OutfitSuggestion,
+
+    "types.UserPreferences": types.UserPreferences,
+    "stream_types.UserPreferences": stream_types.UserPreferences,
+
+
+}
\ No newline at end of file
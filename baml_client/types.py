@@ -0,0 +1,104 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+from enum import Enum
+
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+import baml_py
+
+CheckT = typing_extensions.TypeVar('CheckT')
+CheckName = typing_extensions.TypeVar('CheckName', bound=str)
+
+class Check(BaseModel):
+    name: str
+    expression: str
+    status: str
+class Checked(BaseModel, typing.Generic[CheckT, CheckName]):
+    value: CheckT
+    checks: typing.Dict[CheckName, Check]
+
+def get_checks(checks: typing.Dict[CheckName, Check]) -> typing.List[Check]:
+    return list(checks.values())
+
+def all_succeeded(checks: typing.Dict[CheckName, Check]) -> bool:
+    return all(check.status == "succeeded" for check in get_checks(checks))
+# #########################################################################
+# Generated enums (0)
+# #########################################################################
+
+# #########################################################################
+# Generated classes (6)
+# #########################################################################
+
+class Character(BaseModel):
+    name: str
+    movie: str
+    category: str = Field(description='Princess, Villain, Pixar, Marvel, Star Wars, etc.')
+    primaryColors: typing.List[str] = Field(description='Main colors associated with this character')
+    secondaryColors: typing.List[str] = Field(description='Accent colors')
+    aestheticKeywords: typing.List[str] = Field(description='Style descriptors like \'elegant\', \'rugged\', \'whimsical\'')
+
+class CharacterSearchResult(BaseModel):
+    found: bool = Field(description='Whether a matching Disney character was found')
+    name: str = Field(description='Character\'s name')
+    movie: str = Field(description='Film or show the character is from, with year if known')
+    description: str = Field(description='Brief description of the character (1-2 sentences)')
+    category: str = Field(description='Princess, Villain, Pixar, Sidekick, Classic, etc.')
+    colors: typing.List["ColorInfo"] = Field(description='3-5 signature colors for this character')
+    notFoundMessage: typing.Optional[str] = Field(default=None, description='Helpful message if character wasn\'t found')
+
+class ClothingItem(BaseModel):
+    itemType: str = Field(description='top, bottom, shoes, accessory, dress, jacket')
+    description: str
+    color: str
+    productUrl: typing.Optional[str] = None
+
+class ColorInfo(BaseModel):
+    hex: str = Field(description='Hex color code like #FFD700')
+    name: str = Field(description='Human readable color name like \'Bright Yellow\'')
+    usage: str = Field(description='Where this color appears, e.g. \'Primary body color\'')
+
+class OutfitSuggestion(BaseModel):
+    items: typing.List["ClothingItem"]
+    explanation: str = Field(description='Why this outfit works for the character')
+    colorHarmony: str = Field(description='How the colors relate to the character')
+    styleNotes: str = Field(description='Tips for wearing this outfit')
+
+class UserPreferences(BaseModel):
+    budget: str = Field(description='low, medium, high')
+    style: str = Field(description='casual, dressy, athletic, vintage')
+    climateConsiderations: str = Field(description='hot, mild, cold, rainy')
+    existingWardrobe: typing.List["ClothingItem"] = Field(description='Items the user already owns')
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
+
+
+# #########################################################################
+# Model rebuilds (6)
+# #########################################################################
+# Resolve string forward references now that every model above is defined so
+# class declaration order never breaks Pydantic construction (issue #793).
+# Recursive models are intentionally omitted (Pydantic resolves those lazily;
+# eagerly rebuilding them can recurse).
+Character.model_rebuild()
+CharacterSearchResult.model_rebuild()
+ClothingItem.model_rebuild()
+ColorInfo.model_rebuild()
+OutfitSuggestion.model_rebuild()
+UserPreferences.model_rebuild()
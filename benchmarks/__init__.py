@@ -0,0 +1 @@
+"""Microbenchmarks for Disneybound Planner hot paths."""
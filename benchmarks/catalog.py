@@ -0,0 +1,100 @@
+"""
+Deterministic catalog fixtures for benchmarks.
+
+Builds synthetic Character rows that look like LLM search results so the
+ORM, indexes and templates see realistic data at 1k-100k scale.
+"""
+
+from types import SimpleNamespace
+
+from django.db import connection
+
+from apps.characters.models import Character
+
+CATEGORIES = [
+    "Princess",
+    "Villain",
+    "Pixar",
+    "Sidekick",
+    "Classic",
+    "Marvel",
+    "Star Wars",
+    "Hero",
+]
+
+PALETTE = [
+    ("#FFD700", "Bright Yellow"),
+    ("#1E90FF", "Ocean Blue"),
+    ("#DC143C", "Crimson"),
+    ("#2E8B57", "Sea Green"),
+    ("#8A2BE2", "Violet"),
+    ("#FF69B4", "Hot Pink"),
+    ("#F5F5DC", "Beige"),
+    ("#000000", "Black"),
+]
+
+MOVIE_COUNT = 250
+BATCH_SIZE = 5000
+
+
+def character_name(index: int) -> str:
+    """Canonical name of the synthetic character at ``index``."""
+    return f"Character {index:06d}"
+
+
+def character_alias(index: int) -> str:
+    """Normalized alias query stored for the character at ``index``."""
+    return f"alias query {index:06d}"
+
+
+def build_character(index: int) -> Character:
+    """Build (but don't save) the synthetic character at ``index``."""
+    colors = [
+        {
+            "hex": PALETTE[(index + offset) % len(PALETTE)][0],
+            "name": PALETTE[(index + offset) % len(PALETTE)][1],
+            "usage": "Primary body color" if offset == 0 else "Accent color",
+        }
+        for offset in range(3 + index % 3)
+    ]
+    return Character(
+        name=character_name(index),
+        movie=f"Movie {index % MOVIE_COUNT:03d} ({1937 + index % 88})",
+        category=CATEGORIES[index % len(CATEGORIES)],
+        description=(
+            f"Synthetic character number {index} used for benchmarking. "
+            "Loves adventure, music and bright colors."
+        ),
+        search_queries=[character_name(index).lower(), character_alias(index)],
+        colors=colors,
+    )
+
+
+def seed_catalog(count: int) -> None:
+    """Replace the Character table with ``count`` synthetic rows."""
+    Character.objects.all().delete()
+    for start in range(0, count, BATCH_SIZE):
+        stop = min(start + BATCH_SIZE, count)
+        Character.objects.bulk_create(
+            [build_character(index) for index in range(start, stop)],
+            batch_size=BATCH_SIZE,
+        )
+    # Plans shouldn't depend on whether autovacuum has caught up yet
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Character._meta.db_table}")
+
+
+def make_search_result(name: str, movie: str = "Benchmark Movie (2026)"):
+    """Build an object shaped like a BAML CharacterSearchResult."""
+    return SimpleNamespace(
+        found=True,
+        name=name,
+        movie=movie,
+        category="Classic",
+        description="Character created by the benchmark suite.",
+        colors=[
+            SimpleNamespace(hex=hex_code, name=color_name, usage="Accent color")
+            for hex_code, color_name in PALETTE[:4]
+        ],
+        notFoundMessage=None,
+    )
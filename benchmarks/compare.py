@@ -0,0 +1,85 @@
+"""
+Compare two benchmark JSON files and flag regressions.
+
+Usage:
+    python -m benchmarks.compare .benchmarks/old.json .benchmarks/new.json
+    python -m benchmarks.compare old.json new.json --threshold 0.10
+
+Exits with status 1 if any benchmark's median got slower by more than the
+threshold (default 20%).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from .harness import result_key
+
+DEFAULT_THRESHOLD = 0.20
+
+
+def load_results(path: Path) -> dict[str, dict[str, Any]]:
+    data = json.loads(path.read_text())
+    return {result_key(result): result for result in data["results"]}
+
+
+def compare(
+    baseline: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """
+    Compare medians of benchmarks present in both runs.
+
+    Returns:
+        One row per shared benchmark with the relative change and a
+        ``regression`` flag when it slowed down by more than ``threshold``.
+    """
+    rows = []
+    for key in sorted(baseline.keys() & current.keys()):
+        before = baseline[key]["median"]
+        after = current[key]["median"]
+        change = (after - before) / before if before else 0.0
+        rows.append(
+            {
+                "benchmark": key,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return rows
+
+
+def format_rows(rows: list[dict[str, Any]]) -> str:
+    lines = [f"{'benchmark':<70} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for row in rows:
+        marker = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['benchmark']:<70} "
+            f"{row['baseline'] * 1000:>10.3f}ms "
+            f"{row['current'] * 1000:>10.3f}ms "
+            f"{row['change']:>+7.1%}{marker}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    rows = compare(
+        load_results(args.baseline), load_results(args.current), args.threshold
+    )
+    print(format_rows(rows))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Pytest configuration for the benchmark suite.
+
+Benchmarks are not collected by the default test run (see ``testpaths`` in
+pytest.ini). Run them explicitly:
+
+    just bench
+    uv run pytest benchmarks --bench-sizes=1000,10000
+    uv run pytest benchmarks --bench-compare=.benchmarks/baseline.json
+"""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from .catalog import seed_catalog
+from .compare import compare, format_rows, load_results
+from .harness import BenchmarkRecorder, result_key
+
+DEFAULT_SIZES = "1000,10000,100000"
+RESULTS_DIR = Path(__file__).resolve().parent.parent / ".benchmarks"
+
+_recorder = BenchmarkRecorder()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-sizes",
+        default=DEFAULT_SIZES,
+        help="Comma-separated Character catalog sizes to seed",
+    )
+    group.addoption(
+        "--bench-json",
+        default=None,
+        help="Where to write results (default: .benchmarks/<timestamp>.json)",
+    )
+    group.addoption(
+        "--bench-compare",
+        default=None,
+        help="Baseline results JSON to compare this run against",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "catalog_size" in metafunc.fixturenames:
+        sizes = [
+            int(size)
+            for size in metafunc.config.getoption("--bench-sizes").split(",")
+            if size.strip()
+        ]
+        metafunc.parametrize(
+            "catalog_size", sizes, ids=[f"n={size}" for size in sizes], scope="session"
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _recorder.results:
+        return
+
+    config = session.config
+    output = config.getoption("--bench-json")
+    if output:
+        path = Path(output)
+    else:
+        stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        path = RESULTS_DIR / f"{stamp}.json"
+    _recorder.write(path)
+
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is None:
+        return
+    reporter.write_sep("-", f"benchmark results written to {path}")
+    for result in _recorder.results:
+        reporter.write_line(
+            f"{result_key(result):<70} median {result['median'] * 1000:>10.3f}ms "
+            f"p95 {result['p95'] * 1000:>10.3f}ms ({result['rounds']} rounds)"
+        )
+
+    baseline = config.getoption("--bench-compare")
+    if baseline:
+        rows = compare(
+            load_results(Path(baseline)),
+            {result_key(result): result for result in _recorder.results},
+        )
+        reporter.write_sep("-", f"compared against {baseline}")
+        reporter.write_line(format_rows(rows))
+
+
+@pytest.fixture(scope="session")
+def bench() -> BenchmarkRecorder:
+    """Session-wide benchmark recorder."""
+    return _recorder
+
+
+@pytest.fixture(scope="session")
+def catalog(catalog_size, django_db_setup, django_db_blocker):
+    """
+    Seed the Character table with ``catalog_size`` rows.
+
+    Seeding is committed outside the per-test transaction so it is paid once
+    per size; writes made by individual benchmarks are still rolled back.
+    """
+    with django_db_blocker.unblock():
+        seed_catalog(catalog_size)
+    yield catalog_size
+    with django_db_blocker.unblock():
+        seed_catalog(0)
@@ -0,0 +1,99 @@
+"""
+A local retailer site for crawler benchmarks.
+
+Serves paginated listing pages linking to product pages with schema.org
+JSON-LD, and honors ``If-None-Match`` so re-crawls can be measured too.
+"""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+COLORS = ["#1E90FF", "#FFD700", "#DC143C", "#228B22", "#FFC0CB", "#000000"]
+TYPES = ["T-Shirt", "Skirt", "Dress", "Sneakers", "Cardigan", "Hair Bow"]
+
+
+class FixtureSite:
+    def __init__(self, product_count: int, per_page: int = 50):
+        self.product_count = product_count
+        self.per_page = per_page
+
+    def listing(self, page: int) -> bytes:
+        start = (page - 1) * self.per_page
+        end = min(start + self.per_page, self.product_count)
+        links = "".join(
+            f'<li><a href="/products/{i}">Product {i}</a></li>'
+            for i in range(start, end)
+        )
+        pages = -(-self.product_count // self.per_page)
+        next_link = f'<a href="/?page={page + 1}">Next</a>' if page < pages else ""
+        return f"<html><body><ul>{links}</ul>{next_link}</body></html>".encode()
+
+    def product(self, i: int) -> bytes:
+        data = {
+            "@context": "https://schema.org",
+            "@type": "Product",
+            "name": f"{TYPES[i % len(TYPES)]} {i}",
+            "brand": {"@type": "Brand", "name": "Fixture Co"},
+            "category": TYPES[i % len(TYPES)],
+            "color": COLORS[i % len(COLORS)],
+            "image": f"/images/{i}.jpg",
+            "offers": {
+                "@type": "Offer",
+                "price": f"{10 + i % 50}.99",
+                "priceCurrency": "USD",
+            },
+        }
+        return (
+            "<html><head><title>Product</title>"
+            f'<script type="application/ld+json">{json.dumps(data)}</script>'
+            '</head><body><a href="/">Home</a></body></html>'
+        ).encode()
+
+    def render(self, path: str) -> bytes | None:
+        parts = urlsplit(path)
+        if parts.path == "/":
+            page = int(parse_qs(parts.query).get("page", ["1"])[0])
+            return self.listing(page)
+        if parts.path.startswith("/products/"):
+            i = int(parts.path.rsplit("/", 1)[1])
+            if 0 <= i < self.product_count:
+                return self.product(i)
+        return None
+
+
+def start_fixture_site(site: FixtureSite) -> ThreadingHTTPServer:
+    """Serve ``site`` on an ephemeral localhost port in a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = site.render(self.path)
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
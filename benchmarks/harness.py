@@ -0,0 +1,121 @@
+"""
+Minimal timing harness for the benchmark suite.
+
+Each measurement runs a callable for a number of rounds and records
+summary statistics. Results are collected per session and written to a
+JSON file so runs can be compared with ``python -m benchmarks.compare``.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import django
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    """Nearest-rank percentile of a sorted sample list."""
+    rank = max(0, min(len(samples) - 1, round(percent / 100 * len(samples)) - 1))
+    return samples[rank]
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class BenchmarkRecorder:
+    """Collects benchmark results for a whole pytest session."""
+
+    def __init__(self):
+        self.results: list[dict[str, Any]] = []
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        *,
+        params: dict[str, Any] | None = None,
+        min_rounds: int = 5,
+        max_time: float = 2.0,
+        warmup: int = 1,
+        setup: Callable[[], Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Time ``func`` and record summary statistics.
+
+        Args:
+            name: Benchmark identifier, e.g. ``find_cached_character.hit``
+            func: Zero-argument callable under test
+            params: Extra identifying parameters (catalog size, filters)
+            min_rounds: Minimum number of timed rounds
+            max_time: Keep adding rounds until this many seconds have passed
+            warmup: Untimed rounds run first (template/query caches)
+            setup: Optional untimed callable run before every round
+
+        Returns:
+            The recorded result dict (times are in seconds)
+        """
+        for _ in range(warmup):
+            if setup:
+                setup()
+            func()
+
+        samples: list[float] = []
+        started = time.perf_counter()
+        while len(samples) < min_rounds or time.perf_counter() - started < max_time:
+            if setup:
+                setup()
+            begin = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - begin)
+
+        samples.sort()
+        result = {
+            "name": name,
+            "params": params or {},
+            "rounds": len(samples),
+            "min": samples[0],
+            "max": samples[-1],
+            "mean": statistics.fmean(samples),
+            "median": statistics.median(samples),
+            "p95": _percentile(samples, 95),
+            "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        }
+        self.results.append(result)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "meta": {
+                "created_at": datetime.now(UTC).isoformat(),
+                "git_revision": _git_revision(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "machine": platform.machine(),
+            },
+            "results": self.results,
+        }
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, sort_keys=True))
+
+
+def result_key(result: dict[str, Any]) -> str:
+    """Stable identifier for a result across runs."""
+    params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+    return f"{result['name']}[{params}]" if params else result["name"]
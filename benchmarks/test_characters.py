@@ -0,0 +1,243 @@
+"""Benchmarks for the character search and catalog hot paths."""
+
+import itertools
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import Client, RequestFactory
+from django.utils import timezone
+
+from apps.characters import analytics, api
+from apps.characters.models import Character, SearchEvent
+from apps.characters.services import (
+    find_cached_character,
+    save_character_from_result,
+)
+from apps.characters.views import character_list
+
+from .catalog import (
+    MOVIE_COUNT,
+    character_alias,
+    character_name,
+    make_search_result,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFindCachedCharacter:
+    """Cache lookup cost for the three outcomes a search can hit."""
+
+    def test_name_hit(self, bench, catalog):
+        query = character_name(catalog // 2).lower()
+        assert find_cached_character(query) is not None
+        bench.measure(
+            "find_cached_character.name_hit",
+            lambda: find_cached_character(query),
+            params={"size": catalog},
+        )
+
+    def test_alias_hit(self, bench, catalog):
+        query = character_alias(catalog // 2)
+        assert find_cached_character(query) is not None
+        bench.measure(
+            "find_cached_character.alias_hit",
+            lambda: find_cached_character(query),
+            params={"size": catalog},
+        )
+
+    def test_fts_hit(self, bench, catalog):
+        index = catalog // 2
+        query = f"synthetic number {index} movie {index % MOVIE_COUNT:03d}"
+        assert find_cached_character(query) is not None
+        bench.measure(
+            "find_cached_character.fts_hit",
+            lambda: find_cached_character(query),
+            params={"size": catalog},
+        )
+
+    def test_fts_broad(self, bench, catalog):
+        # Matches every row: the worst case, where all matches are ranked
+        query = "loves adventure and music"
+        assert find_cached_character(query) is None
+        bench.measure(
+            "find_cached_character.fts_broad",
+            lambda: find_cached_character(query),
+            params={"size": catalog},
+        )
+
+    def test_miss(self, bench, catalog):
+        query = "the fish from little mermaid"
+        assert find_cached_character(query) is None
+        bench.measure(
+            "find_cached_character.miss",
+            lambda: find_cached_character(query),
+            params={"size": catalog},
+        )
+
+
+class TestSaveCharacterFromResult:
+    """Write paths taken after an LLM call returns."""
+
+    def test_insert(self, bench, catalog):
+        counter = itertools.count()
+
+        def insert():
+            name = f"Benchmark Insert {next(counter)}"
+            save_character_from_result(make_search_result(name), name)
+
+        bench.measure(
+            "save_character_from_result.insert",
+            insert,
+            params={"size": catalog},
+        )
+
+    def test_alias(self, bench, catalog):
+        result = make_search_result(character_name(catalog // 2))
+        counter = itertools.count()
+
+        bench.measure(
+            "save_character_from_result.alias",
+            lambda: save_character_from_result(
+                result, f"benchmark alias {next(counter)}"
+            ),
+            params={"size": catalog},
+        )
+
+
+class TestCharacterList:
+    """Full catalog page render, including the category dropdown query."""
+
+    @pytest.mark.parametrize("category", ["", "Villain"], ids=["all", "category"])
+    def test_render(self, bench, catalog, category):
+        factory = RequestFactory()
+
+        def render():
+            request = factory.get("/characters/", {"category": category})
+            response = character_list(request)
+            assert response.status_code == 200
+
+        bench.measure(
+            "character_list.render",
+            render,
+            params={"size": catalog, "category": category or "all"},
+            min_rounds=3,
+            max_time=0,
+            warmup=0,
+        )
+
+
+class TestAdminChangelist:
+    """Character admin changelist: first page, and searching the catalog."""
+
+    @pytest.fixture
+    def admin_client(self, db):
+        user = get_user_model().objects.create_superuser(
+            "bench-admin", "bench@example.com", "password"
+        )
+        client = Client()
+        client.force_login(user)
+        return client
+
+    @pytest.mark.parametrize(
+        "query",
+        ["", "character 00050", "alias query 000500", "movie 042"],
+        ids=["all", "name", "alias", "words"],
+    )
+    def test_render(self, bench, catalog, admin_client, query):
+        def render():
+            response = admin_client.get(
+                "/admin/characters/character/", {"q": query} if query else {}
+            )
+            assert response.status_code == 200
+
+        bench.measure(
+            "admin.character_changelist",
+            render,
+            params={"size": catalog, "query": query or "all"},
+            min_rounds=3,
+        )
+
+
+class TestCatalogApi:
+    """JSON API: first and deep keyset pages, and the full NDJSON stream."""
+
+    @pytest.mark.parametrize("depth", ["first", "deep"])
+    def test_page(self, bench, catalog, depth):
+        client = Client()
+        cursor = {}
+        if depth == "deep":
+            character = Character.objects.order_by("updated_at", "id")[catalog - 200]
+            cursor = {"cursor": api.encode_cursor(character)}
+
+        def fetch():
+            response = client.get("/characters/api/", cursor)
+            assert response.status_code == 200
+
+        bench.measure(
+            "characters.api_page",
+            fetch,
+            params={"size": catalog, "depth": depth},
+        )
+
+    def test_stream(self, bench, catalog):
+        client = Client()
+
+        def stream():
+            response = client.get("/characters/api/stream/")
+            assert sum(1 for _ in response.streaming_content)
+
+        bench.measure(
+            "characters.api_stream",
+            stream,
+            params={"size": catalog},
+            min_rounds=3,
+            max_time=0,
+            warmup=0,
+        )
+
+
+class TestSearchAnalytics:
+    """Per-search capture cost (amortized bulk inserts) and rollups."""
+
+    def test_record_search(self, bench, catalog):
+        counter = itertools.count()
+
+        def record():
+            analytics.record_search(f"query {next(counter) % 500}", "alias", 0.002, 1)
+
+        bench.measure(
+            "analytics.record_search", record, params={"size": catalog}, min_rounds=1000
+        )
+        analytics.flush()
+
+    def test_rollup(self, bench, catalog):
+        events = [
+            SearchEvent(
+                created_at=timezone.now(),
+                query=f"query {index % 5000}",
+                hit_type="llm" if index % 10 == 0 else "alias",
+                latency_ms=5.0,
+            )
+            for index in range(catalog)
+        ]
+
+        bench.measure(
+            "analytics.rollup_searches",
+            analytics.rollup_searches,
+            params={"events": catalog},
+            setup=lambda: SearchEvent.objects.bulk_create(events, batch_size=5000),
+            min_rounds=3,
+            max_time=0,
+            warmup=0,
+        )
+
+
+class TestToResultDict:
+    def test_to_result_dict(self, bench, catalog):
+        character = Character.objects.get(name=character_name(catalog // 2))
+        bench.measure(
+            "Character.to_result_dict",
+            lambda: [character.to_result_dict() for _ in range(1000)],
+            params={"size": catalog, "batch": 1000},
+        )
@@ -0,0 +1,55 @@
+"""
+Palette ranking cost for the product color index.
+
+The index is filled with synthetic CIELAB features (no database), so this
+measures only the vectorized scoring at catalog scale.
+"""
+
+import numpy as np
+import pytest
+
+from apps.scraping.color_index import ITEM_TYPES, ColorIndex
+from apps.scraping.colors import hex_to_lab
+
+SIZES = [10_000, 50_000, 100_000]
+PALETTE = hex_to_lab(["#FFD700", "#1E90FF", "#DC143C", "#FFFFFF", "#000000"])
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=[f"n={size}" for size in SIZES])
+def index(request):
+    rng = np.random.default_rng(0)
+    size = request.param
+    index = ColorIndex()
+    index.upsert(
+        list(range(1, size + 1)),
+        rng.uniform([0, -100, -100], [100, 100, 100], size=(size, 3)),
+        rng.choice(ITEM_TYPES[1:], size=size),
+    )
+    return index
+
+
+def test_rank_all(bench, index):
+    bench.measure(
+        "color_index.rank",
+        lambda: index.rank(PALETTE, limit=12),
+        params={"products": len(index), "palette": len(PALETTE)},
+    )
+
+
+def test_rank_item_type(bench, index):
+    bench.measure(
+        "color_index.rank_item_type",
+        lambda: index.rank(PALETTE, item_type="top", limit=12),
+        params={"products": len(index), "palette": len(PALETTE)},
+    )
+
+
+def test_incremental_upsert(bench, index):
+    rng = np.random.default_rng(1)
+    ids = rng.integers(1, len(index) + 1, size=500).tolist()
+    labs = rng.uniform([0, -100, -100], [100, 100, 100], size=(500, 3))
+    bench.measure(
+        "color_index.upsert_500",
+        lambda: index.upsert(ids, labs, ["top"] * 500),
+        params={"products": len(index)},
+    )
@@ -0,0 +1,63 @@
+"""
+Per-request connection cost with and without the psycopg pool.
+
+Each round simulates one request: acquire a connection, run a few short
+queries, release it. Against a local Postgres the gap is the connection
+handshake; against Neon (TLS, another region) it is far larger, so run this
+with DATABASE_URL pointing at a Neon branch for realistic numbers.
+"""
+
+import psycopg
+import pytest
+from django.db import connection
+from psycopg_pool import ConnectionPool
+
+pytestmark = pytest.mark.django_db
+
+QUERIES_PER_REQUEST = 3
+
+
+def _simulate_request(conn) -> None:
+    for _ in range(QUERIES_PER_REQUEST):
+        conn.execute("SELECT 1").fetchone()
+
+
+@pytest.fixture(scope="module")
+def connect_kwargs(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        params = connection.get_connection_params()
+    params.pop("cursor_factory", None)
+    params["autocommit"] = True
+    return params
+
+
+def test_request_without_pool(bench, connect_kwargs):
+    def request():
+        with psycopg.connect(**connect_kwargs) as conn:
+            _simulate_request(conn)
+
+    bench.measure(
+        "db_request.new_connection",
+        request,
+        params={"queries": QUERIES_PER_REQUEST},
+    )
+
+
+def test_request_with_pool(bench, connect_kwargs):
+    with ConnectionPool(
+        kwargs=connect_kwargs,
+        min_size=1,
+        max_size=4,
+        check=ConnectionPool.check_connection,
+        open=True,
+    ) as pool:
+
+        def request():
+            with pool.connection() as conn:
+                _simulate_request(conn)
+
+        bench.measure(
+            "db_request.pooled",
+            request,
+            params={"queries": QUERIES_PER_REQUEST},
+        )
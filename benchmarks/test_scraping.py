@@ -0,0 +1,61 @@
+"""
+Crawler throughput against a local fixture site.
+
+Measures a cold crawl (every page fetched, parsed and upserted) and a warm
+re-crawl (conditional requests answered with 304) with rate limiting off,
+so the numbers reflect the crawler itself rather than politeness delays.
+"""
+
+import pytest
+
+from apps.scraping.crawler import crawl
+from apps.scraping.models import CrawlPage, Product
+
+from .fixture_site import FixtureSite, start_fixture_site
+
+pytestmark = pytest.mark.django_db
+
+PRODUCTS = 500
+CONCURRENCY = 16
+
+
+@pytest.fixture(scope="module")
+def site_url():
+    server = start_fixture_site(FixtureSite(PRODUCTS))
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+def _crawl(url):
+    return crawl([url], rate_limit=0, concurrency=CONCURRENCY, max_pages=PRODUCTS * 2)
+
+
+def _reset():
+    Product.objects.all().delete()
+    CrawlPage.objects.all().delete()
+
+
+def test_cold_crawl(bench, site_url):
+    stats = []
+    bench.measure(
+        "crawl.cold",
+        lambda: stats.append(_crawl(site_url)),
+        params={"products": PRODUCTS, "concurrency": CONCURRENCY},
+        setup=_reset,
+        min_rounds=3,
+    )
+    assert stats[-1].products == PRODUCTS
+
+
+def test_recrawl_not_modified(bench, site_url):
+    _reset()
+    _crawl(site_url)
+    stats = []
+    bench.measure(
+        "crawl.recrawl",
+        lambda: stats.append(_crawl(site_url)),
+        params={"products": PRODUCTS, "concurrency": CONCURRENCY},
+        min_rounds=3,
+    )
+    assert stats[-1].fetched == 0
+    assert stats[-1].not_modified == stats[-1].pages
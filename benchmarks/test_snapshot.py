@@ -0,0 +1,57 @@
+"""
+Catalog snapshot export and import throughput.
+
+Imports are measured both into an empty table (seeding a new environment)
+and over the existing catalog (every row matched, none changed).
+"""
+
+import pytest
+
+from apps.characters.models import Character
+from apps.characters.snapshot import export_characters, import_characters
+
+pytestmark = pytest.mark.django_db
+
+FORMATS = ["jsonl.gz", "copy"]
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_export(bench, catalog, tmp_path, fmt):
+    path = tmp_path / f"catalog.{fmt}"
+    bench.measure(
+        f"snapshot.export.{fmt}",
+        lambda: export_characters(path),
+        params={"size": catalog},
+        min_rounds=3,
+    )
+    assert export_characters(path) == catalog
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_import_empty(bench, catalog, tmp_path, fmt):
+    path = tmp_path / f"catalog.{fmt}"
+    export_characters(path)
+    bench.measure(
+        f"snapshot.import_empty.{fmt}",
+        lambda: import_characters(path),
+        params={"size": catalog},
+        setup=lambda: Character.objects.all().delete(),
+        min_rounds=3,
+        warmup=0,
+    )
+    assert Character.objects.count() == catalog
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_import_existing(bench, catalog, tmp_path, fmt):
+    path = tmp_path / f"catalog.{fmt}"
+    export_characters(path)
+    stats = []
+    bench.measure(
+        f"snapshot.import_existing.{fmt}",
+        lambda: stats.append(import_characters(path)),
+        params={"size": catalog},
+        min_rounds=3,
+        warmup=0,
+    )
+    assert stats[-1].unchanged == catalog
@@ -85,6 +85,8 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # =============================================================================
 
 MIDDLEWARE = [
+    "apps.core.middleware.ServerTimingMiddleware",  # Server-Timing + metrics
+    "apps.core.middleware.ReplicaStickinessMiddleware",  # Read-your-writes
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Static files
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -146,9 +148,106 @@ DATABASES = {
     ),
 }
 
+# Connection reuse. With DB_POOL each worker process keeps a psycopg 3 pool
+# (Django's native "pool" option) instead of opening a new TLS connection
+# to Neon per request. min_size defaults to 0 so idle workers release every
+# connection and the serverless compute can still suspend.
+DB_POOL = env.bool("DB_POOL", default=True)
+DATABASES["default"].setdefault("OPTIONS", {})
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if DB_POOL:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0  # Required with pooling
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=0),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=8),
+        "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),
+        "max_lifetime": env.float("DB_POOL_MAX_LIFETIME", default=1800.0),
+        "max_idle": env.float("DB_POOL_MAX_IDLE", default=300.0),
+        "name": "default",
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=0)
+
+# PgBouncer in transaction mode (e.g. Neon's "-pooler" endpoint) can't keep
+# server-side cursors or prepared statements across transactions.
+if env.bool("DB_PGBOUNCER", default=False):
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+    DATABASES["default"]["OPTIONS"]["prepare_threshold"] = None
+
+# Optional read replica (e.g. a Neon read replica) for catalog reads, with the
+# primary's pooling and PgBouncer settings. See apps/core/routers.py.
+DATABASE_REPLICA_URL = env("DATABASE_REPLICA_URL", default="")
+READ_REPLICA = "replica" if DATABASE_REPLICA_URL else None
+if READ_REPLICA:
+    _replica = env.db("DATABASE_REPLICA_URL")
+    for _key in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS", "DISABLE_SERVER_SIDE_CURSORS"):
+        if _key in DATABASES["default"]:
+            _replica[_key] = DATABASES["default"][_key]
+    # Give up on an unreachable replica quickly and fall back to the primary
+    _connect_timeout = env.int("REPLICA_CONNECT_TIMEOUT", default=2)
+    _replica["OPTIONS"] = {
+        **DATABASES["default"]["OPTIONS"],
+        **_replica.get("OPTIONS", {}),
+        "connect_timeout": _connect_timeout,
+    }
+    if "pool" in _replica["OPTIONS"]:
+        _replica["OPTIONS"]["pool"] = {
+            **_replica["OPTIONS"]["pool"],
+            "name": READ_REPLICA,
+            "timeout": _connect_timeout,
+        }
+    DATABASES[READ_REPLICA] = _replica
+
+DATABASE_ROUTERS = ["apps.core.routers.ReplicaRouter"]
+# Seconds a client keeps reading the catalog from the primary after a write
+# (cover the replica's replication lag)
+REPLICA_STICKY_SECONDS = env.int("REPLICA_STICKY_SECONDS", default=10)
+# Seconds to use the primary after the replica fails to connect
+REPLICA_RETRY_SECONDS = env.float("REPLICA_RETRY_SECONDS", default=30.0)
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# =============================================================================
+# CACHES, SESSIONS AND MESSAGES
+# =============================================================================
+
+# Per-process caches; nothing here needs to be shared between workers
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sessions",
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    },
+}
+
+# Where sessions are stored. Pages only read the session for visitors
+# sending a session cookie, but with "db" that costs a Postgres round trip
+# on every such request.
+#   cached_db       Postgres, read through each worker's cache (default)
+#   signed_cookies  The session cookie itself; no server-side state, but a
+#                   copied cookie stays valid until it expires
+#   db              Postgres on every request
+SESSION_STORE = env("SESSION_STORE", default="cached_db")
+SESSION_ENGINE = {
+    "cached_db": "apps.core.sessions",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+    "db": "django.contrib.sessions.backends.db",
+}[SESSION_STORE]
+SESSION_CACHE_ALIAS = "sessions"
+# Seconds a worker trusts its cached copy of a session (cached_db): the
+# longest a logout handled by one worker can go unseen by another
+SESSION_LOCAL_CACHE_TTL = env.int("SESSION_LOCAL_CACHE_TTL", default=60)
+
+# Flash messages: "cookie" never touches the session; "fallback" (Django's
+# default) moves messages too large for a cookie into the session
+MESSAGE_STORAGE = {
+    "cookie": "django.contrib.messages.storage.cookie.CookieStorage",
+    "fallback": "django.contrib.messages.storage.fallback.FallbackStorage",
+    "session": "django.contrib.messages.storage.session.SessionStorage",
+}[env("MESSAGE_STORE", default="cookie")]
+
 # =============================================================================
 # AUTHENTICATION
 # =============================================================================
@@ -269,19 +368,67 @@ COMPONENTS = {
 
 GOOGLE_API_KEY = env("GOOGLE_API_KEY", default="")
 
+# Override the Gemini endpoint (e.g. the load-test stubs in loadtest/stubs.py).
+# Empty uses the provider default.
+GEMINI_BASE_URL = env("GEMINI_BASE_URL", default="")
+
+# Minimum full-text rank (0-1) for a cached character to answer a descriptive
+# search without calling the LLM. Raise it if FTS answers too eagerly.
+CHARACTER_FTS_MIN_RANK = env.float("CHARACTER_FTS_MIN_RANK", default=0.2)
+
+# Concurrent SuggestOutfit calls per trip suggestion batch
+SUGGESTION_CONCURRENCY = env.int("SUGGESTION_CONCURRENCY", default=4)
+
+# Concurrent TMDB / Gemini calls per admin bulk job (thumbnails, palettes)
+CATALOG_JOB_CONCURRENCY = env.int("CATALOG_JOB_CONCURRENCY", default=4)
+
+# Speculative SearchCharacter calls from the search box while the user types
+# (opt-in): calls allowed per session, and at once per process
+SEARCH_PREFETCH_ENABLED = env.bool("SEARCH_PREFETCH_ENABLED", default=False)
+SEARCH_PREFETCH_BUDGET = env.int("SEARCH_PREFETCH_BUDGET", default=5)
+SEARCH_PREFETCH_CONCURRENCY = env.int("SEARCH_PREFETCH_CONCURRENCY", default=2)
+
+# Search analytics: buffered events per bulk insert, the longest an event
+# waits in the buffer before a background flush (seconds), and seconds
+# between each process's background rollups into the stats tables
+# (0 = only `rollup_searches`)
+SEARCH_ANALYTICS_BATCH_SIZE = env.int("SEARCH_ANALYTICS_BATCH_SIZE", default=100)
+SEARCH_ANALYTICS_FLUSH_INTERVAL = env.float(
+    "SEARCH_ANALYTICS_FLUSH_INTERVAL", default=10.0
+)
+SEARCH_ANALYTICS_ROLLUP_INTERVAL = env.float(
+    "SEARCH_ANALYTICS_ROLLUP_INTERVAL", default=300.0
+)
+
 # =============================================================================
 # TMDB API (Character Thumbnails)
 # =============================================================================
 
 TMDB_API_KEY = env("TMDB_API_KEY", default="")
-TMDB_BASE_URL = "https://api.themoviedb.org/3"
-TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w185"
+TMDB_BASE_URL = env("TMDB_BASE_URL", default="https://api.themoviedb.org/3")
+TMDB_IMAGE_BASE_URL = env(
+    "TMDB_IMAGE_BASE_URL", default="https://image.tmdb.org/t/p/w185"
+)
 
 # =============================================================================
 # SCRAPING
 # =============================================================================
 
-SCRAPE_RATE_LIMIT = env.int("SCRAPE_RATE_LIMIT", default=1)  # requests per second
+# Requests per second per host (0 disables the limit)
+SCRAPE_RATE_LIMIT = env.float("SCRAPE_RATE_LIMIT", default=1.0)
+
+# Seconds between each process's product color index refreshes
+COLOR_INDEX_REFRESH = env.float("COLOR_INDEX_REFRESH", default=60.0)
+
+# =============================================================================
+# OBSERVABILITY
+# =============================================================================
+
+# Bearer token required by /metrics/ (empty = unauthenticated)
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+
+# Seconds /health/ready/ caches dependency status between real checks
+HEALTH_READY_TTL = env.float("HEALTH_READY_TTL", default=15.0)
 
 # =============================================================================
 # SECURITY (Production)
@@ -14,4 +14,25 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 def pytest_configure():
     """Configure Django for pytest."""
     settings.DEBUG = False
+    # Manifest storage needs collectstatic output; tests render templates
+    # without it.
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+        },
+    }
+    # A second local database standing in for the read replica. Only the
+    # router tests use it (and only they create it); catalog reads go to it
+    # when a test sets READ_REPLICA.
+    if "replica" not in settings.DATABASES:
+        default = settings.DATABASES["default"]
+        options = dict(default.get("OPTIONS", {}))
+        if "pool" in options:
+            options["pool"] = {**options["pool"], "name": "replica"}
+        settings.DATABASES["replica"] = {
+            **default,
+            "NAME": f"{default['NAME']}_replica",
+            "OPTIONS": options,
+        }
     django.setup()
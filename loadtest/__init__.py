@@ -0,0 +1 @@
+"""Load-test harness: local Gemini/TMDB stand-ins and a traffic driver."""
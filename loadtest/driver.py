@@ -0,0 +1,243 @@
+"""
+Load driver for the character search flow.
+
+Sends a mix of cache-hit searches, cache-miss searches and (optionally)
+catalog page views to a running server and reports latency percentiles
+and throughput per request kind.
+
+Usage:
+    just loadtest-stubs      # terminal 1: Gemini/TMDB stand-ins
+    just loadtest-serve      # terminal 2: gunicorn pointed at the stubs
+    python -m loadtest.driver --concurrency 20 --duration 60 --hit-ratio 0.8
+
+Catalog page views render the full layout, so they need built static assets
+(see the Dockerfile) when the server runs with DEBUG off.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import secrets
+import statistics
+import string
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+HIT_QUERIES = [
+    "flounder",
+    "ariel",
+    "ursula",
+    "sebastian",
+    "belle",
+    "beast",
+    "mulan",
+    "mushu",
+    "stitch",
+    "lilo",
+    "woody",
+    "buzz lightyear",
+    "elsa",
+    "olaf",
+    "moana",
+    "maui",
+    "simba",
+    "scar",
+    "rapunzel",
+    "tinker bell",
+]
+
+
+@dataclass
+class Sample:
+    kind: str
+    seconds: float
+    ok: bool
+
+
+@dataclass
+class RunStats:
+    samples: list[Sample] = field(default_factory=list)
+    started: float = 0.0
+    finished: float = 0.0
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict[str, Any]:
+    latencies = sorted(sample.seconds for sample in samples)
+    errors = sum(1 for sample in samples if not sample.ok)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": len(samples) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+
+def build_report(stats: RunStats) -> dict[str, Any]:
+    elapsed = stats.finished - stats.started
+    by_kind: dict[str, list[Sample]] = defaultdict(list)
+    for sample in stats.samples:
+        by_kind[sample.kind].append(sample)
+    return {
+        "elapsed_s": elapsed,
+        "overall": summarize(stats.samples, elapsed),
+        "by_kind": {
+            kind: summarize(samples, elapsed)
+            for kind, samples in sorted(by_kind.items())
+        },
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    header = (
+        f"{'kind':<12} {'reqs':>7} {'errors':>7} {'rps':>8} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    )
+    rows = [header]
+    for kind, row in [("overall", report["overall"]), *report["by_kind"].items()]:
+        rows.append(
+            f"{kind:<12} {row['requests']:>7} {row['errors']:>7} "
+            f"{row['throughput_rps']:>8.1f} {row['p50_ms']:>7.1f}ms "
+            f"{row['p95_ms']:>7.1f}ms {row['p99_ms']:>7.1f}ms {row['max_ms']:>7.1f}ms"
+        )
+    return "\n".join(rows)
+
+
+class SearchClient:
+    """Posts searches with a self-issued CSRF token (double-submit cookie)."""
+
+    def __init__(self, base_url: str, timeout: float):
+        token = "".join(
+            secrets.choice(string.ascii_letters + string.digits) for _ in range(32)
+        )
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            cookies={"csrftoken": token},
+            headers={"X-CSRFToken": token, "HX-Request": "true"},
+        )
+
+    async def search(self, query: str) -> httpx.Response:
+        return await self.client.post("/characters/search/", data={"q": query})
+
+    async def catalog(self) -> httpx.Response:
+        return await self.client.get("/characters/")
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+async def warm_cache(client: SearchClient, queries: list[str]) -> None:
+    """Search each hit query once so later requests are cache hits."""
+    for query in queries:
+        await client.search(query)
+
+
+async def worker(
+    client: SearchClient,
+    stats: RunStats,
+    deadline: float,
+    remaining: list[int],
+    hit_ratio: float,
+    catalog_ratio: float,
+    queries: list[str],
+) -> None:
+    while time.perf_counter() < deadline:
+        if remaining[0] == 0:
+            return
+        remaining[0] -= 1
+
+        roll = random.random()
+        if roll < catalog_ratio:
+            kind, call = "catalog", client.catalog()
+        elif roll < catalog_ratio + (1 - catalog_ratio) * hit_ratio:
+            kind, call = "search_hit", client.search(random.choice(queries))
+        else:
+            kind, call = (
+                "search_miss",
+                client.search(f"loadtest {uuid.uuid4().hex[:12]}"),
+            )
+
+        begin = time.perf_counter()
+        try:
+            response = await call
+            ok = (
+                response.status_code == 200 and b"Search failed" not in response.content
+            )
+        except httpx.HTTPError:
+            ok = False
+        stats.samples.append(Sample(kind, time.perf_counter() - begin, ok))
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    client = SearchClient(args.base_url, args.timeout)
+    try:
+        if not args.skip_warmup:
+            await warm_cache(client, HIT_QUERIES)
+
+        stats = RunStats()
+        # -1 means "no request limit, run until the deadline"
+        remaining = [args.requests or -1]
+        stats.started = time.perf_counter()
+        deadline = stats.started + args.duration
+        await asyncio.gather(
+            *(
+                worker(
+                    client,
+                    stats,
+                    deadline,
+                    remaining,
+                    args.hit_ratio,
+                    args.catalog_ratio,
+                    HIT_QUERIES,
+                )
+                for _ in range(args.concurrency)
+            )
+        )
+        stats.finished = time.perf_counter()
+    finally:
+        await client.aclose()
+    return build_report(stats)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Character search load driver")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--requests", type=int, default=0, help="0 = no limit")
+    parser.add_argument("--hit-ratio", type=float, default=0.8)
+    parser.add_argument("--catalog-ratio", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--skip-warmup", action="store_true")
+    parser.add_argument("--json", type=Path, help="Also write the report here")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    print(format_report(report))
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
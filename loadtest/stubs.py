@@ -0,0 +1,341 @@
+"""
+Local stand-ins for the Gemini and TMDB APIs.
+
+Serves both APIs from one process so the app can be load tested without
+paying for (or being rate limited by) the real services:
+
+    /gemini/v1beta/models/<model>:generateContent
+    /tmdb/3/search/movie
+    /tmdb/3/movie/<id>/credits
+
+Point the app at them with:
+
+    GEMINI_BASE_URL=http://127.0.0.1:8765/gemini/v1beta
+    TMDB_BASE_URL=http://127.0.0.1:8765/tmdb/3
+    TMDB_API_KEY=stub
+
+Usage:
+    python -m loadtest.stubs --gemini-latency-ms 1500 --gemini-jitter-ms 500
+    python -m loadtest.stubs --gemini-error-rate 0.05 --tmdb-profile no_match
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+GEMINI_PROFILES = ["found", "not_found", "large"]
+TMDB_PROFILES = ["match", "no_match", "no_results", "large"]
+
+QUERY_PATTERN = re.compile(r'User\'s search query: "(?P<query>[^"]*)"')
+CREDITS_PATTERN = re.compile(r"^/tmdb/3/movie/(?P<movie_id>\d+)/credits$")
+GENERATE_PATTERN = re.compile(r"^/gemini/v1beta/models/[^/]+:generateContent$")
+
+COLORS = [
+    {"hex": "#FFD700", "name": "Bright Yellow", "usage": "Primary body color"},
+    {"hex": "#1E90FF", "name": "Ocean Blue", "usage": "Stripes"},
+    {"hex": "#DC143C", "name": "Crimson", "usage": "Accents"},
+    {"hex": "#F5F5DC", "name": "Beige", "usage": "Neutral base"},
+    {"hex": "#2E8B57", "name": "Sea Green", "usage": "Details"},
+]
+
+
+@dataclass
+class ServiceProfile:
+    """Latency, error and payload behavior for one stubbed service."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    payload: str = ""
+
+    def delay(self) -> None:
+        spread = random.uniform(-self.jitter_ms, self.jitter_ms)
+        seconds = max(0.0, self.latency_ms + spread) / 1000
+        if seconds:
+            time.sleep(seconds)
+
+    def should_fail(self) -> bool:
+        return random.random() < self.error_rate
+
+
+class StubState:
+    """Shared state so TMDB credits can name characters Gemini invented."""
+
+    def __init__(self, gemini: ServiceProfile, tmdb: ServiceProfile):
+        self.gemini = gemini
+        self.tmdb = tmdb
+        self._lock = threading.Lock()
+        self._movies: dict[int, str] = {}
+        self._cast: dict[int, set[str]] = {}
+
+    def register(self, movie: str, character: str) -> None:
+        movie_id = self.movie_id(movie)
+        with self._lock:
+            self._movies[movie_id] = movie
+            self._cast.setdefault(movie_id, set()).add(character)
+
+    def cast_for(self, movie_id: int) -> list[str]:
+        with self._lock:
+            return sorted(self._cast.get(movie_id, set()))
+
+    @staticmethod
+    def movie_id(movie: str) -> int:
+        title = movie.split("(")[0].strip().lower()
+        return int(hashlib.sha1(title.encode()).hexdigest()[:8], 16)
+
+
+def _slug(text: str) -> int:
+    return int(hashlib.sha1(text.encode()).hexdigest()[:6], 16)
+
+
+def search_character_payload(state: StubState, query: str) -> dict[str, Any]:
+    """CharacterSearchResult-shaped payload derived from the query."""
+    profile = state.gemini.payload
+    if profile == "not_found":
+        return {
+            "found": False,
+            "name": "",
+            "movie": "",
+            "description": "",
+            "category": "",
+            "colors": [],
+            "notFoundMessage": "Try a character's full name.",
+        }
+
+    seed = _slug(query)
+    name = query.strip().title() or "Unknown"
+    movie = f"Stub Movie {seed % 500:03d} ({1937 + seed % 88})"
+    state.register(movie, name)
+    description = f"{name} is a stub character generated for load testing."
+    colors = COLORS[: 3 + seed % 3]
+    if profile == "large":
+        description = " ".join([description] * 40)
+        colors = COLORS
+    return {
+        "found": True,
+        "name": name,
+        "movie": movie,
+        "description": description,
+        "category": ["Princess", "Villain", "Pixar", "Sidekick", "Classic"][seed % 5],
+        "colors": colors,
+        "notFoundMessage": None,
+    }
+
+
+def suggest_outfit_payload() -> dict[str, Any]:
+    """OutfitSuggestion-shaped payload."""
+    return {
+        "items": [
+            {
+                "itemType": item_type,
+                "description": f"Stub {item_type}",
+                "color": color["name"],
+                "productUrl": None,
+            }
+            for item_type, color in zip(
+                ["top", "bottom", "shoes", "accessory"], COLORS, strict=False
+            )
+        ],
+        "explanation": "Stub outfit for load testing.",
+        "colorHarmony": "Primary and accent colors mirror the character.",
+        "styleNotes": "Comfortable shoes for park days.",
+    }
+
+
+def gemini_text(state: StubState, prompt: str) -> str:
+    """Pick a response body based on which BAML function built the prompt."""
+    match = QUERY_PATTERN.search(prompt)
+    if match:
+        return json.dumps(search_character_payload(state, match.group("query")))
+    if "Character to bound" in prompt:
+        return json.dumps(suggest_outfit_payload())
+    if "color palette with hex codes" in prompt:
+        return json.dumps([color["hex"] for color in COLORS])
+    return json.dumps("Stub response")
+
+
+def tmdb_credits(state: StubState, movie_id: int) -> dict[str, Any]:
+    profile = state.tmdb.payload
+    names = state.cast_for(movie_id) if profile in ("match", "large") else []
+    cast = [
+        {
+            "id": _slug(name),
+            "name": f"Voice of {name}",
+            "character": name,
+            "profile_path": f"/stub/{_slug(name)}.jpg",
+        }
+        for name in names
+    ]
+    if profile in ("large", "no_match"):
+        filler = 200 if profile == "large" else 20
+        cast = [
+            {
+                "id": index,
+                "name": f"Actor {index}",
+                "character": f"Extra {index}",
+                "profile_path": f"/stub/extra-{index}.jpg",
+            }
+            for index in range(filler)
+        ] + cast
+    return {"id": movie_id, "cast": cast}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: "StubServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _fail(self, profile: ServiceProfile) -> bool:
+        profile.delay()
+        if profile.should_fail():
+            self._send_json(
+                profile.error_status, {"error": {"message": "Injected stub error"}}
+            )
+            return True
+        return False
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path = urlparse(self.path).path
+        if not GENERATE_PATTERN.match(path):
+            self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+            return
+
+        state = self.server.state
+        if self._fail(state.gemini):
+            return
+
+        request = json.loads(body or b"{}")
+        prompt = "\n".join(
+            part.get("text", "")
+            for content in request.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        self._send_json(
+            200,
+            {
+                "candidates": [
+                    {
+                        "content": {
+                            "role": "model",
+                            "parts": [{"text": gemini_text(state, prompt)}],
+                        },
+                        "finishReason": "STOP",
+                        "index": 0,
+                    }
+                ],
+                "usageMetadata": {
+                    "promptTokenCount": len(prompt) // 4,
+                    "candidatesTokenCount": 200,
+                    "totalTokenCount": len(prompt) // 4 + 200,
+                },
+            },
+        )
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        state = self.server.state
+
+        if url.path == "/tmdb/3/search/movie":
+            if self._fail(state.tmdb):
+                return
+            query = parse_qs(url.query).get("query", [""])[0]
+            results = []
+            if state.tmdb.payload != "no_results":
+                results = [{"id": StubState.movie_id(query), "title": query}]
+            self._send_json(200, {"page": 1, "results": results})
+            return
+
+        match = CREDITS_PATTERN.match(url.path)
+        if match:
+            if self._fail(state.tmdb):
+                return
+            self._send_json(200, tmdb_credits(state, int(match.group("movie_id"))))
+            return
+
+        self._send_json(404, {"status_message": f"Unknown path {url.path}"})
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], state: StubState):
+        super().__init__(address, StubHandler)
+        self.state = state
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    gemini: ServiceProfile | None = None,
+    tmdb: ServiceProfile | None = None,
+) -> StubServer:
+    """Start the stub server on a background thread and return it."""
+    state = StubState(
+        gemini or ServiceProfile(payload="found"),
+        tmdb or ServiceProfile(payload="match"),
+    )
+    server = StubServer((host, port), state)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Gemini/TMDB stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    for service, profiles, latency in (
+        ("gemini", GEMINI_PROFILES, 1500.0),
+        ("tmdb", TMDB_PROFILES, 150.0),
+    ):
+        parser.add_argument(f"--{service}-latency-ms", type=float, default=latency)
+        parser.add_argument(f"--{service}-jitter-ms", type=float, default=latency / 3)
+        parser.add_argument(f"--{service}-error-rate", type=float, default=0.0)
+        parser.add_argument(f"--{service}-error-status", type=int, default=503)
+        parser.add_argument(
+            f"--{service}-profile", choices=profiles, default=profiles[0]
+        )
+    args = parser.parse_args(argv)
+
+    def profile(service: str) -> ServiceProfile:
+        return ServiceProfile(
+            latency_ms=getattr(args, f"{service}_latency_ms"),
+            jitter_ms=getattr(args, f"{service}_jitter_ms"),
+            error_rate=getattr(args, f"{service}_error_rate"),
+            error_status=getattr(args, f"{service}_error_status"),
+            payload=getattr(args, f"{service}_profile"),
+        )
+
+    state = StubState(profile("gemini"), profile("tmdb"))
+    server = StubServer((args.host, args.port), state)
+    print(f"Stub server listening on http://{args.host}:{args.port}")
+    print(f"  GEMINI_BASE_URL=http://{args.host}:{args.port}/gemini/v1beta")
+    print(f"  TMDB_BASE_URL=http://{args.host}:{args.port}/tmdb/3")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()